@@ -370,6 +370,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(dst_dir_fd)
         STRUCT_FOR_ID(duration)
         STRUCT_FOR_ID(e)
+        STRUCT_FOR_ID(eager_start)
         STRUCT_FOR_ID(effective_ids)
         STRUCT_FOR_ID(element_factory)
         STRUCT_FOR_ID(encode)
@@ -459,6 +460,7 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(instructions)
         STRUCT_FOR_ID(intern)
         STRUCT_FOR_ID(intersection)
+        STRUCT_FOR_ID(is_running)
         STRUCT_FOR_ID(isatty)
         STRUCT_FOR_ID(isinstance)
         STRUCT_FOR_ID(isoformat)
@@ -503,10 +505,12 @@ struct _Py_global_strings {
         STRUCT_FOR_ID(loop)
         STRUCT_FOR_ID(mapping)
         STRUCT_FOR_ID(match)
+        STRUCT_FOR_ID(max_items)
         STRUCT_FOR_ID(max_length)
         STRUCT_FOR_ID(maxdigits)
         STRUCT_FOR_ID(maxevents)
         STRUCT_FOR_ID(maxmem)
+        STRUCT_FOR_ID(maxsize)
         STRUCT_FOR_ID(maxsplit)
         STRUCT_FOR_ID(maxvalue)
         STRUCT_FOR_ID(memLevel)
@@ -876,6 +876,7 @@ extern "C" {
     INIT_ID(dst_dir_fd), \
     INIT_ID(duration), \
     INIT_ID(e), \
+    INIT_ID(eager_start), \
     INIT_ID(effective_ids), \
     INIT_ID(element_factory), \
     INIT_ID(encode), \
@@ -965,6 +966,7 @@ extern "C" {
     INIT_ID(instructions), \
     INIT_ID(intern), \
     INIT_ID(intersection), \
+    INIT_ID(is_running), \
     INIT_ID(isatty), \
     INIT_ID(isinstance), \
     INIT_ID(isoformat), \
@@ -1009,10 +1011,12 @@ extern "C" {
     INIT_ID(loop), \
     INIT_ID(mapping), \
     INIT_ID(match), \
+    INIT_ID(max_items), \
     INIT_ID(max_length), \
     INIT_ID(maxdigits), \
     INIT_ID(maxevents), \
     INIT_ID(maxmem), \
+    INIT_ID(maxsize), \
     INIT_ID(maxsplit), \
     INIT_ID(maxvalue), \
     INIT_ID(memLevel), \
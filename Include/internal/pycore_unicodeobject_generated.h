@@ -646,6 +646,8 @@ _PyUnicode_InitStaticStrings(void) {
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(e);
     PyUnicode_InternInPlace(&string);
+    string = &_Py_ID(eager_start);
+    PyUnicode_InternInPlace(&string);
     string = &_Py_ID(effective_ids);
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(element_factory);
@@ -824,6 +826,8 @@ _PyUnicode_InitStaticStrings(void) {
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(intersection);
     PyUnicode_InternInPlace(&string);
+    string = &_Py_ID(is_running);
+    PyUnicode_InternInPlace(&string);
     string = &_Py_ID(isatty);
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(isinstance);
@@ -912,6 +916,8 @@ _PyUnicode_InitStaticStrings(void) {
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(match);
     PyUnicode_InternInPlace(&string);
+    string = &_Py_ID(max_items);
+    PyUnicode_InternInPlace(&string);
     string = &_Py_ID(max_length);
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(maxdigits);
@@ -920,6 +926,8 @@ _PyUnicode_InitStaticStrings(void) {
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(maxmem);
     PyUnicode_InternInPlace(&string);
+    string = &_Py_ID(maxsize);
+    PyUnicode_InternInPlace(&string);
     string = &_Py_ID(maxsplit);
     PyUnicode_InternInPlace(&string);
     string = &_Py_ID(maxvalue);
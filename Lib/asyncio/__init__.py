@@ -9,6 +9,7 @@
 from .coroutines import *
 from .events import *
 from .exceptions import *
+from .files import *
 from .futures import *
 from .locks import *
 from .protocols import *
@@ -26,6 +27,7 @@
            coroutines.__all__ +
            events.__all__ +
            exceptions.__all__ +
+           files.__all__ +
            futures.__all__ +
            locks.__all__ +
            protocols.__all__ +
@@ -13,12 +13,14 @@
 to modify the meaning of the API call itself.
 """
 
+import bisect
 import collections
 import collections.abc
 import concurrent.futures
 import functools
 import heapq
 import itertools
+import math
 import os
 import socket
 import stat
@@ -66,6 +68,10 @@
 # Maximum timeout passed to select to avoid OS limitations
 MAXIMUM_SELECT_TIMEOUT = 24 * 3600
 
+# Task implementations whose step callbacks are attributed to the task
+# in the loop stats.
+_TASK_TYPES = (tasks.Task, tasks._PyTask)
+
 
 def _format_handle(handle):
     cb = handle._callback
@@ -384,6 +390,261 @@ async def wait_closed(self):
         await waiter
 
 
+class _LoopStats:
+    """Counters collected by an event loop while stats are enabled."""
+
+    # Upper bounds (in seconds) of the handle run time histogram buckets;
+    # the last bucket collects everything slower.
+    HISTOGRAM_BOUNDS = (1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0)
+
+    def __init__(self):
+        self.iterations = 0
+        self.iteration_time = 0.0
+        self.max_iteration_time = 0.0
+        self.ready_total = 0
+        self.max_ready = 0
+        self.handles = 0
+        self.handle_time = 0.0
+        self.max_handle_time = 0.0
+        self.slow_handles = 0
+        self.histogram = [0] * (len(self.HISTOGRAM_BOUNDS) + 1)
+        self.timers = 0
+        self.timer_lag = 0.0
+        self.max_timer_lag = 0.0
+        self.task_cpu_time = weakref.WeakKeyDictionary()
+
+    def add_timer(self, lag):
+        self.timers += 1
+        self.timer_lag += lag
+        if lag > self.max_timer_lag:
+            self.max_timer_lag = lag
+
+    def add_iteration(self, ready, duration):
+        self.iterations += 1
+        self.ready_total += ready
+        if ready > self.max_ready:
+            self.max_ready = ready
+        self.iteration_time += duration
+        if duration > self.max_iteration_time:
+            self.max_iteration_time = duration
+
+    def add_handle(self, handle, duration, cpu_time, slow):
+        self.handles += 1
+        self.handle_time += duration
+        if duration > self.max_handle_time:
+            self.max_handle_time = duration
+        if slow:
+            self.slow_handles += 1
+        self.histogram[bisect.bisect_left(self.HISTOGRAM_BOUNDS,
+                                          duration)] += 1
+        # Task steps and wakeups are bound methods of the task.
+        task = getattr(handle._callback, '__self__', None)
+        if isinstance(task, _TASK_TYPES):
+            try:
+                self.task_cpu_time[task] += cpu_time
+            except KeyError:
+                self.task_cpu_time[task] = cpu_time
+
+    def snapshot(self):
+        bounds = self.HISTOGRAM_BOUNDS + (math.inf,)
+        return {
+            'iterations': self.iterations,
+            'iteration_time': self.iteration_time,
+            'max_iteration_time': self.max_iteration_time,
+            'mean_ready': (self.ready_total / self.iterations
+                           if self.iterations else 0.0),
+            'max_ready': self.max_ready,
+            'handles': self.handles,
+            'handle_time': self.handle_time,
+            'max_handle_time': self.max_handle_time,
+            'slow_handles': self.slow_handles,
+            'handle_time_histogram': list(zip(bounds, self.histogram)),
+            'timers': self.timers,
+            'mean_timer_lag': (self.timer_lag / self.timers
+                               if self.timers else 0.0),
+            'max_timer_lag': self.max_timer_lag,
+            'task_cpu_time': dict(self.task_cpu_time),
+        }
+
+
+class _TimerWheel:
+    """Hierarchical timing wheel storing TimerHandle instances.
+
+    Adding and cancelling a timer are O(1) operations, unlike the binary
+    heap used by default which needs O(log n) pushes and relies on lazy
+    removal of cancelled handles.  This pays off when many timers are
+    scheduled and then cancelled before they expire, which is the typical
+    life cycle of per-connection and per-request timeouts.
+
+    Time is divided in ticks of *resolution* seconds; a timer fires at the
+    first tick boundary that is not earlier than its deadline.  Level 0
+    holds the timers due within the current block of _SIZE ticks, level 1
+    the ones due within the current block of _SIZE ** 2 ticks, and so on;
+    timers further away are kept in an overflow bucket.  Whenever the
+    current tick enters a new block, the matching bucket of the level
+    above is redistributed ("cascaded") to the lower levels.
+    """
+
+    _BITS = 6
+    _SIZE = 1 << _BITS
+    _MASK = _SIZE - 1
+    _LEVELS = 4
+
+    def __init__(self, resolution, now):
+        if resolution <= 0:
+            raise ValueError('resolution must be a positive number')
+        self._resolution = resolution
+        # The last tick that has been processed.
+        self._tick = math.floor(now / resolution)
+        self._wheels = [[{} for _ in range(self._SIZE)]
+                        for _ in range(self._LEVELS)]
+        self._overflow = {}
+        self._expired = {}
+        # Map id(handle) to the bucket holding it.  Buckets are dicts
+        # keyed by id(handle) as well: TimerHandle defines __eq__ and
+        # __hash__ by value, so distinct handles may compare equal.
+        self._buckets = {}
+
+    def __len__(self):
+        return len(self._buckets)
+
+    @property
+    def resolution(self):
+        return self._resolution
+
+    def _to_tick(self, when):
+        try:
+            return math.ceil(when / self._resolution)
+        except (OverflowError, ValueError):
+            # Infinite or NaN deadline: keep it in the overflow bucket,
+            # it is never due (negative infinity is always due).
+            return -sys.maxsize if when < 0 else sys.maxsize
+
+    def _insert(self, handle, tick):
+        current = self._tick
+        if tick <= current:
+            bucket = self._expired
+        else:
+            bits = self._BITS
+            for level, wheel in enumerate(self._wheels):
+                shift = bits * level
+                # Use the lowest level in which the deadline falls in
+                # the current block of the level above it.
+                if tick >> (shift + bits) == current >> (shift + bits):
+                    bucket = wheel[(tick >> shift) & self._MASK]
+                    break
+            else:
+                bucket = self._overflow
+        key = id(handle)
+        bucket[key] = handle
+        self._buckets[key] = bucket
+
+    def add(self, handle):
+        """Add a TimerHandle."""
+        self._insert(handle, self._to_tick(handle._when))
+
+    def discard(self, handle):
+        """Remove a TimerHandle if it is present."""
+        key = id(handle)
+        bucket = self._buckets.pop(key, None)
+        if bucket is not None:
+            del bucket[key]
+
+    def _next_tick(self):
+        """Return the next tick at which a timer may become due.
+
+        Return None if the wheel holds no pending timers.
+        """
+        current = self._tick
+        bits = self._BITS
+        for level, wheel in enumerate(self._wheels):
+            shift = bits * level
+            for index in range(((current >> shift) & self._MASK) + 1,
+                               self._SIZE):
+                if wheel[index]:
+                    base = (current >> (shift + bits)) << (shift + bits)
+                    return base + (index << shift)
+        if self._overflow:
+            shift = bits * self._LEVELS
+            return ((current >> shift) + 1) << shift
+        return None
+
+    def _advance(self, tick):
+        """Make *tick* the current tick and process its buckets."""
+        self._tick = tick
+        bits = self._BITS
+        if not tick & ((1 << (bits * self._LEVELS)) - 1) and self._overflow:
+            overflow = self._overflow
+            self._overflow = {}
+            for handle in overflow.values():
+                self._insert(handle, self._to_tick(handle._when))
+        # Cascade from the highest level down, so that timers moved to a
+        # lower level are cascaded again in the same step if needed.
+        for level in range(self._LEVELS - 1, 0, -1):
+            shift = bits * level
+            if tick & ((1 << shift) - 1):
+                continue
+            bucket = self._wheels[level][(tick >> shift) & self._MASK]
+            if bucket:
+                handles = list(bucket.values())
+                bucket.clear()
+                for handle in handles:
+                    self._insert(handle, self._to_tick(handle._when))
+        bucket = self._wheels[0][tick & self._MASK]
+        if bucket:
+            self._expired.update(bucket)
+            self._buckets.update(dict.fromkeys(bucket, self._expired))
+            bucket.clear()
+
+    def next_deadline(self):
+        """Return the time at which the next timer may become due.
+
+        Return None if no timers are pending.  The returned time is never
+        later than the deadline of the earliest timer, but may be earlier.
+        """
+        if self._expired:
+            return self._tick * self._resolution
+        tick = self._next_tick()
+        if tick is None:
+            return None
+        return tick * self._resolution
+
+    def pop_due(self, end_time):
+        """Remove and return the timers due before *end_time*.
+
+        The returned list is sorted by deadline.
+        """
+        target = math.floor(end_time / self._resolution)
+        while self._tick < target:
+            tick = self._next_tick()
+            if tick is None or tick > target:
+                self._tick = target
+                break
+            self._advance(tick)
+        expired = self._expired
+        if not expired:
+            return []
+        self._expired = {}
+        buckets = self._buckets
+        for key in expired:
+            del buckets[key]
+        due = sorted(expired.values())
+        for handle in due:
+            handle._scheduled = False
+        return due
+
+    def pop_all(self):
+        """Remove and return all timers."""
+        handles = [bucket[key] for key, bucket in self._buckets.items()]
+        for wheel in self._wheels:
+            for bucket in wheel:
+                bucket.clear()
+        self._overflow.clear()
+        self._expired.clear()
+        self._buckets.clear()
+        return handles
+
+
 class BaseEventLoop(events.AbstractEventLoop):
 
     def __init__(self):
@@ -392,6 +653,8 @@ def __init__(self):
         self._stopping = False
         self._ready = collections.deque()
         self._scheduled = []
+        self._timer_wheel = None
+        self._stats = None
         self._default_executor = None
         self._internal_fds = 0
         # Identifier of the thread running the event loop, or None if the
@@ -688,6 +951,8 @@ def close(self):
         self._closed = True
         self._ready.clear()
         self._scheduled.clear()
+        if self._timer_wheel is not None:
+            self._timer_wheel.pop_all()
         self._executor_shutdown_called = True
         executor = self._default_executor
         if executor is not None:
@@ -755,10 +1020,52 @@ def call_at(self, when, callback, *args, context=None):
         timer = events.TimerHandle(when, callback, args, self, context)
         if timer._source_traceback:
             del timer._source_traceback[-1]
-        heapq.heappush(self._scheduled, timer)
+        if self._timer_wheel is not None:
+            self._timer_wheel.add(timer)
+        else:
+            heapq.heappush(self._scheduled, timer)
         timer._scheduled = True
         return timer
 
+    def set_timer_wheel(self, resolution):
+        """Select the data structure used to store delayed calls.
+
+        If resolution is None, delayed calls are kept in a binary heap,
+        which is the default.  Otherwise, a hierarchical timing wheel with
+        ticks of resolution seconds is used: scheduling and cancelling a
+        delayed call become O(1) operations, at the cost of running the
+        callbacks up to resolution seconds late.
+
+        Already scheduled calls are moved to the new data structure.
+        """
+        if resolution is not None and resolution <= 0:
+            raise ValueError('resolution must be a positive number or None')
+        if self._timer_wheel is not None:
+            handles = self._timer_wheel.pop_all()
+        else:
+            handles = []
+            for handle in self._scheduled:
+                if handle._cancelled:
+                    handle._scheduled = False
+                else:
+                    handles.append(handle)
+            self._timer_cancelled_count = 0
+        if resolution is None:
+            self._timer_wheel = None
+            heapq.heapify(handles)
+            self._scheduled = handles
+        else:
+            self._timer_wheel = _TimerWheel(resolution, self.time())
+            self._scheduled = []
+            for handle in handles:
+                self._timer_wheel.add(handle)
+
+    def get_timer_wheel(self):
+        """Return the timing wheel resolution, or None if not in use."""
+        if self._timer_wheel is None:
+            return None
+        return self._timer_wheel.resolution
+
     def call_soon(self, callback, *args, context=None):
         """Arrange for a callback to be called as soon as possible.
 
@@ -1869,7 +2176,11 @@ def _add_callback_signalsafe(self, handle):
     def _timer_handle_cancelled(self, handle):
         """Notification that a TimerHandle has been cancelled."""
         if handle._scheduled:
-            self._timer_cancelled_count += 1
+            if self._timer_wheel is not None:
+                self._timer_wheel.discard(handle)
+                handle._scheduled = False
+            else:
+                self._timer_cancelled_count += 1
 
     def _run_once(self):
         """Run one full iteration of the event loop.
@@ -1902,9 +2213,15 @@ def _run_once(self):
                 handle = heapq.heappop(self._scheduled)
                 handle._scheduled = False
 
+        timer_wheel = self._timer_wheel
         timeout = None
         if self._ready or self._stopping:
             timeout = 0
+        elif timer_wheel is not None:
+            when = timer_wheel.next_deadline()
+            if when is not None:
+                timeout = min(max(0, when - self.time()),
+                              MAXIMUM_SELECT_TIMEOUT)
         elif self._scheduled:
             # Compute the desired timeout.
             when = self._scheduled[0]._when
@@ -1916,13 +2233,23 @@ def _run_once(self):
         event_list = None
 
         # Handle 'later' callbacks that are ready.
-        end_time = self.time() + self._clock_resolution
+        now = self.time()
+        end_time = now + self._clock_resolution
+        stats = self._stats
+        if timer_wheel is not None:
+            due = timer_wheel.pop_due(end_time)
+            if stats is not None:
+                for handle in due:
+                    stats.add_timer(max(0, now - handle._when))
+            self._ready.extend(due)
         while self._scheduled:
             handle = self._scheduled[0]
             if handle._when >= end_time:
                 break
             handle = heapq.heappop(self._scheduled)
             handle._scheduled = False
+            if stats is not None:
+                stats.add_timer(max(0, now - handle._when))
             self._ready.append(handle)
 
         # This is the only place where callbacks are actually *called*.
@@ -1936,13 +2263,19 @@ def _run_once(self):
             handle = self._ready.popleft()
             if handle._cancelled:
                 continue
-            if self._debug:
+            if self._debug or stats is not None:
                 try:
                     self._current_handle = handle
+                    if stats is not None:
+                        c0 = time.thread_time()
                     t0 = self.time()
                     handle._run()
                     dt = self.time() - t0
-                    if dt >= self.slow_callback_duration:
+                    slow = dt >= self.slow_callback_duration
+                    if stats is not None:
+                        stats.add_handle(handle, dt,
+                                         time.thread_time() - c0, slow)
+                    if self._debug and slow:
                         logger.warning('Executing %s took %.3f seconds',
                                        _format_handle(handle), dt)
                 finally:
@@ -1950,6 +2283,8 @@ def _run_once(self):
             else:
                 handle._run()
         handle = None  # Needed to break cycles when an exception occurs.
+        if stats is not None:
+            stats.add_iteration(ntodo, self.time() - now)
 
     def _set_coroutine_origin_tracking(self, enabled):
         if bool(enabled) == bool(self._coroutine_origin_tracking_enabled):
@@ -1974,3 +2309,19 @@ def set_debug(self, enabled):
 
         if self.is_running():
             self.call_soon_threadsafe(self._set_coroutine_origin_tracking, enabled)
+
+    def set_stats_enabled(self, enabled):
+        """Enable or disable the collection of event loop statistics.
+
+        Enabling the statistics resets all counters.
+        """
+        self._stats = _LoopStats() if enabled else None
+
+    def get_stats(self):
+        """Return a dict with the statistics collected so far.
+
+        Return None if the collection of statistics is disabled.
+        """
+        if self._stats is None:
+            return None
+        return self._stats.snapshot()
@@ -0,0 +1,293 @@
+"""Asynchronous file I/O on a dedicated pool of worker threads."""
+
+__all__ = ('aopen', 'AsyncFile')
+
+import itertools
+import os
+import queue
+import threading
+
+from . import events
+from . import exceptions
+from . import tasks
+
+
+# Maximum number of operations run by a worker before their results are
+# passed back to the event loop(s) in a single callback.
+_MAX_BATCH = 64
+
+_pool = None
+_shutdown = False
+_registered_atexit = False
+# Must be held while creating the pool or starting worker threads.
+_pool_lock = threading.Lock()
+
+
+def _python_exit():
+    global _shutdown
+    with _pool_lock:
+        _shutdown = True
+        pool = _pool
+    if pool is not None:
+        pool.shutdown()
+
+
+def _after_fork_in_child():
+    # The worker threads don't exist in the child process: reset the workers
+    # of the pool, which the files opened before the fork keep using.
+    _pool_lock._at_fork_reinit()
+    if _pool is not None:
+        _pool._at_fork_reinit()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(before=_pool_lock.acquire,
+                        after_in_child=_after_fork_in_child,
+                        after_in_parent=_pool_lock.release)
+
+
+def _set_results(completions):
+    for fut, result, exc in completions:
+        if fut.cancelled():
+            continue
+        if exc is not None:
+            fut.set_exception(exc)
+        else:
+            fut.set_result(result)
+
+
+class _IOWorker:
+    """A thread running file operations in the order they are submitted.
+
+    The operations queued while the worker is busy are run as a batch, and
+    their results are set with one call_soon_threadsafe() call per event
+    loop instead of one per operation.
+    """
+
+    def __init__(self, name):
+        self._name = name
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+        self._shutdown = False
+
+    def submit(self, fut, func, args):
+        with _pool_lock:
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new file operations '
+                                   'after shutdown')
+            if _shutdown:
+                raise RuntimeError('cannot schedule new file operations '
+                                   'after interpreter shutdown')
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run,
+                                                name=self._name)
+                self._thread.start()
+            self._queue.put((fut, func, args))
+
+    def _at_fork_reinit(self):
+        # The operations queued before the fork were submitted by the
+        # parent process, they are not run in the child.
+        self._queue = queue.SimpleQueue()
+        self._thread = None
+
+    def stop(self):
+        with _pool_lock:
+            self._shutdown = True
+            thread = self._thread
+            if thread is not None:
+                self._queue.put(None)
+        if thread is not None:
+            thread.join()
+            self._thread = None
+
+    def _run(self):
+        get = self._queue.get
+        get_nowait = self._queue.get_nowait
+        while True:
+            items = [get()]
+            try:
+                while len(items) < _MAX_BATCH:
+                    items.append(get_nowait())
+            except queue.Empty:
+                pass
+            stop = False
+            completions = {}
+            for item in items:
+                if item is None:
+                    stop = True
+                    continue
+                fut, func, args = item
+                try:
+                    result = func(*args)
+                except BaseException as exc:
+                    completion = (fut, None, exc)
+                else:
+                    completion = (fut, result, None)
+                loop = fut.get_loop()
+                try:
+                    completions[loop].append(completion)
+                except KeyError:
+                    completions[loop] = [completion]
+            for loop, batch in completions.items():
+                try:
+                    loop.call_soon_threadsafe(_set_results, batch)
+                except RuntimeError:
+                    # The event loop is closed.
+                    pass
+            # Don't keep the results alive while waiting for new items.
+            items = item = completion = completions = None
+            if stop:
+                return
+
+
+class _IOPool:
+
+    def __init__(self, max_workers):
+        self._workers = [_IOWorker(f'asyncio-files-{i}')
+                         for i in range(max_workers)]
+        self._next_worker = itertools.cycle(self._workers)
+
+    def worker(self):
+        return next(self._next_worker)
+
+    def shutdown(self):
+        for worker in self._workers:
+            worker.stop()
+
+    def _at_fork_reinit(self):
+        for worker in self._workers:
+            worker._at_fork_reinit()
+
+
+def _get_pool():
+    global _pool, _registered_atexit
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                if _shutdown:
+                    raise RuntimeError('cannot schedule new file operations '
+                                       'after interpreter shutdown')
+                if not _registered_atexit:
+                    # Register for `_python_exit()` to be called just before
+                    # joining all non-daemon threads, like
+                    # concurrent.futures.thread does.  This is done here
+                    # rather than at import, which can happen in a thread
+                    # running after the main thread has finished.
+                    try:
+                        threading._register_atexit(_python_exit)
+                    except RuntimeError:
+                        raise RuntimeError('cannot schedule new file '
+                                           'operations after interpreter '
+                                           'shutdown') from None
+                    _registered_atexit = True
+                _pool = _IOPool(min(4, os.cpu_count() or 1))
+    return _pool
+
+
+class AsyncFile:
+    """A file object whose blocking methods run in a worker thread.
+
+    All the operations on the file run in the same worker thread, in the
+    order they were called, so they can be issued without waiting for the
+    previous ones to complete.
+    """
+
+    def __init__(self, file, *, _worker=None):
+        self._file = file
+        self._worker = _get_pool().worker() if _worker is None else _worker
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} {self._file!r}>'
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    @property
+    def raw(self):
+        """The underlying file object."""
+        return self._file
+
+    @property
+    def name(self):
+        return self._file.name
+
+    @property
+    def mode(self):
+        return self._file.mode
+
+    @property
+    def closed(self):
+        return self._file.closed
+
+    def fileno(self):
+        return self._file.fileno()
+
+    def _call(self, func, *args):
+        fut = events.get_running_loop().create_future()
+        self._worker.submit(fut, func, args)
+        return fut
+
+    def read(self, size=-1):
+        return self._call(self._file.read, size)
+
+    def readinto(self, buffer):
+        return self._call(self._file.readinto, buffer)
+
+    def readline(self, size=-1):
+        return self._call(self._file.readline, size)
+
+    def write(self, data):
+        return self._call(self._file.write, data)
+
+    def writelines(self, lines):
+        return self._call(self._file.writelines, lines)
+
+    def seek(self, offset, whence=os.SEEK_SET):
+        return self._call(self._file.seek, offset, whence)
+
+    def tell(self):
+        return self._call(self._file.tell)
+
+    def truncate(self, size=None):
+        return self._call(self._file.truncate, size)
+
+    def flush(self):
+        return self._call(self._file.flush)
+
+    def close(self):
+        return self._call(self._file.close)
+
+    async def sendfile(self, transport, offset=0, count=None, *,
+                       fallback=True):
+        """Send the file to a transport, see loop.sendfile()."""
+        loop = events.get_running_loop()
+        # Let the operations issued before complete.
+        await self._call(self._file.flush)
+        return await loop.sendfile(transport, self._file, offset, count,
+                                   fallback=fallback)
+
+
+async def aopen(file, mode='r', buffering=-1, encoding=None, errors=None,
+                newline=None, closefd=True, opener=None):
+    """Open a file and return an AsyncFile.
+
+    The arguments have the same meaning as for the built-in open().
+    """
+    worker = _get_pool().worker()
+    loop = events.get_running_loop()
+    fut = loop.create_future()
+    worker.submit(fut, open, (file, mode, buffering, encoding, errors,
+                              newline, closefd, opener))
+    try:
+        file = await tasks.shield(fut)
+    except exceptions.CancelledError:
+        def close_file(fut):
+            if not fut.cancelled() and fut.exception() is None:
+                file = fut.result()
+                worker.submit(loop.create_future(), file.close, ())
+        fut.add_done_callback(close_file)
+        raise
+    return AsyncFile(file, _worker=worker)
@@ -0,0 +1,607 @@
+"""HTTP/1.1 client with keep-alive connection pooling."""
+
+__all__ = ('HTTPClient', 'HTTPClientResponse')
+
+import collections
+import http.client
+import io
+import urllib.parse
+
+from . import events
+from . import exceptions
+from . import streams
+
+
+_DEFAULT_PORTS = {'http': 80, 'https': 443}
+
+# Only requests which can safely be replayed are pipelined or retried.
+_IDEMPOTENT_METHODS = frozenset({'GET', 'HEAD', 'OPTIONS', 'TRACE'})
+
+_READ_SIZE = 64 * 1024
+
+
+def _merge_headers(*sources):
+    # Header names are case-insensitive: a header replaces the headers of
+    # the previous sources with the same name, whatever its case.
+    merged = {}
+    for source in sources:
+        if source:
+            for name, value in dict(source).items():
+                merged[name.lower()] = (name, value)
+    return dict(merged.values())
+
+
+class _Connection:
+    """A pooled connection and the state of its in-flight requests."""
+
+    def __init__(self, key, reader, writer):
+        self.key = key
+        self.reader = reader
+        self.writer = writer
+        # Number of requests sent whose response was not fully read.
+        self.in_flight = 0
+        # True while a request which must not be pipelined is in flight.
+        self.exclusive = False
+        self.reusable = True
+        self.requests = 0
+        self.idle_since = None
+        # Future completed once the response to the last request sent on
+        # this connection has been read: pipelined responses must be read
+        # in the order of the requests.
+        self.last_turn = None
+
+    def close(self):
+        self.reusable = False
+        self.writer.close()
+
+
+class _HostPool:
+
+    def __init__(self):
+        self.connections = set()
+        # Idle connections, the most recently used last.
+        self.idle = []
+        self.opening = 0
+        # Futures.
+        self.waiters = collections.deque()
+
+
+class HTTPClient:
+    """An HTTP/1.1 client keeping connections alive between requests.
+
+    Connections are pooled per (scheme, host, port), up to
+    max_connections_per_host of them; further requests wait for a
+    connection to be released.  If max_pipelined is greater than 1,
+    idempotent requests without a body may be pipelined, up to
+    max_pipelined of them in flight on one connection.  Idle connections
+    are closed after keepalive_timeout seconds.
+    """
+
+    def __init__(self, *, max_connections_per_host=10, max_pipelined=1,
+                 keepalive_timeout=15.0, ssl=None, headers=None):
+        if max_connections_per_host < 1:
+            raise ValueError('max_connections_per_host must be at least 1')
+        if max_pipelined < 1:
+            raise ValueError('max_pipelined must be at least 1')
+        self._max_connections_per_host = max_connections_per_host
+        self._max_pipelined = max_pipelined
+        self._keepalive_timeout = keepalive_timeout
+        self._ssl = ssl
+        self._headers = dict(headers) if headers else {}
+        self._pools = {}
+        self._closed = False
+
+    def __repr__(self):
+        info = [self.__class__.__name__]
+        if self._closed:
+            info.append('closed')
+        connections = sum(len(pool.connections)
+                          for pool in self._pools.values())
+        info.append(f'connections={connections}')
+        return '<{}>'.format(' '.join(info))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def close(self):
+        """Close all the connections of the pool.
+
+        Responses which are being read fail and pending requests are
+        cancelled.
+        """
+        if self._closed:
+            return
+        self._closed = True
+        writers = []
+        for pool in self._pools.values():
+            for conn in pool.connections:
+                conn.close()
+                writers.append(conn.writer)
+            while pool.waiters:
+                waiter = pool.waiters.popleft()
+                if not waiter.done():
+                    waiter.cancel()
+        self._pools.clear()
+        for writer in writers:
+            try:
+                await writer.wait_closed()
+            except (ConnectionError, OSError):
+                pass
+
+    async def request(self, method, url, *, headers=None, body=None):
+        """Send a request and return an HTTPClientResponse.
+
+        The response status line and headers have been read when the
+        coroutine returns; the body must be read or the response closed to
+        release the connection.
+
+        body may be a bytes-like object, or an iterable or an asynchronous
+        iterable of bytes-like objects.  Unless a Content-Length header is
+        given, an iterable body is sent with the chunked transfer encoding.
+        """
+        method = method.upper()
+        if http.client._contains_disallowed_method_pchar_re.search(method):
+            raise ValueError(f'method can\'t contain control characters. '
+                             f'{method!r}')
+        key, target, host_header = self._split_url(url)
+        request_headers = _merge_headers({'Host': host_header,
+                                          'Accept-Encoding': 'identity'},
+                                         self._headers, headers)
+
+        replayable = (body is None
+                      or isinstance(body, (bytes, bytearray, memoryview)))
+        pipeline = body is None and method in _IDEMPOTENT_METHODS
+        while True:
+            conn = await self._acquire(key, pipeline)
+            # The request was counted by _acquire().
+            reused = conn.requests > 1
+            response = HTTPClientResponse(self, conn, method, url)
+            try:
+                await self._send_request(conn, response, method, target,
+                                         request_headers, body)
+                await response._start()
+            except (http.client.RemoteDisconnected, ConnectionResetError,
+                    BrokenPipeError):
+                response._abort()
+                # The server may close an idle keep-alive connection
+                # at any time: replay the request on a new connection.
+                if (reused and replayable and method in _IDEMPOTENT_METHODS
+                        and not response._status_received):
+                    continue
+                raise
+            except BaseException:
+                response._abort()
+                raise
+            return response
+
+    def _split_url(self, url):
+        parts = urllib.parse.urlsplit(url)
+        scheme = parts.scheme.lower()
+        if scheme not in _DEFAULT_PORTS:
+            raise ValueError(f'unsupported URL scheme: {parts.scheme!r}')
+        host = parts.hostname
+        if not host:
+            raise http.client.InvalidURL(f'no host in URL: {url!r}')
+        try:
+            port = parts.port
+        except ValueError:
+            raise http.client.InvalidURL(f'invalid port in URL: {url!r}')
+        default_port = _DEFAULT_PORTS[scheme]
+        if port is None:
+            port = default_port
+        target = parts.path or '/'
+        if parts.query:
+            target += '?' + parts.query
+        if http.client._contains_disallowed_url_pchar_re.search(target):
+            raise http.client.InvalidURL(f'URL can\'t contain control '
+                                         f'characters. {target!r}')
+        host_header = f'[{host}]' if ':' in host else host
+        if port != default_port:
+            host_header += f':{port}'
+        return (scheme, host, port), target, host_header
+
+    async def _acquire(self, key, pipeline):
+        loop = events.get_running_loop()
+        while True:
+            if self._closed:
+                raise RuntimeError('HTTPClient is closed')
+            pool = self._pools.get(key)
+            if pool is None:
+                pool = self._pools[key] = _HostPool()
+
+            while pool.idle:
+                conn = pool.idle.pop()
+                if (conn.reader.at_eof()
+                        or conn.reader.exception() is not None
+                        or loop.time() - conn.idle_since
+                            > self._keepalive_timeout):
+                    self._discard(pool, conn)
+                    continue
+                return self._reserve(conn, pipeline)
+
+            if len(pool.connections) + pool.opening \
+                    < self._max_connections_per_host:
+                return self._reserve(await self._connect(key, pool),
+                                     pipeline)
+
+            if pipeline and self._max_pipelined > 1:
+                candidates = [conn for conn in pool.connections
+                              if conn.reusable and not conn.exclusive
+                              and conn.in_flight < self._max_pipelined]
+                if candidates:
+                    conn = min(candidates, key=lambda c: c.in_flight)
+                    return self._reserve(conn, pipeline)
+
+            waiter = loop.create_future()
+            pool.waiters.append(waiter)
+            try:
+                await waiter
+            except:
+                waiter.cancel()  # Just in case waiter is not done yet.
+                try:
+                    pool.waiters.remove(waiter)
+                except ValueError:
+                    pass
+                if not waiter.cancelled():
+                    # We were woken up but can't take the connection.
+                    self._wakeup_next(pool)
+                raise
+
+    async def _connect(self, key, pool):
+        scheme, host, port = key
+        ssl = None
+        if scheme == 'https':
+            ssl = True if self._ssl is None else self._ssl
+        pool.opening += 1
+        try:
+            reader, writer = await streams.open_connection(
+                host, port, ssl=ssl, limit=http.client._MAXLINE + 2)
+        except BaseException:
+            self._wakeup_next(pool)
+            raise
+        finally:
+            pool.opening -= 1
+        conn = _Connection(key, reader, writer)
+        if self._closed or self._pools.get(key) is not pool:
+            conn.close()
+            raise RuntimeError('HTTPClient is closed')
+        pool.connections.add(conn)
+        return conn
+
+    def _reserve(self, conn, pipeline):
+        conn.in_flight += 1
+        conn.requests += 1
+        if not pipeline:
+            conn.exclusive = True
+        return conn
+
+    def _release(self, conn, reusable):
+        # Called once per request, when its response has been read or
+        # abandoned.
+        pool = self._pools.get(conn.key)
+        conn.in_flight -= 1
+        if not reusable:
+            conn.reusable = False
+        if pool is None:
+            conn.close()
+            return
+        if not conn.reusable:
+            self._discard(pool, conn)
+        elif conn.in_flight == 0:
+            conn.exclusive = False
+            conn.idle_since = events.get_running_loop().time()
+            pool.idle.append(conn)
+        self._wakeup_next(pool)
+
+    def _discard(self, pool, conn):
+        conn.close()
+        pool.connections.discard(conn)
+        try:
+            pool.idle.remove(conn)
+        except ValueError:
+            pass
+
+    def _wakeup_next(self, pool):
+        while pool.waiters:
+            waiter = pool.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _send_request(self, conn, response, method, target, headers,
+                            body):
+        headers = dict(headers)
+        names = {name.lower() for name in headers}
+        chunked = False
+        if body is None:
+            if method in ('POST', 'PUT', 'PATCH') \
+                    and 'content-length' not in names:
+                headers['Content-Length'] = '0'
+        elif isinstance(body, (bytes, bytearray, memoryview)):
+            if 'content-length' not in names:
+                headers['Content-Length'] = str(memoryview(body).nbytes)
+        elif 'content-length' not in names \
+                and 'transfer-encoding' not in names:
+            headers['Transfer-Encoding'] = 'chunked'
+            chunked = True
+
+        lines = [f'{method} {target} HTTP/1.1'.encode('ascii')]
+        for name, value in headers.items():
+            if hasattr(name, 'encode'):
+                name = name.encode('ascii')
+            if not http.client._is_legal_header_name(name):
+                raise ValueError(f'Invalid header name {name!r}')
+            if hasattr(value, 'encode'):
+                value = value.encode('latin-1')
+            elif isinstance(value, int):
+                value = str(value).encode('ascii')
+            if http.client._is_illegal_header_value(value):
+                raise ValueError(f'Invalid header value {value!r}')
+            lines.append(name + b': ' + value)
+        lines.append(b'\r\n')
+
+        writer = conn.writer
+        # Reserve the turn to read the response in the same step as the
+        # request is written, so that pipelined responses are read in the
+        # order of the requests.
+        response._prev_turn = conn.last_turn
+        response._turn = conn.last_turn = \
+            events.get_running_loop().create_future()
+        if isinstance(body, (bytes, bytearray, memoryview)):
+            writer.writelines([b'\r\n'.join(lines), body])
+            await writer.drain()
+            return
+        writer.write(b'\r\n'.join(lines))
+        await writer.drain()
+        if body is None:
+            return
+        if hasattr(body, '__aiter__'):
+            async for chunk in body:
+                await self._write_body_chunk(writer, chunk, chunked)
+        else:
+            for chunk in body:
+                await self._write_body_chunk(writer, chunk, chunked)
+        if chunked:
+            writer.write(b'0\r\n\r\n')
+            await writer.drain()
+
+    async def _write_body_chunk(self, writer, chunk, chunked):
+        if not chunk:
+            # An empty chunk would terminate a chunked body.
+            return
+        if chunked:
+            writer.writelines([b'%X\r\n' % len(chunk), chunk, b'\r\n'])
+        else:
+            writer.write(chunk)
+        await writer.drain()
+
+
+class HTTPClientResponse:
+    """The response to a request sent by HTTPClient.request().
+
+    The body can be read with read() or by iterating over the response
+    asynchronously.  The connection is released once the body has been
+    read completely; close() releases it without reading the body,
+    closing the connection.
+    """
+
+    def __init__(self, client, conn, method, url):
+        self._client = client
+        self._conn = conn
+        self._method = method
+        self.url = url
+        self.version = None
+        self.status = None
+        self.reason = None
+        self.headers = None
+        self._prev_turn = None
+        self._turn = None
+        self._status_received = False
+        self._done = False
+        self._will_close = False
+        self._chunked = False
+        self._chunk_left = None
+        self._length = None
+
+    def __repr__(self):
+        info = [self.__class__.__name__, self._method, self.url]
+        if self.status is not None:
+            info.append(f'status={self.status}')
+        if self._done:
+            info.append('done')
+        return '<{}>'.format(' '.join(info))
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        self.close()
+
+    async def __aiter__(self):
+        while chunk := await self._read_some(_READ_SIZE):
+            yield chunk
+
+    async def _readline(self, what):
+        try:
+            return await self._conn.reader.readuntil(b'\n')
+        except exceptions.LimitOverrunError:
+            raise http.client.LineTooLong(what) from None
+        except exceptions.IncompleteReadError as exc:
+            if not self._status_received and not exc.partial:
+                # Presumably, the server closed the connection before
+                # sending a valid response.
+                raise http.client.RemoteDisconnected(
+                    'Remote end closed connection without response')
+            raise http.client.IncompleteRead(exc.partial) from None
+
+    async def _read_header_lines(self):
+        lines = []
+        while True:
+            line = await self._readline('header line')
+            if line in (b'\r\n', b'\n'):
+                return lines
+            lines.append(line)
+            if len(lines) > http.client._MAXHEADERS:
+                raise http.client.HTTPException(
+                    f'got more than {http.client._MAXHEADERS} headers')
+
+    async def _read_status(self):
+        line = await self._readline('status line')
+        self._status_received = True
+        line = line.decode('iso-8859-1')
+        try:
+            version, status, reason = line.split(None, 2)
+        except ValueError:
+            try:
+                version, status = line.split(None, 1)
+                reason = ''
+            except ValueError:
+                version = ''
+        if not version.startswith('HTTP/'):
+            raise http.client.BadStatusLine(line)
+        try:
+            status = int(status)
+        except ValueError:
+            raise http.client.BadStatusLine(line) from None
+        if status < 100 or status > 999:
+            raise http.client.BadStatusLine(line)
+        return version, status, reason
+
+    async def _start(self):
+        if self._prev_turn is not None:
+            await self._prev_turn
+        while True:
+            version, status, reason = await self._read_status()
+            if status != http.client.CONTINUE:
+                break
+            # Skip the headers of the 100 response.
+            await self._read_header_lines()
+
+        self.status = status
+        self.reason = reason.strip()
+        if version in ('HTTP/1.0', 'HTTP/0.9'):
+            self.version = 10
+        elif version.startswith('HTTP/1.'):
+            self.version = 11
+        else:
+            raise http.client.UnknownProtocol(version)
+
+        lines = await self._read_header_lines()
+        lines.append(b'\r\n')
+        self.headers = http.client.parse_headers(io.BytesIO(b''.join(lines)))
+
+        tr_enc = self.headers.get('transfer-encoding')
+        self._chunked = bool(tr_enc) and tr_enc.lower() == 'chunked'
+        self._will_close = self._check_close()
+        length = self.headers.get('content-length')
+        if length and not self._chunked:
+            try:
+                self._length = int(length)
+            except ValueError:
+                self._length = None
+            else:
+                if self._length < 0:
+                    self._length = None
+        if (status in (http.client.NO_CONTENT, http.client.NOT_MODIFIED)
+                or 100 <= status < 200 or self._method == 'HEAD'):
+            self._chunked = False
+            self._length = 0
+        if not self._chunked and self._length is None:
+            # The body extends until the server closes the connection.
+            self._will_close = True
+        if self._length == 0:
+            self._finish()
+
+    def _check_close(self):
+        conn = self.headers.get('connection')
+        if self.version == 11:
+            return bool(conn) and 'close' in conn.lower()
+        if self.headers.get('keep-alive'):
+            return False
+        if conn and 'keep-alive' in conn.lower():
+            return False
+        return True
+
+    async def read(self, n=-1):
+        """Read up to n bytes of the body.
+
+        If n is not provided or set to -1, read the rest of the body.
+        Return an empty bytes object once the body has been read.
+        """
+        if n >= 0:
+            return await self._read_some(n) if n else b''
+        chunks = []
+        while chunk := await self._read_some(_READ_SIZE):
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    async def _read_some(self, n):
+        if self._done:
+            return b''
+        try:
+            if self._chunked:
+                return await self._read_chunked(n)
+            reader = self._conn.reader
+            if self._length is None:
+                data = await reader.read(n)
+                if not data:
+                    self._finish()
+                return data
+            data = await reader.read(min(n, self._length))
+            if not data:
+                raise http.client.IncompleteRead(b'', self._length)
+            self._length -= len(data)
+            if not self._length:
+                self._finish()
+            return data
+        except BaseException:
+            self._abort()
+            raise
+
+    async def _read_chunked(self, n):
+        reader = self._conn.reader
+        if not self._chunk_left:
+            line = await self._readline('chunk size')
+            try:
+                self._chunk_left = int(line.split(b';', 1)[0], 16)
+            except ValueError:
+                raise http.client.IncompleteRead(b'') from None
+            if self._chunk_left == 0:
+                # Skip the trailers.
+                await self._read_header_lines()
+                self._finish()
+                return b''
+        data = await reader.read(min(n, self._chunk_left))
+        if not data:
+            raise http.client.IncompleteRead(b'', self._chunk_left)
+        self._chunk_left -= len(data)
+        if not self._chunk_left:
+            # Skip the CRLF which terminates the chunk.
+            await self._readline('chunk size')
+        return data
+
+    def _finish(self):
+        if self._done:
+            return
+        self._done = True
+        if not self._turn.done():
+            self._turn.set_result(None)
+        self._client._release(self._conn, not self._will_close)
+
+    def _abort(self):
+        if self._done:
+            return
+        self._done = True
+        if self._turn is not None and not self._turn.done():
+            self._turn.set_result(None)
+        self._client._release(self._conn, False)
+
+    def close(self):
+        """Release the connection.
+
+        If the body was not read completely, the connection is closed.
+        """
+        self._abort()
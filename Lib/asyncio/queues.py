@@ -63,6 +63,14 @@ def _wakeup_next(self, waiters):
                 waiter.set_result(None)
                 break
 
+    def _wakeup_many(self, waiters, count):
+        # Wake up the next count waiters (if any) that aren't cancelled.
+        while waiters and count > 0:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                count -= 1
+
     def __repr__(self):
         return f'<{type(self).__name__} at {id(self):#x} {self._format()}>'
 
@@ -146,6 +154,35 @@ def put_nowait(self, item):
         self._finished.clear()
         self._wakeup_next(self._getters)
 
+    async def put_many(self, items):
+        """Put all items of an iterable into the queue, in order.
+
+        Items are added in batches, as many as there are free slots, waking
+        up the waiting getters once per batch.  If the queue is full, wait
+        until a free slot is available before adding the next batch.  If
+        put_many() is cancelled, the items added so far stay in the queue.
+        """
+        items = list(items)
+        start = self._put_batch(items, 0)
+        while start < len(items):
+            await self.put(items[start])
+            start = self._put_batch(items, start + 1)
+
+    def _put_batch(self, items, start):
+        # Put items[start:] into the queue, as many as there are free slots,
+        # and return the index of the first item which was not added.
+        end = len(items)
+        if self._maxsize > 0:
+            end = min(end, start + max(0, self._maxsize - self.qsize()))
+        for i in range(start, end):
+            self._put(items[i])
+        count = end - start
+        if count:
+            self._unfinished_tasks += count
+            self._finished.clear()
+            self._wakeup_many(self._getters, count)
+        return end
+
     async def get(self):
         """Remove and return an item from the queue.
 
@@ -183,6 +220,43 @@ def get_nowait(self):
         self._wakeup_next(self._putters)
         return item
 
+    async def get_many(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        If queue is empty, wait until an item is available.  Then return all
+        the items available in the queue, or at most max_items of them if
+        max_items is not None.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            items = [await self.get()]
+            if max_items is not None:
+                max_items -= 1
+            if self.empty() or max_items == 0:
+                return items
+            items.extend(self.get_nowait_batch(max_items))
+            return items
+        return self.get_nowait_batch(max_items)
+
+    def get_nowait_batch(self, max_items=None):
+        """Remove and return a list of items from the queue.
+
+        Return all the items immediately available, or at most max_items of
+        them if max_items is not None.  Raise QueueEmpty if no item is
+        available.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if self.empty():
+            raise QueueEmpty
+        count = self.qsize()
+        if max_items is not None:
+            count = min(count, max_items)
+        items = [self._get() for _ in range(count)]
+        self._wakeup_many(self._putters, count)
+        return items
+
     def task_done(self):
         """Indicate that a formerly enqueued task is complete.
 
@@ -1172,10 +1172,30 @@ def writelines(self, list_of_data):
             raise RuntimeError('Cannot call writelines() after write_eof()')
         if self._empty_waiter is not None:
             raise RuntimeError('unable to writelines; sendfile is in progress')
-        if not list_of_data:
+        buffers = [memoryview(data) for data in list_of_data if data]
+        if not buffers:
             return
-        self._buffer.extend([memoryview(data) for data in list_of_data])
+
+        if self._conn_lost:
+            if self._conn_lost >= constants.LOG_THRESHOLD_FOR_CONNLOST_WRITES:
+                logger.warning('socket.send() raised exception.')
+            self._conn_lost += 1
+            return
+
+        was_empty = not self._buffer
+        # Queue all buffers and let a single sendmsg() call (or as few
+        # send() calls as possible) write them out without joining.
+        self._buffer.extend(buffers)
+        if not was_empty:
+            # A write handler is already registered.
+            self._maybe_pause_protocol()
+            return
+
         self._write_ready()
+        # If the entire buffer couldn't be written, register a write handler.
+        if self._buffer:
+            self._loop._add_writer(self._sock_fd, self._write_ready)
+            self._maybe_pause_protocol()
 
     def can_write_eof(self):
         return True
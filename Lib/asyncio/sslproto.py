@@ -258,6 +258,9 @@ def _test__append_write_backlog(self, data):
 
 class SSLProtocol(protocols.BufferedProtocol):
     max_size = 256 * 1024   # Buffer size passed to read()
+    # Maximum size of the plaintext of a TLS record: smaller writes are
+    # coalesced up to this size before being encrypted.
+    record_size = 16 * 1024
 
     _handshake_start_time = None
     _handshake_timeout_handle = None
@@ -304,6 +307,9 @@ def __init__(self, loop, app_protocol, sslcontext, waiter,
         # App data write buffering
         self._write_backlog = collections.deque()
         self._write_buffer_size = 0
+        # Scratch buffer used to coalesce small writes, allocated on demand.
+        self._record_buffer = None
+        self._write_flush_handle = None
 
         self._waiter = waiter
         self._loop = loop
@@ -392,6 +398,9 @@ def connection_lost(self, exc):
         """
         self._write_backlog.clear()
         self._outgoing.read()
+        if self._write_flush_handle is not None:
+            self._write_flush_handle.cancel()
+            self._write_flush_handle = None
         self._conn_lost += 1
 
         # Just mark the app transport as closed so that its __dealloc__
@@ -462,6 +471,7 @@ def eof_received(self):
             elif self._state == SSLProtocolState.WRAPPED:
                 self._set_state(SSLProtocolState.FLUSHING)
                 if self._app_reading_paused:
+                    self._flush_write_backlog()
                     return True
                 else:
                     self._do_flush()
@@ -634,6 +644,10 @@ def _check_shutdown_timeout(self):
 
     def _do_flush(self):
         self._do_read()
+        # _do_read() doesn't write while reading is paused: send the small
+        # writes which are waiting for the end of the loop iteration now,
+        # they are dropped once the state is SHUTDOWN.
+        self._flush_write_backlog()
         self._set_state(SSLProtocolState.SHUTDOWN)
         self._do_shutdown()
 
@@ -686,27 +700,74 @@ def _write_appdata(self, list_of_data):
 
         try:
             if self._state == SSLProtocolState.WRAPPED:
-                self._do_write()
+                if self._write_buffer_size >= self.record_size:
+                    self._do_write()
+                else:
+                    # Wait for the end of the loop iteration so that the
+                    # small writes done meanwhile are sent as one record.
+                    if self._write_flush_handle is None:
+                        self._write_flush_handle = self._loop.call_soon(
+                            self._flush_write_backlog)
+                    self._control_app_writing()
 
         except Exception as ex:
             self._fatal_error(ex, 'Fatal error on SSL protocol')
 
+    def _flush_write_backlog(self):
+        if self._write_flush_handle is not None:
+            self._write_flush_handle.cancel()
+            self._write_flush_handle = None
+        try:
+            if (
+                self._state in (
+                    SSLProtocolState.WRAPPED,
+                    SSLProtocolState.FLUSHING
+                ) and self._write_backlog
+            ):
+                self._do_write()
+        except Exception as ex:
+            self._fatal_error(ex, 'Fatal error on SSL protocol')
+
     def _do_write(self):
+        backlog = self._write_backlog
         try:
-            while self._write_backlog:
-                data = self._write_backlog[0]
+            while backlog:
+                data = backlog[0]
+                if len(backlog) > 1 and len(data) < self.record_size:
+                    data = self._coalesce_write_backlog()
                 count = self._sslobj.write(data)
-                data_len = len(data)
-                if count < data_len:
-                    self._write_backlog[0] = data[count:]
-                    self._write_buffer_size -= count
-                else:
-                    del self._write_backlog[0]
-                    self._write_buffer_size -= data_len
+                # Remove the data which was written from the backlog.
+                self._write_buffer_size -= count
+                while backlog:
+                    data_len = len(backlog[0])
+                    if count < data_len:
+                        if count:
+                            backlog[0] = backlog[0][count:]
+                        break
+                    count -= data_len
+                    backlog.popleft()
         except SSLAgainErrors:
             pass
         self._process_outgoing()
 
+    def _coalesce_write_backlog(self):
+        # Copy the first items of the backlog to the record buffer.  They
+        # are removed from the backlog once they have been written, so this
+        # returns the same data if the write has to be retried.
+        buf = self._record_buffer
+        if buf is None:
+            buf = self._record_buffer = memoryview(
+                bytearray(self.record_size))
+        size = 0
+        for data in self._write_backlog:
+            with memoryview(data) as view, view.cast('B') as view:
+                n = min(len(view), self.record_size - size)
+                buf[size:size + n] = view[:n]
+            size += n
+            if size == self.record_size:
+                break
+        return buf[:size]
+
     def _process_outgoing(self):
         if not self._ssl_writing_paused:
             data = self._outgoing.read()
@@ -768,31 +829,36 @@ def _do_read__buffered(self):
             self._start_shutdown()
 
     def _do_read__copied(self):
-        chunk = b'1'
-        zero = True
-        one = False
+        # Decrypt into the receive buffer, whose content was already passed
+        # to the incoming BIO, rather than allocating max_size bytes for
+        # each record.  The data is copied out when the buffer is full or
+        # once the BIO is drained.
+        buf = self._ssl_buffer_view
+        size = len(buf)
+        offset = 0
+        count = 1
+        chunks = None
 
         try:
             while True:
-                chunk = self._sslobj.read(self.max_size)
-                if not chunk:
+                count = self._sslobj.read(size - offset, buf[offset:])
+                if not count:
                     break
-                if zero:
-                    zero = False
-                    one = True
-                    first = chunk
-                elif one:
-                    one = False
-                    data = [first, chunk]
-                else:
-                    data.append(chunk)
+                offset += count
+                if offset == size:
+                    if chunks is None:
+                        chunks = []
+                    chunks.append(bytes(buf))
+                    offset = 0
         except SSLAgainErrors:
             pass
-        if one:
-            self._app_protocol.data_received(first)
-        elif not zero:
-            self._app_protocol.data_received(b''.join(data))
-        if not chunk:
+        if chunks is not None:
+            if offset:
+                chunks.append(bytes(buf[:offset]))
+            self._app_protocol.data_received(b''.join(chunks))
+        elif offset:
+            self._app_protocol.data_received(bytes(buf[:offset]))
+        if not count:
             # close_notify
             self._call_eof_received()
             self._start_shutdown()
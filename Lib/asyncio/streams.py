@@ -576,6 +576,59 @@ async def readuntil(self, separator=b'\n'):
         will be left in the internal buffer, so it can be read again.
         """
         seplen = len(separator)
+        isep = await self._wait_for_separator(separator, 'readuntil')
+        chunk = self._buffer[:isep + seplen]
+        del self._buffer[:isep + seplen]
+        self._maybe_resume_transport()
+        return bytes(chunk)
+
+    async def readuntil_many(self, separator=b'\n', max_items=None):
+        """Read all complete chunks terminated by ``separator``.
+
+        Wait until at least one ``separator`` is found, then return a list
+        of every complete chunk currently available in the internal buffer
+        (at most ``max_items`` of them, if given).  Each returned chunk
+        includes the separator at the end.  The consumed data is removed
+        from the internal buffer in one step, which is much cheaper than
+        calling readuntil() once per chunk.
+
+        Configured stream limit is checked for every chunk in the same way
+        as in readuntil().  A chunk exceeding the limit is never returned
+        together with other chunks: it is left in the internal buffer and
+        the LimitOverrunError is raised by the next call.
+
+        IncompleteReadError and LimitOverrunError are raised under the same
+        conditions as in readuntil() when not even one chunk can be read.
+        """
+        if max_items is not None and max_items <= 0:
+            raise ValueError('max_items must be a positive integer or None')
+
+        seplen = len(separator)
+        isep = await self._wait_for_separator(separator, 'readuntil_many')
+
+        buf = self._buffer
+        chunks = []
+        start = 0
+        with memoryview(buf) as view:
+            while True:
+                end = isep + seplen
+                chunks.append(bytes(view[start:end]))
+                start = end
+                if max_items is not None and len(chunks) >= max_items:
+                    break
+                isep = buf.find(separator, start)
+                if isep == -1 or isep - start > self._limit:
+                    break
+        del buf[:start]
+        self._maybe_resume_transport()
+        return chunks
+
+    async def _wait_for_separator(self, separator, func_name):
+        """Wait until ``separator`` is found in the internal buffer.
+
+        Return the offset of the first occurrence of ``separator``.
+        """
+        seplen = len(separator)
         if seplen == 0:
             raise ValueError('Separator should be at least one-byte string')
 
@@ -635,16 +688,13 @@ async def readuntil(self, separator=b'\n'):
                 raise exceptions.IncompleteReadError(chunk, None)
 
             # _wait_for_data() will resume reading if stream was paused.
-            await self._wait_for_data('readuntil')
+            await self._wait_for_data(func_name)
 
         if isep > self._limit:
             raise exceptions.LimitOverrunError(
                 'Separator is found, but chunk is longer than limit', isep)
 
-        chunk = self._buffer[:isep + seplen]
-        del self._buffer[:isep + seplen]
-        self._maybe_resume_transport()
-        return bytes(chunk)
+        return isep
 
     async def read(self, n=-1):
         """Read up to `n` bytes from the stream.
@@ -697,6 +747,36 @@ async def read(self, n=-1):
         self._maybe_resume_transport()
         return data
 
+    async def readinto(self, buffer):
+        """Read bytes from the stream into a pre-allocated, writable buffer.
+
+        Wait until at least 1 byte is available in the internal buffer,
+        then copy at most ``len(buffer)`` bytes into `buffer` and return
+        the number of bytes copied.  No intermediate bytes object is
+        created.  If EOF was received and the internal buffer is empty,
+        return 0.
+
+        If stream was paused, this function will automatically resume it if
+        needed.
+        """
+        if self._exception is not None:
+            raise self._exception
+
+        with memoryview(buffer) as view, view.cast('B') as dest:
+            n = len(dest)
+            if n == 0:
+                return 0
+
+            if not self._buffer and not self._eof:
+                await self._wait_for_data('readinto')
+
+            n = min(n, len(self._buffer))
+            dest[:n] = memoryview(self._buffer)[:n]
+        del self._buffer[:n]
+
+        self._maybe_resume_transport()
+        return n
+
     async def readexactly(self, n):
         """Read exactly `n` bytes.
 
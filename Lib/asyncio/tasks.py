@@ -6,6 +6,7 @@
     'wait', 'wait_for', 'as_completed', 'sleep',
     'gather', 'shield', 'ensure_future', 'run_coroutine_threadsafe',
     'current_task', 'all_tasks',
+    'create_eager_task_factory', 'eager_task_factory',
     '_register_task', '_unregister_task', '_enter_task', '_leave_task',
 )
 
@@ -44,6 +45,10 @@ def all_tasks(loop=None):
     """Return a set of all tasks for the loop."""
     if loop is None:
         loop = events.get_running_loop()
+    # Capture the set of eager tasks first, so that if an eager task
+    # "graduates" to a regular task in another thread, we don't risk
+    # missing it.
+    eager_tasks = list(_eager_tasks)
     # Looping over a WeakSet (_all_tasks) isn't safe as it can be updated from another
     # thread while we do so. Therefore we cast it to list prior to filtering. The list
     # cast itself requires iteration, so we repeat it several times ignoring
@@ -59,7 +64,7 @@ def all_tasks(loop=None):
                 raise
         else:
             break
-    return {t for t in tasks
+    return {t for t in itertools.chain(tasks, eager_tasks)
             if futures._get_loop(t) is loop and not t.done()}
 
 
@@ -94,7 +99,8 @@ class Task(futures._PyFuture):  # Inherit Python Task implementation
     # status is still pending
     _log_destroy_pending = True
 
-    def __init__(self, coro, *, loop=None, name=None, context=None):
+    def __init__(self, coro, *, loop=None, name=None, context=None,
+                 eager_start=False):
         super().__init__(loop=loop)
         if self._source_traceback:
             del self._source_traceback[-1]
@@ -118,8 +124,11 @@ def __init__(self, coro, *, loop=None, name=None, context=None):
         else:
             self._context = context
 
-        self._loop.call_soon(self.__step, context=self._context)
-        _register_task(self)
+        if eager_start and self._loop.is_running():
+            self.__eager_start()
+        else:
+            self._loop.call_soon(self.__step, context=self._context)
+            _register_task(self)
 
     def __del__(self):
         if self._state == futures._PENDING and self._log_destroy_pending:
@@ -251,6 +260,25 @@ def uncancel(self):
             self._num_cancels_requested -= 1
         return self._num_cancels_requested
 
+    def __eager_start(self):
+        prev_task = _swap_current_task(self._loop, self)
+        try:
+            _register_eager_task(self)
+            try:
+                self._context.run(self.__step_run_and_handle_result, None)
+            finally:
+                _unregister_eager_task(self)
+        finally:
+            try:
+                curtask = _swap_current_task(self._loop, prev_task)
+                assert curtask is self
+            finally:
+                if self.done():
+                    self._coro = None
+                    self = None  # Needed to break cycles when an exception occurs.
+                else:
+                    _register_task(self)
+
     def __step(self, exc=None):
         if self.done():
             raise exceptions.InvalidStateError(
@@ -259,10 +287,17 @@ def __step(self, exc=None):
             if not isinstance(exc, exceptions.CancelledError):
                 exc = self._make_cancelled_error()
             self._must_cancel = False
-        coro = self._coro
         self._fut_waiter = None
 
         _enter_task(self._loop, self)
+        try:
+            self.__step_run_and_handle_result(exc)
+        finally:
+            _leave_task(self._loop, self)
+            self = None  # Needed to break cycles when an exception occurs.
+
+    def __step_run_and_handle_result(self, exc):
+        coro = self._coro
         # Call either coro.throw(exc) or coro.send(None).
         try:
             if exc is None:
@@ -335,7 +370,6 @@ def __step(self, exc=None):
                 self._loop.call_soon(
                     self.__step, new_exc, context=self._context)
         finally:
-            _leave_task(self._loop, self)
             self = None  # Needed to break cycles when an exception occurs.
 
     def __wakeup(self, future):
@@ -367,6 +401,35 @@ def __wakeup(self, future):
     Task = _CTask = _asyncio.Task
 
 
+def create_eager_task_factory(custom_task_constructor):
+    """Create a function suitable for use as a task factory on an event-loop.
+
+    Example usage:
+
+        loop.set_task_factory(
+            asyncio.create_eager_task_factory(my_task_constructor))
+
+    Now, tasks created will be started immediately (rather than being first
+    scheduled to an event loop). The constructor argument can be any callable
+    that returns a Task-compatible object and has a signature compatible
+    with `Task.__init__`; it must have the `eager_start` keyword argument.
+
+    Most applications will use `Task` for `custom_task_constructor` and in
+    this case there's no need to call `create_eager_task_factory()`
+    directly. Instead the  global `eager_task_factory` instance can be
+    used. E.g. `loop.set_task_factory(asyncio.eager_task_factory)`.
+    """
+
+    def factory(loop, coro, *, name=None, context=None):
+        return custom_task_constructor(
+            coro, loop=loop, name=name, context=context, eager_start=True)
+
+    return factory
+
+
+eager_task_factory = create_eager_task_factory(Task)
+
+
 def create_task(coro, *, name=None, context=None):
     """Schedule the execution of a coroutine object in a spawn task.
 
@@ -792,6 +855,7 @@ def _done_callback(fut):
 
     arg_to_fut = {}
     children = []
+    done_futs = []
     nfuts = 0
     nfinished = 0
     loop = None
@@ -810,7 +874,10 @@ def _done_callback(fut):
 
             nfuts += 1
             arg_to_fut[arg] = fut
-            fut.add_done_callback(_done_callback)
+            if fut.done():
+                done_futs.append(fut)
+            else:
+                fut.add_done_callback(_done_callback)
 
         else:
             # There's a duplicate Future object in coros_or_futures.
@@ -819,6 +886,12 @@ def _done_callback(fut):
         children.append(fut)
 
     outer = _GatheringFuture(children, loop=loop)
+    # Run done callbacks after _GatheringFuture is created, so that they
+    # can set its result.  If *all* futures completed eagerly, this
+    # completes the gather eagerly as well, with the last callback
+    # setting the result (or exception) of outer before it is returned.
+    for fut in done_futs:
+        _done_callback(fut)
     return outer
 
 
@@ -914,16 +987,25 @@ def callback():
 # WeakSet containing all alive tasks.
 _all_tasks = weakref.WeakSet()
 
+# Set of tasks which are running their first step eagerly.  They are
+# added to _all_tasks only if they don't complete in that step.
+_eager_tasks = set()
+
 # Dictionary containing tasks that are currently active in
 # all running event loops.  {EventLoop: Task}
 _current_tasks = {}
 
 
 def _register_task(task):
-    """Register a new task in asyncio as executed by loop."""
+    """Register an asyncio Task scheduled to run on an event loop."""
     _all_tasks.add(task)
 
 
+def _register_eager_task(task):
+    """Register an asyncio Task about to be eagerly executed."""
+    _eager_tasks.add(task)
+
+
 def _enter_task(loop, task):
     current_task = _current_tasks.get(loop)
     if current_task is not None:
@@ -940,22 +1022,40 @@ def _leave_task(loop, task):
     del _current_tasks[loop]
 
 
+def _swap_current_task(loop, task):
+    prev_task = _current_tasks.get(loop)
+    if task is None:
+        _current_tasks.pop(loop, None)
+    else:
+        _current_tasks[loop] = task
+    return prev_task
+
+
 def _unregister_task(task):
-    """Unregister a task."""
+    """Unregister a completed, scheduled Task."""
     _all_tasks.discard(task)
 
 
+def _unregister_eager_task(task):
+    """Unregister a task which finished its first eager step."""
+    _eager_tasks.discard(task)
+
+
 _py_current_task = current_task
 _py_register_task = _register_task
 _py_unregister_task = _unregister_task
 _py_enter_task = _enter_task
 _py_leave_task = _leave_task
+_py_swap_current_task = _swap_current_task
+_py_register_eager_task = _register_eager_task
+_py_unregister_eager_task = _unregister_eager_task
 
 
 try:
     from _asyncio import (_register_task, _unregister_task,
-                          _enter_task, _leave_task,
-                          _all_tasks, _current_tasks,
+                          _register_eager_task, _unregister_eager_task,
+                          _enter_task, _leave_task, _swap_current_task,
+                          _all_tasks, _current_tasks, _eager_tasks,
                           current_task)
 except ImportError:
     pass
@@ -965,3 +1065,6 @@ def _unregister_task(task):
     _c_unregister_task = _unregister_task
     _c_enter_task = _enter_task
     _c_leave_task = _leave_task
+    _c_swap_current_task = _swap_current_task
+    _c_register_eager_task = _register_eager_task
+    _c_unregister_eager_task = _unregister_eager_task
@@ -30,6 +30,7 @@
     'as_completed',
     'ProcessPoolExecutor',
     'ThreadPoolExecutor',
+    'WorkStealingThreadPoolExecutor',
 )
 
 
@@ -38,7 +39,7 @@ def __dir__():
 
 
 def __getattr__(name):
-    global ProcessPoolExecutor, ThreadPoolExecutor
+    global ProcessPoolExecutor, ThreadPoolExecutor, WorkStealingThreadPoolExecutor
 
     if name == 'ProcessPoolExecutor':
         from .process import ProcessPoolExecutor as pe
@@ -50,4 +51,9 @@ def __getattr__(name):
         ThreadPoolExecutor = te
         return te
 
+    if name == 'WorkStealingThreadPoolExecutor':
+        from .thread import WorkStealingThreadPoolExecutor as wte
+        WorkStealingThreadPoolExecutor = wte
+        return wte
+
     raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
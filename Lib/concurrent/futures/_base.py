@@ -4,10 +4,13 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 import collections
+import itertools
 import logging
+import queue
 import threading
 import time
 import types
+import weakref
 
 FIRST_COMPLETED = 'FIRST_COMPLETED'
 FIRST_EXCEPTION = 'FIRST_EXCEPTION'
@@ -322,6 +325,22 @@ def _result_or_cancel(fut, timeout=None):
         del fut
 
 
+def _pop_completed(done, fs, timeout=None):
+    # Wait for the next future of fs to complete and return its result.
+    if timeout is not None:
+        timeout = max(timeout, 0)
+    try:
+        fut = done.get(timeout=timeout)
+    except queue.Empty:
+        raise TimeoutError from None
+    fs.remove(fut)
+    try:
+        return fut.result()
+    finally:
+        # Break a reference cycle with the exception in self._exception
+        del fut
+
+
 class Future(object):
     """Represents the result of an asynchronous computation."""
 
@@ -580,7 +599,19 @@ def submit(self, fn, /, *args, **kwargs):
         """
         raise NotImplementedError()
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def submit_many(self, fn, /, *iterables):
+        """Submits fn(*args) for each args of zip(*iterables).
+
+        Equivalent to [submit(fn, *args) for args in zip(*iterables)], but
+        executors may schedule the calls more efficiently as a batch.
+
+        Returns:
+            A list of Futures representing the given calls.
+        """
+        return [self.submit(fn, *args) for args in zip(*iterables)]
+
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -592,6 +623,13 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before being passed to a child process. This argument is only
                 used by ProcessPoolExecutor; it is ignored by
                 ThreadPoolExecutor.
+            buffersize: The maximum number of calls submitted to the executor
+                and not yet retrieved from the iterator. If None, then all the
+                calls are submitted immediately; otherwise the iterables are
+                consumed lazily, as results are retrieved.
+            ordered: If False, then the results are returned in the order in
+                which the calls complete rather than in the order of the
+                iterables.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -602,25 +640,72 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if buffersize is not None and buffersize < 1:
+            raise ValueError("buffersize must be None or >= 1.")
+
         if timeout is not None:
             end_time = timeout + time.monotonic()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        args_iter = zip(*iterables)
+        if buffersize is not None:
+            initial = itertools.islice(args_iter, buffersize)
+        else:
+            initial = args_iter
+        # The result iterator must not keep the executor alive, so that it
+        # can still be shut down when it is garbage collected.
+        executor_ref = weakref.ref(self)
+
+        if not ordered:
+            done = queue.SimpleQueue()
+            fs = set()
+            def submit(executor, args):
+                future = executor.submit(fn, *args)
+                fs.add(future)
+                future.add_done_callback(done.put)
+            for args in initial:
+                submit(self, args)
+
+            def unordered_result_iterator():
+                try:
+                    while fs:
+                        if (buffersize is not None
+                                and (executor := executor_ref()) is not None):
+                            for args in itertools.islice(
+                                    args_iter, buffersize - len(fs)):
+                                submit(executor, args)
+                            del executor
+                        if timeout is None:
+                            yield _pop_completed(done, fs)
+                        else:
+                            yield _pop_completed(done, fs,
+                                                 end_time - time.monotonic())
+                finally:
+                    for future in fs:
+                        future.cancel()
+            return unordered_result_iterator()
+
+        fs = collections.deque(self.submit(fn, *args) for args in initial)
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
         def result_iterator():
             try:
-                # reverse to keep finishing order
-                fs.reverse()
                 while fs:
+                    if (buffersize is not None
+                            and (executor := executor_ref()) is not None):
+                        for args in itertools.islice(
+                                args_iter, buffersize - len(fs)):
+                            fs.append(executor.submit(fn, *args))
+                        del executor
                     # Careful not to keep a reference to the popped future
                     if timeout is None:
-                        yield _result_or_cancel(fs.pop())
+                        yield _result_or_cancel(fs.popleft())
                     else:
-                        yield _result_or_cancel(fs.pop(), end_time - time.monotonic())
+                        yield _result_or_cancel(fs.popleft(),
+                                                end_time - time.monotonic())
             finally:
-                for future in fs:
+                # cancel the last futures first to keep finishing order
+                for future in reversed(fs):
                     future.cancel()
         return result_iterator()
 
@@ -45,17 +45,21 @@
 
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
+import io
 import os
 from concurrent.futures import _base
 import queue
 import multiprocessing as mp
 import multiprocessing.connection
 from multiprocessing.queues import Queue
+from multiprocessing.reduction import ForkingPickler
 import threading
 import weakref
 from functools import partial
 import itertools
+import pickle
 import sys
+import time
 from traceback import format_exception
 
 
@@ -113,6 +117,12 @@ def _python_exit():
 # - the thread wakeup reader
 _MAX_WINDOWS_WORKERS = 63 - 2
 
+# With chunksize=None, map() sizes the chunks so that each one runs for about
+# this many seconds in a worker, which amortizes the IPC cost of a task while
+# keeping the work balanced between the workers.
+_CHUNK_DURATION = 0.02
+_MAX_CHUNKSIZE = 1 << 16
+
 # Hack to embed stringification of remote traceback in local traceback
 
 class _RemoteTraceback(Exception):
@@ -136,6 +146,98 @@ def _rebuild_exc(exc, tb):
     exc.__cause__ = _RemoteTraceback(tb)
     return exc
 
+# Pickling a _SharedMemoryPayload looks for bytes objects up to this depth of
+# nested tuples, lists and dicts, e.g. args -> map() chunk -> call arguments.
+_SHARED_MEMORY_BYTES_DEPTH = 3
+
+class _SharedBytes:
+    # Pickles a bytes or bytearray object as an out-of-band buffer, which the
+    # pickle module never does for bytes.
+    def __init__(self, data):
+        self.data = data
+    def __reduce_ex__(self, protocol):
+        return _rebuild_shared_bytes, (type(self.data),
+                                       pickle.PickleBuffer(self.data))
+
+def _rebuild_shared_bytes(cls, buf):
+    # buf is the bytearray copied out of the shared memory segment.
+    return buf if cls is bytearray else cls(buf)
+
+def _share_bytes(obj, threshold, depth=_SHARED_MEMORY_BYTES_DEPTH):
+    cls = type(obj)
+    if cls is bytes or cls is bytearray:
+        return _SharedBytes(obj) if len(obj) >= threshold else obj
+    if depth:
+        depth -= 1
+        if cls is tuple or cls is list:
+            return cls([_share_bytes(x, threshold, depth) for x in obj])
+        if cls is dict:
+            return {k: _share_bytes(v, threshold, depth)
+                    for k, v in obj.items()}
+    return obj
+
+class _SharedMemoryPayload:
+    """Pickles an object with its large buffers in shared memory.
+
+    The buffers of at least *threshold* bytes are pickled out-of-band with
+    pickle protocol 5 and copied to SharedMemory segments, so that only the
+    names of the segments go through the pipe.  The process unpickling the
+    payload copies the buffers out of the segments and unlinks them.  The
+    segments are registered with the resource tracker, which unlinks them if
+    the payload is never unpickled.
+    """
+    def __init__(self, obj, threshold):
+        self.obj = obj
+        self.threshold = threshold
+
+    def __reduce__(self):
+        from multiprocessing import shared_memory
+        segments = []
+
+        def buffer_callback(buf):
+            try:
+                view = buf.raw()
+            except BufferError:
+                # Not contiguous, pickle it in-band.
+                return True
+            with view:
+                if view.nbytes < self.threshold:
+                    return True
+                shm = shared_memory.SharedMemory(create=True,
+                                                 size=view.nbytes)
+                segments.append((shm, view.nbytes))
+                shm.buf[:view.nbytes] = view
+            return False
+
+        file = io.BytesIO()
+        try:
+            ForkingPickler(file, 5, buffer_callback=buffer_callback).dump(
+                _share_bytes(self.obj, self.threshold))
+        except BaseException:
+            for shm, _ in segments:
+                shm.close()
+                shm.unlink()
+            raise
+        for shm, _ in segments:
+            # The segment outlives this mapping until the receiver unlinks it.
+            shm.close()
+        return (_rebuild_shared_memory_payload,
+                (file.getvalue(),
+                 [(shm.name, size) for shm, size in segments]))
+
+def _rebuild_shared_memory_payload(data, segments):
+    from multiprocessing import shared_memory
+    buffers = []
+    for name, size in segments:
+        shm = shared_memory.SharedMemory(name)
+        try:
+            with shm.buf[:size] as view:
+                buffers.append(bytearray(view))
+        finally:
+            shm.close()
+            shm.unlink()
+    return pickle.loads(data, buffers=buffers)
+
 class _WorkItem(object):
     def __init__(self, future, fn, args, kwargs):
         self.future = future
@@ -205,6 +307,59 @@ def _process_chunk(fn, chunk):
     return [fn(*args) for args in chunk]
 
 
+class _ChunkSizer:
+    """ Tunes the chunksize of map() from the measured duration of the calls.
+
+    The chunksize starts at 1 and at most doubles for every chunk whose
+    duration is reported, so that a few slow calls don't end up batched
+    into one oversized chunk.
+    """
+    def __init__(self, duration=_CHUNK_DURATION, max_chunksize=_MAX_CHUNKSIZE):
+        self.chunksize = 1
+        self._duration = duration
+        self._max_chunksize = max_chunksize
+        self._call_duration = None
+
+    def update(self, ncalls, elapsed):
+        call_duration = elapsed / ncalls
+        if self._call_duration is None:
+            self._call_duration = call_duration
+        else:
+            # Smooth out the noise of the measurements.
+            self._call_duration = (0.75 * self._call_duration
+                                   + 0.25 * call_duration)
+        if self._call_duration > 0:
+            chunksize = int(self._duration / self._call_duration)
+        else:
+            chunksize = self._max_chunksize
+        self.chunksize = max(1, min(chunksize, 2 * self.chunksize,
+                                    self._max_chunksize))
+
+
+def _get_sized_chunks(*iterables, sizer):
+    """ Iterates over zip()ed iterables in chunks of sizer.chunksize. """
+    it = zip(*iterables)
+    while True:
+        chunk = tuple(itertools.islice(it, sizer.chunksize))
+        if not chunk:
+            return
+        yield chunk
+
+
+def _process_timed_chunk(fn, chunk):
+    """ Processes a chunk of an iterable passed to map.
+
+    Like _process_chunk(), but also returns the time it took to process the
+    chunk, for _ChunkSizer.
+
+    This function is run in a separate process.
+
+    """
+    start = time.perf_counter()
+    results = [fn(*args) for args in chunk]
+    return time.perf_counter() - start, results
+
+
 def _sendback_result(result_queue, work_id, result=None, exception=None,
                      exit_pid=None):
     """Safely send back the given result or exception"""
@@ -217,7 +372,8 @@ def _sendback_result(result_queue, work_id, result=None, exception=None,
                                      exit_pid=exit_pid))
 
 
-def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None):
+def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=None,
+                    shared_memory_threshold=None):
     """Evaluates calls from call_queue and places the results in result_queue.
 
     This worker is run in a separate process.
@@ -229,6 +385,9 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             to by the worker.
         initializer: A callable initializer, or None
         initargs: A tuple of args for the initializer
+        max_tasks: The maximum number of calls to evaluate, or None
+        shared_memory_threshold: The minimum size of the result buffers sent
+            through shared memory, or None to pickle the results in-band
     """
     if initializer is not None:
         try:
@@ -259,6 +418,8 @@ def _process_worker(call_queue, result_queue, initializer, initargs, max_tasks=N
             _sendback_result(result_queue, call_item.work_id, exception=exc,
                              exit_pid=exit_pid)
         else:
+            if shared_memory_threshold is not None:
+                r = _SharedMemoryPayload(r, shared_memory_threshold)
             _sendback_result(result_queue, call_item.work_id, result=r,
                              exit_pid=exit_pid)
             del r
@@ -600,6 +761,18 @@ def _chain_from_iterable_of_lists(iterable):
             yield element.pop()
 
 
+def _chain_from_timed_chunks(iterable, sizer):
+    """
+    Like _chain_from_iterable_of_lists(), for the results of
+    _process_timed_chunk().  Reports the duration of each chunk to *sizer*.
+    """
+    for elapsed, element in iterable:
+        sizer.update(len(element), elapsed)
+        element.reverse()
+        while element:
+            yield element.pop()
+
+
 class BrokenProcessPool(_base.BrokenExecutor):
     """
     Raised when a process in a ProcessPoolExecutor terminated abruptly
@@ -609,7 +782,8 @@ class BrokenProcessPool(_base.BrokenExecutor):
 
 class ProcessPoolExecutor(_base.Executor):
     def __init__(self, max_workers=None, mp_context=None,
-                 initializer=None, initargs=(), *, max_tasks_per_child=None):
+                 initializer=None, initargs=(), *, max_tasks_per_child=None,
+                 shared_memory_threshold=None):
         """Initializes a new ProcessPoolExecutor instance.
 
         Args:
@@ -627,6 +801,10 @@ def __init__(self, max_workers=None, mp_context=None,
                 live as long as the executor. Requires a non-'fork' mp_context
                 start method. When given, we default to using 'spawn' if no
                 mp_context is supplied.
+            shared_memory_threshold: If not None, the buffers of at least
+                this many bytes in the arguments and results of the calls are
+                passed through shared memory instead of the pipes connecting
+                to the worker processes.
         """
         _check_system_limits()
 
@@ -673,6 +851,25 @@ def __init__(self, max_workers=None, mp_context=None,
                                  " supply a different mp_context.")
         self._max_tasks_per_child = max_tasks_per_child
 
+        if shared_memory_threshold is not None:
+            if not isinstance(shared_memory_threshold, int):
+                raise TypeError("shared_memory_threshold must be an integer")
+            elif shared_memory_threshold <= 0:
+                raise ValueError("shared_memory_threshold must be >= 1")
+            if sys.platform == 'win32':
+                # A segment is destroyed when its last handle is closed,
+                # which may happen before the receiving process opened it.
+                raise ValueError("shared_memory_threshold is not supported "
+                                 "on Windows")
+            # Fail early if shared memory is not available.
+            from multiprocessing import resource_tracker, shared_memory
+            # Start the resource tracker before the workers, so that they
+            # share it with this process even with the 'fork' start method:
+            # the segments are registered by the process creating them and
+            # unregistered by the one unlinking them.
+            resource_tracker.ensure_running()
+        self._shared_memory_threshold = shared_memory_threshold
+
         # Management thread
         self._executor_manager_thread = None
 
@@ -755,7 +952,8 @@ def _spawn_process(self):
                   self._result_queue,
                   self._initializer,
                   self._initargs,
-                  self._max_tasks_per_child))
+                  self._max_tasks_per_child,
+                  self._shared_memory_threshold))
         p.start()
         self._processes[p.pid] = p
 
@@ -770,6 +968,13 @@ def submit(self, fn, /, *args, **kwargs):
                                    'interpreter shutdown')
 
             f = _base.Future()
+            if self._shared_memory_threshold is not None:
+                # The buffers are moved to shared memory when the call item
+                # is pickled by the call queue.
+                args = _SharedMemoryPayload(args, self._shared_memory_threshold)
+                if kwargs:
+                    kwargs = _SharedMemoryPayload(kwargs,
+                                                  self._shared_memory_threshold)
             w = _WorkItem(f, fn, args, kwargs)
 
             self._pending_work_items[self._queue_count] = w
@@ -784,7 +989,8 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
-    def map(self, fn, *iterables, timeout=None, chunksize=1):
+    def map(self, fn, *iterables, timeout=None, chunksize=1, buffersize=None,
+            ordered=True):
         """Returns an iterator equivalent to map(fn, iter).
 
         Args:
@@ -795,6 +1001,16 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
             chunksize: If greater than one, the iterables will be chopped into
                 chunks of size chunksize and submitted to the process pool.
                 If set to one, the items in the list will be sent one at a time.
+                If None, the size of the chunks is adjusted from the measured
+                duration of the calls.
+            buffersize: The maximum number of chunks submitted to the process
+                pool and not yet retrieved from the iterator. If None, then
+                all the chunks are submitted immediately, unless chunksize is
+                None, in which case it defaults to twice the number of
+                workers.
+            ordered: If False, then the results of the chunks are returned in
+                the order in which they complete rather than in the order of
+                the iterables.
 
         Returns:
             An iterator equivalent to: map(func, *iterables) but the calls may
@@ -805,12 +1021,24 @@ def map(self, fn, *iterables, timeout=None, chunksize=1):
                 before the given timeout.
             Exception: If fn(*args) raises for any values.
         """
+        if chunksize is None:
+            # The chunks must be created lazily for their size to adapt.
+            if buffersize is None:
+                buffersize = 2 * self._max_workers
+            sizer = _ChunkSizer()
+            results = super().map(partial(_process_timed_chunk, fn),
+                                  _get_sized_chunks(*iterables, sizer=sizer),
+                                  timeout=timeout, buffersize=buffersize,
+                                  ordered=ordered)
+            return _chain_from_timed_chunks(results, sizer)
+
         if chunksize < 1:
             raise ValueError("chunksize must be >= 1.")
 
         results = super().map(partial(_process_chunk, fn),
                               _get_chunks(*iterables, chunksize=chunksize),
-                              timeout=timeout)
+                              timeout=timeout, buffersize=buffersize,
+                              ordered=ordered)
         return _chain_from_iterable_of_lists(results)
 
     def shutdown(self, wait=True, *, cancel_futures=False):
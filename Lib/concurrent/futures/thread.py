@@ -6,6 +6,7 @@
 __author__ = 'Brian Quinlan (brian@sweetapp.com)'
 
 from concurrent.futures import _base
+import collections
 import itertools
 import queue
 import threading
@@ -177,6 +178,30 @@ def submit(self, fn, /, *args, **kwargs):
             return f
     submit.__doc__ = _base.Executor.submit.__doc__
 
+    def submit_many(self, fn, /, *iterables):
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+
+            fs = []
+            put = self._work_queue.put
+            for args in zip(*iterables):
+                f = _base.Future()
+                put(_WorkItem(f, fn, args, {}))
+                fs.append(f)
+
+            # Each call wakes up an idle thread or starts a new one.
+            for _ in range(min(len(fs), self._max_workers)):
+                self._adjust_thread_count()
+            return fs
+    submit_many.__doc__ = _base.Executor.submit_many.__doc__
+
     def _adjust_thread_count(self):
         # if idle threads are available, don't spin new threads
         if self._idle_semaphore.acquire(timeout=0):
@@ -234,3 +259,314 @@ def shutdown(self, wait=True, *, cancel_futures=False):
             for t in self._threads:
                 t.join()
     shutdown.__doc__ = _base.Executor.shutdown.__doc__
+
+
+# The _StealingWorker of the current thread, if it is a worker thread of a
+# WorkStealingThreadPoolExecutor.
+_current_worker = threading.local()
+
+
+class _StealingWorker(object):
+    """A worker thread of a WorkStealingThreadPoolExecutor and its queue.
+
+    The owner runs the items of its queue in FIFO order.  Once its queue is
+    empty, it steals the most recently queued item of the other workers, and
+    only sleeps when all the queues are empty.
+    """
+
+    def __init__(self, workers, idle):
+        self.items = collections.deque()
+        # The live workers and the sleeping workers of the executor.
+        self.workers = workers
+        self.idle = idle
+        # Held while the worker isn't sleeping.  The thread which removes a
+        # sleeping worker from self.idle must release it.
+        self.wakeup = threading.Lock()
+        self.wakeup.acquire()
+
+    def get(self):
+        try:
+            return self.items.popleft()
+        except IndexError:
+            pass
+        # Iterate over a copy: workers are started and retire concurrently.
+        for worker in list(self.workers):
+            if worker.items:
+                try:
+                    return worker.items.pop()
+                except IndexError:
+                    pass
+        return None
+
+    def has_work(self):
+        return any(worker.items for worker in list(self.workers))
+
+    def leave_idle(self):
+        """Remove the worker from the sleeping workers.
+
+        If another thread removed it first, wait until it releases
+        self.wakeup.
+        """
+        try:
+            self.idle.remove(self)
+        except ValueError:
+            self.wakeup.acquire()
+
+    def put(self, item):
+        # Called with None by _python_exit(), like for work queues.
+        _wake_all(self.idle)
+
+
+def _wake_one(idle):
+    try:
+        worker = idle.popleft()
+    except IndexError:
+        return
+    worker.wakeup.release()
+
+
+def _wake_all(idle):
+    while True:
+        try:
+            worker = idle.popleft()
+        except IndexError:
+            return
+        worker.wakeup.release()
+
+
+def _stealing_worker(executor_reference, worker, initializer, initargs):
+    if initializer is not None:
+        try:
+            initializer(*initargs)
+        except BaseException:
+            _base.LOGGER.critical('Exception in initializer:', exc_info=True)
+            executor = executor_reference()
+            if executor is not None:
+                executor._initializer_failed()
+            return
+    _current_worker.worker = worker
+    try:
+        while True:
+            work_item = worker.get()
+            if work_item is not None:
+                work_item.run()
+                # Delete references to object. See issue16284
+                del work_item
+                continue
+
+            executor = executor_reference()
+            # Exit if:
+            #   - The interpreter is shutting down OR
+            #   - The executor that owns the worker has been collected OR
+            #   - The executor that owns the worker has been shutdown.
+            if _shutdown or executor is None or executor._shutdown:
+                # Flag the executor as shutting down as early as possible if it
+                # is not gc-ed yet.
+                if executor is not None:
+                    executor._shutdown = True
+                return
+            idle_timeout = executor._idle_timeout
+            del executor
+
+            worker.idle.append(worker)
+            # Work may have been queued, or the executor shut down, before
+            # the worker was added to the sleeping workers.
+            executor = executor_reference()
+            if (worker.has_work() or _shutdown or executor is None
+                    or executor._shutdown):
+                worker.leave_idle()
+                continue
+            del executor
+
+            if worker.wakeup.acquire(timeout=idle_timeout):
+                if worker.has_work():
+                    _wake_one(worker.idle)
+                continue
+            worker.leave_idle()
+            if worker.has_work():
+                continue
+            executor = executor_reference()
+            if executor is not None and executor._retire(worker):
+                return
+            del executor
+    except BaseException:
+        _base.LOGGER.critical('Exception in worker', exc_info=True)
+    finally:
+        del _current_worker.worker
+
+
+class WorkStealingThreadPoolExecutor(ThreadPoolExecutor):
+    """A thread pool where each worker has its own queue of work items.
+
+    The calls submitted from a worker thread are queued to the queue of that
+    worker, the other calls are given to a sleeping worker or spread over the
+    queues.  Workers whose queue is empty steal work from the other queues.
+    """
+
+    def __init__(self, max_workers=None, thread_name_prefix='',
+                 initializer=None, initargs=(), *, idle_timeout=None):
+        """Initializes a new WorkStealingThreadPoolExecutor instance.
+
+        Args:
+            max_workers: The maximum number of threads that can be used to
+                execute the given calls.
+            thread_name_prefix: An optional name prefix to give our threads.
+            initializer: A callable used to initialize worker threads.
+            initargs: A tuple of arguments to pass to the initializer.
+            idle_timeout: The number of seconds after which a worker thread
+                without work exits. If None, then worker threads live as
+                long as the executor.
+        """
+        super().__init__(max_workers, thread_name_prefix, initializer,
+                         initargs)
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("idle_timeout must be greater than 0")
+        self._idle_timeout = -1 if idle_timeout is None else idle_timeout
+        # Unused, the workers have their own queues.
+        self._work_queue = None
+        self._workers = []
+        self._idle = collections.deque()
+        self._next_worker = itertools.count().__next__
+        self._next_thread_id = itertools.count().__next__
+
+    def submit(self, fn, /, *args, **kwargs):
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+
+            f = _base.Future()
+            self._put([_WorkItem(f, fn, args, kwargs)])
+            return f
+    submit.__doc__ = _base.Executor.submit.__doc__
+
+    def submit_many(self, fn, /, *iterables):
+        with self._shutdown_lock, _global_shutdown_lock:
+            if self._broken:
+                raise BrokenThreadPool(self._broken)
+
+            if self._shutdown:
+                raise RuntimeError('cannot schedule new futures after shutdown')
+            if _shutdown:
+                raise RuntimeError('cannot schedule new futures after '
+                                   'interpreter shutdown')
+
+            fs = []
+            work_items = []
+            for args in zip(*iterables):
+                f = _base.Future()
+                work_items.append(_WorkItem(f, fn, args, {}))
+                fs.append(f)
+            self._put(work_items)
+            return fs
+    submit_many.__doc__ = _base.Executor.submit_many.__doc__
+
+    def _put(self, work_items):
+        # Must be called with self._shutdown_lock held.
+        if not work_items:
+            return
+        idle = self._idle
+        worker = getattr(_current_worker, 'worker', None)
+        if worker is not None and worker.workers is self._workers:
+            # Keep the work local to this worker.  Wake up one sleeping
+            # worker, or start a new one, to steal it; a woken up worker
+            # wakes up the next one if there is still work left, and so on.
+            worker.items.extend(work_items)
+            if idle:
+                _wake_one(idle)
+            elif len(self._workers) < self._max_workers:
+                self._start_worker(())
+            return
+
+        workers = self._workers
+        if not idle and len(workers) < self._max_workers:
+            # Start new workers, each with its share of the work.
+            n = min(len(work_items), self._max_workers - len(workers))
+            for i in range(n):
+                self._start_worker(work_items[i::n])
+            return
+        if len(work_items) == 1 and idle:
+            worker = idle.popleft()
+            worker.items.append(work_items[0])
+            worker.wakeup.release()
+            return
+        # Spread the work over the queues of the workers, and wake up one
+        # sleeping worker, which wakes up the next one if there is still
+        # work left, and so on.
+        start = self._next_worker()
+        n = len(workers)
+        for i, work_item in enumerate(work_items, start):
+            workers[i % n].items.append(work_item)
+        _wake_one(idle)
+
+    def _start_worker(self, work_items):
+        # When the executor gets lost, the weakref callback will wake up
+        # the worker threads.
+        def weakref_cb(_, idle=self._idle):
+            _wake_all(idle)
+
+        worker = _StealingWorker(self._workers, self._idle)
+        worker.items.extend(work_items)
+        thread_name = '%s_%d' % (self._thread_name_prefix or self,
+                                 self._next_thread_id())
+        t = threading.Thread(name=thread_name, target=_stealing_worker,
+                             args=(weakref.ref(self, weakref_cb),
+                                   worker,
+                                   self._initializer,
+                                   self._initargs))
+        t.start()
+        self._workers.append(worker)
+        self._threads.add(t)
+        _threads_queues[t] = worker
+
+    def _retire(self, worker):
+        # Called by an idle worker thread to exit.  Return False if it got
+        # work in the meantime.
+        with self._shutdown_lock:
+            if worker.items or self._shutdown:
+                return False
+            self._workers.remove(worker)
+            self._threads.discard(threading.current_thread())
+            return True
+
+    def _adjust_thread_count(self):
+        # Workers are started by _put() when work is submitted.
+        pass
+
+    def _drain(self):
+        for worker in self._workers:
+            while True:
+                try:
+                    yield worker.items.popleft()
+                except IndexError:
+                    break
+
+    def _initializer_failed(self):
+        with self._shutdown_lock:
+            self._broken = ('A thread initializer failed, the thread pool '
+                            'is not usable anymore')
+            # Drain work queues and mark pending futures failed
+            for work_item in self._drain():
+                work_item.future.set_exception(BrokenThreadPool(self._broken))
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        with self._shutdown_lock:
+            self._shutdown = True
+            if cancel_futures:
+                # Drain all work items from the queues, and then cancel their
+                # associated futures.
+                for work_item in self._drain():
+                    work_item.future.cancel()
+
+            # Wake up the sleeping threads, so that they exit.
+            _wake_all(self._idle)
+            threads = list(self._threads)
+        if wait:
+            for t in threads:
+                t.join()
+    shutdown.__doc__ = _base.Executor.shutdown.__doc__
@@ -25,6 +25,7 @@
 
 import sys, os, time, io, re, traceback, warnings, weakref, collections.abc
 
+from operator import attrgetter
 from types import GenericAlias
 from string import Template
 from string import Formatter as StrFormatter
@@ -39,7 +40,8 @@
            'info', 'log', 'makeLogRecord', 'setLoggerClass', 'shutdown',
            'warn', 'warning', 'getLogRecordFactory', 'setLogRecordFactory',
            'lastResort', 'raiseExceptions', 'getLevelNamesMapping',
-           'getHandlerByName', 'getHandlerNames']
+           'getHandlerByName', 'getHandlerNames', 'StructuredFormatter',
+           'JSONFormatter', 'LogfmtFormatter']
 
 import threading
 
@@ -194,12 +196,20 @@ def currentframe():
 # Setting _srcfile to None will prevent findCaller() from being called. This
 # way, you can avoid the overhead of fetching caller information.
 
+# Cache of the normalized code object filenames, findCaller() checks several
+# frames for each logging call.
+_normcaseCache = {}
+
 # The following is based on warnings._is_internal_frame. It makes sure that
 # frames of the import mechanism are skipped when logging at module level and
 # using a stacklevel value greater than one.
 def _is_internal_frame(frame):
     """Signal whether the frame is a CPython or logging module internal."""
-    filename = os.path.normcase(frame.f_code.co_filename)
+    filename = frame.f_code.co_filename
+    try:
+        filename = _normcaseCache[filename]
+    except KeyError:
+        filename = _normcaseCache[filename] = os.path.normcase(filename)
     return filename == _srcfile or (
         "importlib" in filename and "_bootstrap" in filename
     )
@@ -439,6 +449,7 @@ class PercentStyle(object):
     asctime_format = '%(asctime)s'
     asctime_search = '%(asctime)'
     validation_pattern = re.compile(r'%\(\w+\)[#0+ -]*(\*|\d+)?(\.(\*|\d+))?[diouxefgcrsa%]', re.I)
+    field_pattern = re.compile(r'%\((\w+)\)')
 
     def __init__(self, fmt, *, defaults=None):
         self._fmt = fmt or self.default_format
@@ -447,6 +458,10 @@ def __init__(self, fmt, *, defaults=None):
     def usesTime(self):
         return self._fmt.find(self.asctime_search) >= 0
 
+    def _fieldNames(self):
+        """Return the names of the fields used by the format, in order."""
+        return list(dict.fromkeys(self.field_pattern.findall(self._fmt)))
+
     def validate(self):
         """Validate the input format, ensure it matches the correct style"""
         if not self.validation_pattern.search(self._fmt):
@@ -481,6 +496,14 @@ def _format(self, record):
             values = record.__dict__
         return self._fmt.format(**values)
 
+    def _fieldNames(self):
+        names = {}
+        for _, fieldname, _, _ in _str_formatter.parse(self._fmt):
+            if fieldname:
+                # Only keep the attribute of 'attr.x' and 'attr[x]'
+                names[re.match(r'[^.[]*', fieldname).group()] = None
+        return list(names)
+
     def validate(self):
         """Validate the input format, ensure it is the correct string formatting style"""
         fields = set()
@@ -513,6 +536,14 @@ def usesTime(self):
         fmt = self._fmt
         return fmt.find('$asctime') >= 0 or fmt.find(self.asctime_search) >= 0
 
+    def _fieldNames(self):
+        names = {}
+        for m in Template.pattern.finditer(self._fmt):
+            name = m.group('named') or m.group('braced')
+            if name:
+                names[name] = None
+        return list(names)
+
     def validate(self):
         pattern = Template.pattern
         fields = set()
@@ -588,6 +619,9 @@ class Formatter(object):
     """
 
     converter = time.localtime
+    # ((second, time format, converter), formatted time) of the last call to
+    # formatTime(): time.strftime() has a resolution of one second.
+    _time_cache = (None, None)
 
     def __init__(self, fmt=None, datefmt=None, style='%', validate=True, *,
                  defaults=None):
@@ -637,13 +671,15 @@ def formatTime(self, record, datefmt=None):
         formatters, for example if you want all logging times to be shown in GMT,
         set the 'converter' attribute in the Formatter class.
         """
-        ct = self.converter(record.created)
-        if datefmt:
-            s = time.strftime(datefmt, ct)
-        else:
-            s = time.strftime(self.default_time_format, ct)
-            if self.default_msec_format:
-                s = self.default_msec_format % (s, record.msecs)
+        created = record.created
+        converter = self.converter
+        key = (created // 1, datefmt or self.default_time_format, converter)
+        cache_key, s = self._time_cache
+        if cache_key != key:
+            s = time.strftime(key[1], converter(created))
+            self._time_cache = (key, s)
+        if not datefmt and self.default_msec_format:
+            s = self.default_msec_format % (s, record.msecs)
         return s
 
     def formatException(self, ei):
@@ -724,6 +760,163 @@ def format(self, record):
 #
 _defaultFormatter = Formatter()
 
+# Marks the fields missing from a record in StructuredFormatter.format().
+_missing = object()
+
+class StructuredFormatter(Formatter):
+    """
+    A formatter which converts a LogRecord to structured text, such as JSON.
+
+    The format string isn't used to format the record: it only names the
+    record attributes, or fields, to output, with the usual style. For
+    each record, the fields are extracted into a dict, which is passed to
+    serialize(). The fields which are missing from the record, and from the
+    defaults if any are given, are left out. If the record has exception or
+    stack information, it is added as the 'exc_info' or 'stack_info' field.
+    """
+
+    default_fields = ('asctime', 'levelname', 'name', 'message')
+
+    def __init__(self, fmt=None, datefmt=None, style='%', validate=True, *,
+                 defaults=None):
+        """
+        Initialize the formatter with the fields used by the specified
+        format string, or with default_fields if it is not specified, and
+        with the specified date format string, as for Formatter.
+        """
+        Formatter.__init__(self, fmt, datefmt, style, validate,
+                           defaults=defaults)
+        if fmt:
+            fields = self._style._fieldNames()
+        else:
+            fields = self.default_fields
+        self.fields = tuple(fields)
+        # Extract all the fields with a single call.
+        if len(self.fields) == 1:
+            getter = attrgetter(*self.fields)
+            self._getter = lambda record: (getter(record),)
+        else:
+            self._getter = attrgetter(*self.fields)
+        self._uses_time = 'asctime' in self.fields
+
+    def usesTime(self):
+        """
+        Check if the fields include the creation time of the record.
+        """
+        return self._uses_time
+
+    def serialize(self, values):
+        """
+        Return the dict of fields of a record as text.
+
+        This method must be implemented by subclasses.
+        """
+        raise NotImplementedError('serialize must be implemented '
+                                  'by StructuredFormatter subclasses')
+
+    def format(self, record):
+        """
+        Format the specified record as structured text.
+
+        The message attribute of the record is computed using
+        LogRecord.getMessage(), and the asctime attribute using formatTime()
+        if it is one of the fields. The fields of the record are then
+        extracted into a dict, along with the formatted exception and stack
+        information, and serialized by serialize().
+        """
+        record.message = record.getMessage()
+        if self._uses_time:
+            record.asctime = self.formatTime(record, self.datefmt)
+        try:
+            values = dict(zip(self.fields, self._getter(record)))
+        except AttributeError:
+            defaults = self._style._defaults or {}
+            values = {}
+            for name in self.fields:
+                value = getattr(record, name, defaults.get(name, _missing))
+                if value is not _missing:
+                    values[name] = value
+        if record.exc_info:
+            # Cache the traceback text to avoid converting it multiple times
+            # (it's constant anyway)
+            if not record.exc_text:
+                record.exc_text = self.formatException(record.exc_info)
+        if record.exc_text:
+            values['exc_info'] = record.exc_text
+        if record.stack_info:
+            values['stack_info'] = self.formatStack(record.stack_info)
+        return self.serialize(values)
+
+class JSONFormatter(StructuredFormatter):
+    """
+    A formatter which converts a LogRecord to a JSON object, on a single
+    line. The values which JSON can't represent are converted with str().
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        import json
+        self._encode = json.JSONEncoder(default=str).encode
+        self._encode_str = json.encoder.encode_basestring_ascii
+
+    def serialize(self, values):
+        """
+        Return the dict of fields of a record as a JSON object.
+        """
+        # Most values are strings and integers: encode them directly, which
+        # is much faster than encoding the whole dict with the JSONEncoder.
+        encode = self._encode
+        encode_str = self._encode_str
+        items = []
+        for key, value in values.items():
+            if type(value) is str:
+                value = encode_str(value)
+            elif type(value) is int:
+                value = int.__repr__(value)
+            else:
+                value = encode(value)
+            items.append(f'{encode_str(key)}: {value}')
+        return '{%s}' % ', '.join(items)
+
+class LogfmtFormatter(StructuredFormatter):
+    """
+    A formatter which converts a LogRecord to a line of logfmt key=value
+    pairs. The values are quoted if they are empty or contain spaces, quotes,
+    '=' or control characters.
+    """
+
+    _quote_pattern = re.compile(r'[\s"=\\\x00-\x1f]|^$')
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        import json
+        self._quote = json.encoder.encode_basestring
+
+    def formatValue(self, value):
+        """
+        Return a field value as logfmt text.
+
+        None is written as an empty value, booleans as true and false, and
+        other values are converted with str().
+        """
+        if value is None:
+            return ''
+        if value is True:
+            return 'true'
+        if value is False:
+            return 'false'
+        value = str(value)
+        if self._quote_pattern.search(value):
+            return self._quote(value)
+        return value
+
+    def serialize(self, values):
+        """
+        Return the dict of fields of a record as logfmt key=value pairs.
+        """
+        fv = self.formatValue
+        return ' '.join([f'{key}={fv(value)}' for key, value in values.items()])
+
 class BufferingFormatter(object):
     """
     A formatter suitable for formatting a number of records.
@@ -1008,6 +1201,17 @@ def emit(self, record):
         raise NotImplementedError('emit must be implemented '
                                   'by Handler subclasses')
 
+    def emit_batch(self, records):
+        """
+        Do whatever it takes to actually log the specified logging records.
+
+        This version calls emit() for each record. Subclasses can override
+        it to process the records together, for example to write them at
+        once.
+        """
+        for record in records:
+            self.emit(record)
+
     def handle(self, record):
         """
         Conditionally emit the specified logging record.
@@ -1030,6 +1234,28 @@ def handle(self, record):
                 self.release()
         return rv
 
+    def handle_batch(self, records):
+        """
+        Conditionally emit the specified logging records.
+
+        Each record is filtered as by handle(), and the records which pass
+        all filters are emitted by a single call to emit_batch(), wrapped
+        with acquisition/release of the I/O thread lock.
+        """
+        batch = []
+        for record in records:
+            rv = self.filter(record)
+            if isinstance(rv, LogRecord):
+                record = rv
+            if rv:
+                batch.append(record)
+        if batch:
+            self.acquire()
+            try:
+                self.emit_batch(batch)
+            finally:
+                self.release()
+
     def setFormatter(self, fmt):
         """
         Set the formatter for this handler.
@@ -1122,6 +1348,9 @@ class StreamHandler(Handler):
     """
 
     terminator = '\n'
+    # emit() flushes the stream after each record if true.  It is false
+    # while emit_batch() runs, and in the buffered mode of FileHandler.
+    _autoflush = True
 
     def __init__(self, stream=None):
         """
@@ -1161,12 +1390,30 @@ def emit(self, record):
             stream = self.stream
             # issue 35046: merged two stream.writes into one.
             stream.write(msg + self.terminator)
-            self.flush()
+            if self._autoflush:
+                self.flush()
         except RecursionError:  # See issue 36272
             raise
         except Exception:
             self.handleError(record)
 
+    def emit_batch(self, records):
+        """
+        Emit the records.
+
+        Each record is written by emit(), but the stream is only flushed
+        once, after the last record.
+        """
+        autoflush = self._autoflush
+        self._autoflush = False
+        try:
+            for record in records:
+                self.emit(record)
+        finally:
+            self._autoflush = autoflush
+        if autoflush:
+            self.flush()
+
     def setStream(self, stream):
         """
         Sets the StreamHandler's stream to the specified value,
@@ -1203,10 +1450,24 @@ class FileHandler(StreamHandler):
     """
     A handler class which writes formatted logging records to disk files.
     """
-    def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None):
+    flush_interval = None
+    buffer_size = -1
+    # (thread, stop event) of the background flushing thread, if started.
+    _flusher = None
+
+    def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None,
+                 *, flush_interval=None, flush_level=ERROR, buffer_size=-1):
         """
         Open the specified file and use it as the stream for logging.
+
+        If flush_interval is not None, the file is buffered: instead of
+        being flushed after each record, it is flushed when its buffer of
+        buffer_size bytes is full, every flush_interval seconds by a
+        background thread, after each record of flush_level or higher, and
+        when the handler is closed or flushed.
         """
+        if flush_interval is not None and flush_interval <= 0:
+            raise ValueError("flush_interval must be positive")
         # Issue #27493: add support for Path objects to be passed in
         filename = os.fspath(filename)
         #keep the absolute path, otherwise derived classes which use this
@@ -1218,6 +1479,11 @@ def __init__(self, filename, mode='a', encoding=None, delay=False, errors=None):
             self.encoding = io.text_encoding(encoding)
         self.errors = errors
         self.delay = delay
+        self.flush_interval = flush_interval
+        self.flush_level = _checkLevel(flush_level)
+        self.buffer_size = buffer_size
+        if flush_interval is not None:
+            self._autoflush = False
         # bpo-26789: FileHandler keeps a reference to the builtin open()
         # function to be able to open or reopen the file during Python
         # finalization.
@@ -1251,6 +1517,7 @@ def close(self):
                 # Also see Issue #42378: we also rely on
                 # self._closed being set to True there
                 StreamHandler.close(self)
+                self._stop_flusher()
         finally:
             self.release()
 
@@ -1260,7 +1527,7 @@ def _open(self):
         Return the resulting stream.
         """
         open_func = self._builtin_open
-        return open_func(self.baseFilename, self.mode,
+        return open_func(self.baseFilename, self.mode, self.buffer_size,
                          encoding=self.encoding, errors=self.errors)
 
     def emit(self, record):
@@ -1272,12 +1539,56 @@ def emit(self, record):
 
         If stream is not open, current mode is 'w' and `_closed=True`, record
         will not be emitted (see Issue #42378).
+
+        If the file is buffered, flush it if the record's level is at least
+        flush_level, and start the background flushing thread if needed.
         """
         if self.stream is None:
             if self.mode != 'w' or not self._closed:
                 self.stream = self._open()
         if self.stream:
             StreamHandler.emit(self, record)
+            if self.flush_interval is not None:
+                if record.levelno >= self.flush_level:
+                    self.flush()
+                if self._flusher is None and not self._closed:
+                    try:
+                        self._start_flusher()
+                    except RuntimeError:
+                        # New threads can't be started at interpreter
+                        # shutdown: flush synchronously instead.
+                        self.flush()
+
+    def _start_flusher(self):
+        stop = threading.Event()
+        thread = threading.Thread(target=self._flush_periodically,
+                                  args=(stop,), daemon=True,
+                                  name='FileHandler flusher')
+        thread.start()
+        self._flusher = (thread, stop)
+
+    def _flush_periodically(self, stop):
+        while not stop.wait(self.flush_interval):
+            try:
+                self.flush()
+            except Exception:
+                # The error is reported when the next record is written.
+                pass
+
+    def _stop_flusher(self):
+        # The thread isn't joined: close() can be called with the handler
+        # lock held, for example by shutdown(), and the thread may be
+        # waiting for it to flush the file.
+        flusher = self._flusher
+        if flusher is not None:
+            self._flusher = None
+            flusher[1].set()
+
+    def _at_fork_reinit(self):
+        super()._at_fork_reinit()
+        # The flushing thread doesn't exist in the child process, the next
+        # record starts a new one.
+        self._flusher = None
 
     def __repr__(self):
         level = getLevelName(self.level)
@@ -714,8 +714,17 @@ def _configure_queue_handler(self, klass, **kwargs):
             lklass = kwargs['listener']
         else:
             lklass = logging.handlers.QueueListener
-        listener = lklass(q, *kwargs['handlers'], respect_handler_level=rhl)
-        handler = klass(q)
+        # Only pass the optional arguments which are configured, for custom
+        # classes which don't accept them.
+        lkwargs = {}
+        if 'max_batch' in kwargs:
+            lkwargs['max_batch'] = kwargs['max_batch']
+        listener = lklass(q, *kwargs['handlers'], respect_handler_level=rhl,
+                          **lkwargs)
+        hkwargs = {}
+        if 'defer_format' in kwargs:
+            hkwargs['defer_format'] = kwargs['defer_format']
+        handler = klass(q, **hkwargs)
         handler.listener = listener
         return handler
 
@@ -42,6 +42,10 @@
 
 _MIDNIGHT = 24 * 60 * 60  # number of seconds in a day
 
+# RotatingFileHandler counts the size of the ASCII messages written to files
+# with an encoding which is compatible with ASCII without encoding them.
+_ASCII = ''.join(map(chr, range(128)))
+
 class BaseRotatingHandler(logging.FileHandler):
     """
     Base class for handlers that rotate log files at a certain point.
@@ -50,8 +54,12 @@ class BaseRotatingHandler(logging.FileHandler):
     """
     namer = None
     rotator = None
+    compress = False
+    # The thread which compresses the last rotated file, see rotate().
+    _compressor = None
 
-    def __init__(self, filename, mode, encoding=None, delay=False, errors=None):
+    def __init__(self, filename, mode, encoding=None, delay=False, errors=None,
+                 *, compress=False):
         """
         Use the specified filename for streamed logging
         """
@@ -61,6 +69,15 @@ def __init__(self, filename, mode, encoding=None, delay=False, errors=None):
         self.mode = mode
         self.encoding = encoding
         self.errors = errors
+        self.compress = compress
+
+    def close(self):
+        """
+        Closes the stream, and waits for the compression of the last rotated
+        file to complete.
+        """
+        logging.FileHandler.close(self)
+        self._wait_for_compression()
 
     def emit(self, record):
         """
@@ -88,11 +105,16 @@ def rotation_filename(self, default_name):
         is returned unchanged.
 
         :param default_name: The default name for the log file.
+
+        If the handler compresses the rotated files, ".gz" is appended to the
+        name.
         """
         if not callable(self.namer):
             result = default_name
         else:
             result = self.namer(default_name)
+        if self.compress and not callable(self.rotator):
+            result += ".gz"
         return result
 
     def rotate(self, source, dest):
@@ -102,7 +124,8 @@ def rotate(self, source, dest):
         The default implementation calls the 'rotator' attribute of the
         handler, if it's callable, passing the source and dest arguments to
         it. If the attribute isn't callable (the default is None), the source
-        is simply renamed to the destination.
+        is simply renamed to the destination, or compressed to it with gzip by
+        a background thread if the handler compresses the rotated files.
 
         :param source: The source filename. This is normally the base
                        filename, e.g. 'test.log'
@@ -112,17 +135,72 @@ def rotate(self, source, dest):
         if not callable(self.rotator):
             # Issue 18940: A file may not have been created if delay is True.
             if os.path.exists(source):
-                os.rename(source, dest)
+                if self.compress:
+                    self._start_compression(source, dest)
+                else:
+                    os.rename(source, dest)
         else:
             self.rotator(source, dest)
 
+    def _start_compression(self, source, dest):
+        # Only rename the file here: the logging calls don't wait for the
+        # compression.
+        self._wait_for_compression()
+        plain = dest.removesuffix(".gz")
+        os.replace(source, plain)
+        thread = threading.Thread(target=self._compress, args=(plain, dest),
+                                  name='BaseRotatingHandler compressor')
+        self._compressor = thread
+        thread.start()
+
+    def _compress(self, source, dest):
+        import gzip, shutil
+        # Write to a hidden file, which getFilesToDelete() doesn't match.
+        dirname, basename = os.path.split(dest)
+        tmp = os.path.join(dirname, "." + basename + ".tmp")
+        try:
+            with open(source, "rb") as sf, gzip.open(tmp, "wb") as df:
+                shutil.copyfileobj(sf, df)
+            # Remove the source first, so that the rotated file is never
+            # counted twice.
+            os.remove(source)
+            os.replace(tmp, dest)
+        except Exception:
+            # Keep the uncompressed file, and the compressed one if it is
+            # the only copy left.
+            if os.path.exists(source):
+                try:
+                    os.remove(tmp)
+                except OSError:
+                    pass
+            # No record is being emitted in this thread: report the error
+            # with a record describing the compression.
+            self.handleError(logging.makeLogRecord({
+                'msg': 'Unable to compress %r to %r',
+                'args': (source, dest)}))
+
+    def _wait_for_compression(self):
+        # Wait for the compression of the last rotated file, before other
+        # rotated files are renamed or deleted.
+        compressor = self._compressor
+        if compressor is not None:
+            self._compressor = None
+            compressor.join()
+
 class RotatingFileHandler(BaseRotatingHandler):
     """
     Handler for logging to a set of files, which switches from one file
     to the next when the current file reaches a certain size.
     """
+    # Size of the file, including the records written since it was measured,
+    # or None if it must be measured.
+    _size = None
+    # False if the file isn't a regular file, see bpo-45401.
+    _regular_file = True
+    _ascii_compatible = False
+
     def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
-                 encoding=None, delay=False, errors=None):
+                 encoding=None, delay=False, errors=None, *, compress=False):
         """
         Open the specified file and use it as the stream for logging.
 
@@ -142,6 +220,9 @@ def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
         respectively.
 
         If maxBytes is zero, rollover never occurs.
+
+        If compress is true, the rotated files are compressed with gzip by a
+        background thread, and ".gz" is appended to their names.
         """
         # If rotation/rollover is wanted, it doesn't make sense to use another
         # mode. If for example 'w' were specified, then if there were multiple
@@ -153,14 +234,32 @@ def __init__(self, filename, mode='a', maxBytes=0, backupCount=0,
         if "b" not in mode:
             encoding = io.text_encoding(encoding)
         BaseRotatingHandler.__init__(self, filename, mode, encoding=encoding,
-                                     delay=delay, errors=errors)
+                                     delay=delay, errors=errors,
+                                     compress=compress)
         self.maxBytes = maxBytes
         self.backupCount = backupCount
 
+    def _open(self):
+        """
+        Open the current base file, and reset the size of the file written.
+        """
+        stream = BaseRotatingHandler._open(self)
+        self._size = None
+        # These checks are only done once per file, not for each record.
+        self._regular_file = os.path.isfile(self.baseFilename)
+        try:
+            self._ascii_compatible = (_ASCII.encode(stream.encoding) ==
+                                      _ASCII.encode('ascii'))
+        except (AttributeError, LookupError, UnicodeError):
+            self._ascii_compatible = False
+        return stream
+
     def doRollover(self):
         """
         Do a rollover, as described in __init__().
         """
+        self._wait_for_compression()
+        self._size = None
         if self.stream:
             self.stream.close()
             self.stream = None
@@ -186,17 +285,30 @@ def shouldRollover(self, record):
 
         Basically, see if the supplied record would cause the file to exceed
         the size limit we have.
+
+        The size of the file is only measured once after it is opened: the
+        size of the records written is then added to it, so other writers of
+        the file aren't taken into account.
         """
-        # See bpo-45401: Never rollover anything other than regular files
-        if os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename):
-            return False
         if self.stream is None:                 # delay was set...
             self.stream = self._open()
-        if self.maxBytes > 0:                   # are we rolling over?
+        # See bpo-45401: Never rollover anything other than regular files
+        if self.maxBytes > 0 and self._regular_file:  # are we rolling over?
             msg = "%s\n" % self.format(record)
-            self.stream.seek(0, 2)  #due to non-posix-compliant Windows feature
-            if self.stream.tell() + len(msg) >= self.maxBytes:
+            size = self._size
+            if size is None:
+                self.stream.seek(0, 2)  #due to non-posix-compliant Windows feature
+                size = self.stream.tell()
+            if msg.isascii() and self._ascii_compatible:
+                size += len(msg)
+            else:
+                size += len(msg.encode(self.stream.encoding,
+                                       self.stream.errors or 'strict'))
+            if os.linesep != '\n':
+                size += msg.count('\n') * (len(os.linesep) - 1)
+            if size >= self.maxBytes:
                 return True
+            self._size = size
         return False
 
 class TimedRotatingFileHandler(BaseRotatingHandler):
@@ -209,10 +321,11 @@ class TimedRotatingFileHandler(BaseRotatingHandler):
     """
     def __init__(self, filename, when='h', interval=1, backupCount=0,
                  encoding=None, delay=False, utc=False, atTime=None,
-                 errors=None):
+                 errors=None, *, compress=False):
         encoding = io.text_encoding(encoding)
         BaseRotatingHandler.__init__(self, filename, 'a', encoding=encoding,
-                                     delay=delay, errors=errors)
+                                     delay=delay, errors=errors,
+                                     compress=compress)
         self.when = when.upper()
         self.backupCount = backupCount
         self.utc = utc
@@ -410,6 +523,7 @@ def doRollover(self):
         then we have to get a list of matching filenames, sort them and remove
         the one with the oldest suffix.
         """
+        self._wait_for_compression()
         if self.stream:
             self.stream.close()
             self.stream = None
@@ -1438,12 +1552,17 @@ class QueueHandler(logging.Handler):
     user code for use with earlier Python versions.
     """
 
-    def __init__(self, queue):
+    def __init__(self, queue, *, defer_format=False):
         """
         Initialise an instance, using the passed queue.
+
+        If defer_format is true, records are enqueued as is, and formatted
+        by the handlers of the listener, in its thread. This is only
+        possible if the queue doesn't pickle the records.
         """
         logging.Handler.__init__(self)
         self.queue = queue
+        self.defer_format = defer_format
         self.listener = None  # will be set to listener if configured via dictConfig()
 
     def enqueue(self, record):
@@ -1471,7 +1590,11 @@ def prepare(self, record):
         You might want to override this method if you want to convert
         the record to a dict or JSON string, or send a modified copy
         of the record while leaving the original intact.
+
+        If defer_format is true, the record is returned unchanged.
         """
+        if self.defer_format:
+            return record
         # The format operation gets traceback text into record.exc_text
         # (if there's exception data), and also returns the formatted
         # message. We can then use this to replace the original
@@ -1509,15 +1632,22 @@ class QueueListener(object):
     """
     _sentinel = None
 
-    def __init__(self, queue, *handlers, respect_handler_level=False):
+    def __init__(self, queue, *handlers, respect_handler_level=False,
+                 max_batch=1):
         """
         Initialise an instance with the specified queue and
         handlers.
+
+        If max_batch is greater than 1, up to max_batch records are
+        dequeued at once and passed together to the handlers.
         """
+        if max_batch < 1:
+            raise ValueError('max_batch must be at least 1')
         self.queue = queue
         self.handlers = handlers
         self._thread = None
         self.respect_handler_level = respect_handler_level
+        self.max_batch = max_batch
 
     def dequeue(self, block):
         """
@@ -1528,6 +1658,26 @@ def dequeue(self, block):
         """
         return self.queue.get(block)
 
+    def dequeue_batch(self, max_items):
+        """
+        Dequeue up to max_items records and return them in a list, blocking
+        until at least one is available.
+
+        The base implementation uses the get_many method of the queue if it
+        has one, else dequeue followed by get_nowait. You may want to override
+        this method if you want to work with custom queue implementations.
+        """
+        get_many = getattr(self.queue, 'get_many', None)
+        if get_many is not None:
+            return get_many(max_items)
+        records = [self.dequeue(True)]
+        while len(records) < max_items:
+            try:
+                records.append(self.queue.get_nowait())
+            except queue.Empty:
+                break
+        return records
+
     def start(self):
         """
         Start the listener.
@@ -1565,6 +1715,29 @@ def handle(self, record):
             if process:
                 handler.handle(record)
 
+    def handle_batch(self, records):
+        """
+        Handle a batch of records.
+
+        This prepares the records, and passes them to each handler with its
+        handle_batch method, or its handle method if it has none.
+        """
+        records = [self.prepare(record) for record in records]
+        for handler in self.handlers:
+            if not self.respect_handler_level:
+                batch = records
+            else:
+                batch = [record for record in records
+                         if record.levelno >= handler.level]
+            if not batch:
+                continue
+            handle_batch = getattr(handler, 'handle_batch', None)
+            if handle_batch is not None:
+                handle_batch(batch)
+            else:
+                for record in batch:
+                    handler.handle(record)
+
     def _monitor(self):
         """
         Monitor the queue for records, and ask the handler
@@ -1573,6 +1746,9 @@ def _monitor(self):
         This method runs on a separate, internal thread.
         The thread will terminate if it sees a sentinel object in the queue.
         """
+        if self.max_batch > 1:
+            self._monitor_batches()
+            return
         q = self.queue
         has_task_done = hasattr(q, 'task_done')
         while True:
@@ -1588,6 +1764,29 @@ def _monitor(self):
             except queue.Empty:
                 break
 
+    def _monitor_batches(self):
+        # Like _monitor(), but dequeue and handle the records in batches.
+        # The records which follow the sentinel in its batch are handled
+        # too, rather than being lost.
+        q = self.queue
+        has_task_done = hasattr(q, 'task_done')
+        while True:
+            try:
+                records = self.dequeue_batch(self.max_batch)
+            except queue.Empty:
+                break
+            batch = [record for record in records
+                     if record is not self._sentinel]
+            if len(batch) == 1:
+                self.handle(batch[0])
+            elif batch:
+                self.handle_batch(batch)
+            if has_task_done:
+                for _ in records:
+                    q.task_done()
+            if len(batch) < len(records):
+                break
+
     def enqueue_sentinel(self):
         """
         This is used to enqueue the sentinel record.
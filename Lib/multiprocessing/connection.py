@@ -26,6 +26,12 @@
 from .context import reduction
 _ForkingPickler = reduction.ForkingPickler
 
+try:
+    import fcntl
+    from termios import FIONREAD
+except ImportError:
+    fcntl = None
+
 try:
     import _winapi
     from _winapi import WAIT_OBJECT_0, WAIT_ABANDONED_0, WAIT_TIMEOUT, INFINITE
@@ -41,6 +47,14 @@
 BUFSIZE = 8192
 # A very generous timeout when it comes to local connections...
 CONNECTION_TIMEOUT = 20.
+# Pickle protocol 5 buffers of at least this size are sent out of band,
+# as separate messages, instead of being copied into the pickle data.
+OUT_OF_BAND_THRESHOLD = 64 * 1024
+# Prefix of the message announcing out-of-band buffers, it can't be the
+# start of pickle data.
+_OUT_OF_BAND_MAGIC = b'\x00oob'
+# Small messages sent together are coalesced into writes of about this size.
+_COALESCE_SIZE = 64 * 1024
 
 _mmap_counter = itertools.count()
 
@@ -202,7 +216,7 @@ def send(self, obj):
         """Send a (picklable) object"""
         self._check_closed()
         self._check_writable()
-        self._send_bytes(_ForkingPickler.dumps(obj))
+        self._send_pickled(*_dumps(obj))
 
     def recv_bytes(self, maxlength=None):
         """
@@ -246,8 +260,53 @@ def recv(self):
         """Receive a (picklable) object"""
         self._check_closed()
         self._check_readable()
+        buf, buffers = self._recv_pickled()
+        return _ForkingPickler.loads(buf.getbuffer(), buffers=buffers)
+
+    def _send_pickled(self, data, buffers):
+        # Send pickle data and its out-of-band buffers, see _dumps().
+        if buffers:
+            sizes = [m.nbytes for m in buffers]
+            self._send_bytes(_OUT_OF_BAND_MAGIC +
+                             struct.pack('!%dQ' % len(sizes), *sizes))
+        self._send_bytes(data)
+        for m in buffers:
+            self._send_bytes(m)
+
+    def _send_pickled_many(self, messages):
+        # Send several (data, buffers) pairs of _dumps().
+        for data, buffers in messages:
+            self._send_pickled(data, buffers)
+
+    def _recv_pickled(self):
+        # Receive pickle data and a list of its out-of-band buffers, or None.
+        buf = self._recv_bytes()
+        with buf.getbuffer() as m:
+            if m[:len(_OUT_OF_BAND_MAGIC)] != _OUT_OF_BAND_MAGIC:
+                return buf, None
+            header = m[len(_OUT_OF_BAND_MAGIC):]
+            sizes = struct.unpack('!%dQ' % (len(header) // 8), header)
+        buf = self._recv_bytes()
+        return buf, [self._recv_buffer(size) for size in sizes]
+
+    def _recv_pickled_many(self, max_items=None):
+        # Receive a message like _recv_pickled(), waiting for it, and then
+        # the messages which are already available, up to max_items.  Return
+        # a list of (data, buffers) pairs.
+        buf, buffers = self._recv_pickled()
+        messages = [(buf.getbuffer(), buffers)]
+        while ((max_items is None or len(messages) < max_items)
+               and self._poll(0)):
+            buf, buffers = self._recv_pickled()
+            messages.append((buf.getbuffer(), buffers))
+        return messages
+
+    def _recv_buffer(self, size):
+        # Receive an out-of-band buffer of the given size as a bytearray.
         buf = self._recv_bytes()
-        return _ForkingPickler.loads(buf.getbuffer())
+        if buf.tell() != size:
+            self._bad_message_length()
+        return bytearray(buf.getbuffer())
 
     def poll(self, timeout=0.0):
         """Whether there is any input available to be read"""
@@ -360,6 +419,7 @@ def _close(self, _close=os.close):
             _close(self._handle)
         _write = os.write
         _read = os.read
+        _readv = os.readv
 
     def _send(self, buf, write=_write):
         remaining = len(buf)
@@ -386,6 +446,22 @@ def _recv(self, size, read=_read):
             remaining -= n
         return buf
 
+    def _recv_into(self, m, read=_read):
+        # Fill the memoryview m, without the copies done by _recv().
+        handle = self._handle
+        size = len(m)
+        pos = 0
+        while pos < size:
+            if _winapi:
+                chunk = read(handle, size - pos)
+                n = len(chunk)
+                m[pos:pos + n] = chunk
+            else:
+                n = self._readv(handle, [m[pos:]])
+            if n == 0:
+                raise OSError("got end of file during message")
+            pos += n
+
     def _send_bytes(self, buf):
         n = len(buf)
         if n > 0x7fffffff:
@@ -409,6 +485,25 @@ def _send_bytes(self, buf):
                 # to avoid "broken pipe" errors if the other end closed the pipe.
                 self._send(header + buf)
 
+    def _send_pickled_many(self, messages):
+        # Coalesce the small messages into few writes.
+        buf = bytearray()
+        for data, buffers in messages:
+            n = len(data)
+            if buffers or n > 16384:
+                if buf:
+                    self._send(buf)
+                    buf.clear()
+                self._send_pickled(data, buffers)
+            else:
+                buf += struct.pack("!i", n)
+                buf += data
+                if len(buf) >= _COALESCE_SIZE:
+                    self._send(buf)
+                    buf.clear()
+        if buf:
+            self._send(buf)
+
     def _recv_bytes(self, maxsize=None):
         buf = self._recv(4)
         size, = struct.unpack("!i", buf.getvalue())
@@ -419,10 +514,102 @@ def _recv_bytes(self, maxsize=None):
             return None
         return self._recv(size)
 
+    def _recv_buffer(self, size):
+        buf = self._recv(4)
+        n, = struct.unpack("!i", buf.getvalue())
+        if n == -1:
+            buf = self._recv(8)
+            n, = struct.unpack("!Q", buf.getvalue())
+        if n != size:
+            self._bad_message_length()
+        # Receive the data directly into the buffer given to the unpickler.
+        result = bytearray(size)
+        with memoryview(result) as m:
+            self._recv_into(m)
+        return result
+
     def _poll(self, timeout):
         r = wait([self], timeout)
         return bool(r)
 
+    if fcntl is not None:
+        def _recv_pickled_many(self, max_items=None):
+            buf, buffers = self._recv_pickled()
+            messages = [(buf.getbuffer(), buffers)]
+            handle = self._handle
+            if max_items is not None:
+                # Don't read past the max_items-th message
+                while len(messages) < max_items and _available(handle):
+                    buf, buffers = self._recv_pickled()
+                    messages.append((buf.getbuffer(), buffers))
+                return messages
+            available = _available(handle)
+            if not available:
+                return messages
+
+            # Read all the available messages with a single system call and
+            # split them.  Read the rest of the last one if it was partially
+            # written.
+            chunk = memoryview(self._read(handle, available))
+            pos = 0
+            def recv(size):
+                nonlocal pos
+                end = pos + size
+                if end <= len(chunk):
+                    data = chunk[pos:end]
+                    pos = end
+                    return data
+                data = bytearray(chunk[pos:])
+                pos = len(chunk)
+                data += self._recv(size - len(data)).getbuffer()
+                return data
+
+            def recv_bytes():
+                size, = struct.unpack("!i", recv(4))
+                if size == -1:
+                    size, = struct.unpack("!Q", recv(8))
+                return recv(size)
+
+            while pos < len(chunk):
+                data = recv_bytes()
+                buffers = None
+                if data[:len(_OUT_OF_BAND_MAGIC)] == _OUT_OF_BAND_MAGIC:
+                    header = data[len(_OUT_OF_BAND_MAGIC):]
+                    sizes = struct.unpack('!%dQ' % (len(header) // 8), header)
+                    data = recv_bytes()
+                    buffers = []
+                    for size in sizes:
+                        buffer = bytearray(recv_bytes())
+                        if len(buffer) != size:
+                            self._bad_message_length()
+                        buffers.append(buffer)
+                messages.append((data, buffers))
+            return messages
+
+
+def _available(fd):
+    # Number of bytes which can be read from fd without blocking
+    return struct.unpack('i', fcntl.ioctl(fd, FIONREAD, bytes(4)))[0]
+
+def _dumps(obj):
+    """Pickle obj, keeping its large pickle protocol 5 buffers out of band.
+
+    Return the pickle data and the list of out-of-band buffers, which are
+    sent as is, without being copied into the pickle data.
+    """
+    buffers = []
+    def buffer_callback(pickle_buffer):
+        try:
+            m = pickle_buffer.raw()
+        except BufferError:
+            # Not contiguous
+            return True
+        if m.nbytes < OUT_OF_BAND_THRESHOLD:
+            return True
+        buffers.append(m)
+        return False
+    data = _ForkingPickler.dumps(obj, 5, buffer_callback=buffer_callback)
+    return data, buffers
 
 #
 # Public functions
@@ -184,6 +184,16 @@ def set_forkserver_preload(self, module_names):
         from .forkserver import set_forkserver_preload
         set_forkserver_preload(module_names)
 
+    def set_forkserver_profile(self, name, module_names, initializer=None,
+                               initargs=()):
+        '''Define a named profile of the forkserver.
+
+        The processes of the profile are forked from a separate server process
+        which imported the modules and called initializer(*initargs) once.
+        '''
+        from .forkserver import set_forkserver_profile
+        set_forkserver_profile(name, module_names, initializer, initargs)
+
     def get_context(self, method=None):
         if method is None:
             return self
@@ -311,10 +321,28 @@ class SpawnContext(BaseContext):
     class ForkServerContext(BaseContext):
         _name = 'forkserver'
         Process = ForkServerProcess
+
+        def __init__(self, profile=None):
+            self._profile = profile
+            if profile is not None:
+                self.Process = self._profile_process
+
+        def _profile_process(self, *args, **kwds):
+            p = ForkServerProcess(*args, **kwds)
+            p._forkserver_profile = self._profile
+            return p
+
         def _check_available(self):
             if not reduction.HAVE_SEND_HANDLE:
                 raise ValueError('forkserver start method not available')
 
+        def get_profile_context(self, name):
+            '''Return a context whose processes use a forkserver profile.'''
+            from .forkserver import get_forkserver
+            self._check_available()
+            get_forkserver(name)
+            return ForkServerContext(name)
+
     _concrete_contexts = {
         'fork': ForkContext(),
         'spawn': SpawnContext(),
@@ -16,7 +16,7 @@
 from . import util
 
 __all__ = ['ensure_running', 'get_inherited_fds', 'connect_to_new_process',
-           'set_forkserver_preload']
+           'set_forkserver_preload', 'set_forkserver_profile']
 
 #
 #
@@ -38,6 +38,9 @@ def __init__(self):
         self._inherited_fds = None
         self._lock = threading.Lock()
         self._preload_modules = ['__main__']
+        self._profile = False
+        self._initializer = None
+        self._initargs = ()
 
     def _stop(self):
         # Method used by unit tests to stop the server
@@ -65,6 +68,18 @@ def set_forkserver_preload(self, modules_names):
             raise TypeError('module_names must be a list of strings')
         self._preload_modules = modules_names
 
+    def set_forkserver_profile(self, modules_names, initializer=None,
+                               initargs=()):
+        '''Set the modules and the initializer of a profile fork server.'''
+        if not all(type(mod) is str for mod in modules_names):
+            raise TypeError('module_names must be a list of strings')
+        if initializer is not None and not callable(initializer):
+            raise TypeError('initializer must be a callable')
+        self._preload_modules = list(modules_names)
+        self._profile = True
+        self._initializer = initializer
+        self._initargs = tuple(initargs)
+
     def get_inherited_fds(self):
         '''Return list of fds inherited from parent process.
 
@@ -129,9 +144,26 @@ def ensure_running(self):
             if self._preload_modules:
                 desired_keys = {'main_path', 'sys_path'}
                 data = spawn.get_preparation_data('ignore')
-                data = {x: y for x, y in data.items() if x in desired_keys}
+                if self._profile:
+                    # The server of a profile preloads the main module, with
+                    # the sys.path of the parent process.
+                    data = {'main_path': data.get('init_main_from_path'),
+                            'sys_path': data['sys_path'],
+                            'profile': True}
+                else:
+                    data = {x: y for x, y in data.items() if x in desired_keys}
             else:
                 data = {}
+            if self._initializer is not None:
+                # Sent through the "alive" pipe rather than on the command
+                # line, whose arguments are limited in size.  It is unpickled
+                # by the fork server after the preloading, so that the
+                # initializer can be a function of the main module.
+                init = reduction.ForkingPickler.dumps(
+                    (self._initializer, self._initargs))
+                data['init'] = True
+            else:
+                init = None
 
             with socket.socket(socket.AF_UNIX) as listener:
                 address = connection.arbitrary_address('AF_UNIX')
@@ -143,8 +175,15 @@ def ensure_running(self):
                 # all client processes own the write end of the "alive" pipe;
                 # when they all terminate the read end becomes ready.
                 alive_r, alive_w = os.pipe()
+                status_r = status_w = None
                 try:
                     fds_to_pass = [listener.fileno(), alive_r]
+                    if init is not None:
+                        # The server reports the result of the initializer
+                        # through the "status" pipe.
+                        status_r, status_w = os.pipe()
+                        fds_to_pass.append(status_w)
+                        data['status_fd'] = status_w
                     cmd %= (listener.fileno(), alive_r, self._preload_modules,
                             data)
                     exe = spawn.get_executable()
@@ -153,9 +192,35 @@ def ensure_running(self):
                     pid = util.spawnv_passfds(exe, args, fds_to_pass)
                 except:
                     os.close(alive_w)
+                    if status_r is not None:
+                        os.close(status_r)
                     raise
                 finally:
                     os.close(alive_r)
+                    if status_w is not None:
+                        os.close(status_w)
+                if init is not None:
+                    try:
+                        write_signed(alive_w, len(init))
+                        _write_all(alive_w, init)
+                        try:
+                            error = _read_exactly(status_r,
+                                                  read_signed(status_r))
+                        except EOFError:
+                            raise RuntimeError('the fork server exited during '
+                                               'its initialization') from None
+                        if error:
+                            raise RuntimeError(
+                                'the initializer of the fork server failed:\n'
+                                + error.decode('utf-8', 'replace'))
+                    except:
+                        # The server exits when the "alive" pipe is closed,
+                        # or after reporting an error.
+                        os.close(alive_w)
+                        os.waitpid(pid, 0)
+                        raise
+                    finally:
+                        os.close(status_r)
                 self._forkserver_address = address
                 self._forkserver_alive_fd = alive_w
                 self._forkserver_pid = pid
@@ -164,9 +229,12 @@ def ensure_running(self):
 #
 #
 
-def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
+def main(listener_fd, alive_r, preload, main_path=None, sys_path=None,
+         profile=False, init=False, status_fd=None):
     '''Run forkserver.'''
     if preload:
+        if profile and sys_path is not None:
+            sys.path[:] = sys_path
         if '__main__' in preload and main_path is not None:
             process.current_process()._inheriting = True
             try:
@@ -178,6 +246,23 @@ def main(listener_fd, alive_r, preload, main_path=None, sys_path=None):
                 __import__(modname)
             except ImportError:
                 pass
+    if init:
+        # Run the initializer of the profile once, the forked processes
+        # inherit the state that it prepared.
+        init = _read_exactly(alive_r, read_signed(alive_r))
+        try:
+            initializer, initargs = reduction.ForkingPickler.loads(init)
+            initializer(*initargs)
+        except Exception:
+            # Report the error to ensure_running() and exit, rather than
+            # forking processes from a partially initialized state.
+            import traceback
+            error = traceback.format_exc().encode('utf-8', 'replace')
+            write_signed(status_fd, len(error))
+            _write_all(status_fd, error)
+            sys.exit(1)
+        write_signed(status_fd, 0)
+        os.close(status_fd)
 
     util._close_stdin()
 
@@ -319,24 +404,59 @@ def _serve_one(child_r, fds, unused_fds, handlers):
 # Read and write signed numbers
 #
 
-def read_signed(fd):
-    data = b''
-    length = SIGNED_STRUCT.size
+def _read_exactly(fd, length):
+    data = bytearray()
     while len(data) < length:
         s = os.read(fd, length - len(data))
         if not s:
             raise EOFError('unexpected EOF')
         data += s
-    return SIGNED_STRUCT.unpack(data)[0]
+    return bytes(data)
 
-def write_signed(fd, n):
-    msg = SIGNED_STRUCT.pack(n)
+def _write_all(fd, msg):
+    msg = memoryview(msg)
     while msg:
         nbytes = os.write(fd, msg)
         if nbytes == 0:
             raise RuntimeError('should not get here')
         msg = msg[nbytes:]
 
+def read_signed(fd):
+    return SIGNED_STRUCT.unpack(_read_exactly(fd, SIGNED_STRUCT.size))[0]
+
+def write_signed(fd, n):
+    _write_all(fd, SIGNED_STRUCT.pack(n))
+
+#
+# Profiles: named fork servers with their own preloaded modules and state
+#
+
+_profiles = {}
+_profiles_lock = threading.Lock()
+
+def set_forkserver_profile(name, module_names, initializer=None, initargs=()):
+    '''Define a named profile of the fork server.
+
+    Processes started with the profile are forked from a separate fork server
+    which imported module_names and called initializer(*initargs) once.
+    '''
+    if not isinstance(name, str):
+        raise TypeError('profile name must be a string')
+    with _profiles_lock:
+        server = _profiles.get(name)
+        if server is None:
+            server = _profiles[name] = ForkServer()
+    server.set_forkserver_profile(module_names, initializer, initargs)
+
+def get_forkserver(profile=None):
+    '''Return the fork server of a profile, or the default one.'''
+    if profile is None:
+        return _forkserver
+    try:
+        return _profiles[profile]
+    except KeyError:
+        raise ValueError('unknown forkserver profile: %r' % profile) from None
+
 #
 #
 #
@@ -18,6 +18,7 @@
 import threading
 import signal
 import array
+import itertools
 import queue
 import time
 import types
@@ -126,6 +127,13 @@ def all_methods(obj):
             temp.append(name)
     return temp
 
+# Methods of list and dict which don't modify them: calling them doesn't
+# invalidate the snapshots of the referent, see BaseProxy._getsnapshot().
+_READONLY_METHODS = frozenset({
+    '__contains__', '__getitem__', '__iter__', '__len__', '__reversed__',
+    'copy', 'count', 'get', 'index', 'items', 'keys', 'values',
+    })
+
 def public_methods(obj):
     '''
     Return a list of names of methods of `obj` which do not start with '_'
@@ -159,6 +167,10 @@ def __init__(self, registry, address, authkey, serializer):
         self.id_to_obj = {'0': (None, ())}
         self.id_to_refcount = {}
         self.id_to_local_proxy_obj = {}
+        # A new version is assigned to a shared object each time it may
+        # have been modified
+        self.id_to_version = {}
+        self.versions = itertools.count(1)
         self.mutex = threading.Lock()
 
     def serve_forever(self):
@@ -245,6 +257,8 @@ def serve_client(self, conn):
         recv = conn.recv
         send = conn.send
         id_to_obj = self.id_to_obj
+        id_to_version = self.id_to_version
+        versions = self.versions
 
         while not self.stop_event.is_set():
 
@@ -281,6 +295,8 @@ def serve_client(self, conn):
                         msg = ('#PROXY', (rexposed, token))
                     else:
                         msg = ('#RETURN', res)
+                if methodname not in _READONLY_METHODS:
+                    id_to_version[ident] = next(versions)
 
             except AttributeError:
                 if methodname is None:
@@ -325,10 +341,48 @@ def fallback_str(self, conn, ident, obj):
     def fallback_repr(self, conn, ident, obj):
         return repr(obj)
 
+    def fallback_getsnapshot(self, conn, ident, obj, version):
+        current = self.id_to_version.get(ident, 0)
+        if current == version:
+            return None
+        return current, obj
+
+    def fallback_batch(self, conn, ident, obj, calls):
+        try:
+            _, exposed, gettypeid = self.id_to_obj[ident]
+        except KeyError:
+            _, exposed, gettypeid = self.id_to_local_proxy_obj[ident]
+        results = []
+        for methodname, args, kwds in calls:
+            try:
+                if methodname not in exposed:
+                    raise AttributeError(
+                        'method %r of %r object is not in exposed=%r' %
+                        (methodname, type(obj), exposed)
+                        )
+                res = getattr(obj, methodname)(*args, **kwds)
+            except Exception as e:
+                # Don't call the following methods
+                results.append(('#ERROR', e))
+                break
+            finally:
+                if methodname not in _READONLY_METHODS:
+                    self.id_to_version[ident] = next(self.versions)
+            typeid = gettypeid and gettypeid.get(methodname, None)
+            if typeid:
+                rident, rexposed = self.create(conn, typeid, res)
+                token = Token(typeid, self.address, rident)
+                results.append(('#PROXY', (rexposed, token)))
+            else:
+                results.append(('#RETURN', res))
+        return results
+
     fallback_mapping = {
         '__str__':fallback_str,
         '__repr__':fallback_repr,
-        '#GETVALUE':fallback_getvalue
+        '#GETVALUE':fallback_getvalue,
+        '#GETSNAPSHOT':fallback_getsnapshot,
+        '#BATCH':fallback_batch,
         }
 
     def dummy(self, c):
@@ -463,6 +517,7 @@ def decref(self, c, ident):
             util.debug('disposing of obj with id %r', ident)
             with self.mutex:
                 del self.id_to_obj[ident]
+                self.id_to_version.pop(ident, None)
 
 
 #
@@ -754,6 +809,8 @@ class BaseProxy(object):
     '''
     _address_to_local = {}
     _mutex = util.ForkAwareThreadLock()
+    # Version and copy of the referent returned by _getsnapshot()
+    _snapshot = (None, None)
 
     def __init__(self, token, serializer, manager=None,
                  authkey=None, exposed=None, incref=True, manager_owned=False):
@@ -819,7 +876,25 @@ def _callmethod(self, methodname, args=(), kwds={}):
 
         conn.send((self._id, methodname, args, kwds))
         kind, result = conn.recv()
+        return self._convert_result(kind, result)
 
+    def _callmethods(self, calls):
+        '''
+        Call several methods of the referent in a single round trip and
+        return a list of copies of their results
+        '''
+        batch = []
+        for methodname, *rest in calls:
+            args = rest[0] if len(rest) > 0 else ()
+            kwds = rest[1] if len(rest) > 1 else {}
+            batch.append((methodname, args, kwds))
+        results = self._callmethod('#BATCH', (batch,))
+        # If a call failed, its exception is the last result: it is raised
+        # after the proxies returned by the previous calls were created.
+        return [self._convert_result(kind, result)
+                for kind, result in results]
+
+    def _convert_result(self, kind, result):
         if kind == '#RETURN':
             return result
         elif kind == '#PROXY':
@@ -841,6 +916,19 @@ def _getvalue(self):
         '''
         return self._callmethod('#GETVALUE')
 
+    def _getsnapshot(self):
+        '''
+        Get a copy of the value of the referent, which is only transferred
+        again if it was modified since the previous call
+        '''
+        version, value = self._snapshot
+        result = self._callmethod('#GETSNAPSHOT', (version,))
+        if result is not None:
+            # Keep version and value together for the other threads
+            self._snapshot = result
+            version, value = result
+        return value
+
     def _incref(self):
         if self._owned_by_manager:
             util.debug('owned_by_manager skipped INCREF of %r', self._token.id)
@@ -1158,16 +1246,21 @@ def __iadd__(self, value):
     def __imul__(self, value):
         self._callmethod('__imul__', (value,))
         return self
+    def snapshot(self):
+        return list(self._getsnapshot())
 
 
-DictProxy = MakeProxyType('DictProxy', (
+BaseDictProxy = MakeProxyType('BaseDictProxy', (
     '__contains__', '__delitem__', '__getitem__', '__iter__', '__len__',
     '__setitem__', 'clear', 'copy', 'get', 'items',
     'keys', 'pop', 'popitem', 'setdefault', 'update', 'values'
     ))
-DictProxy._method_to_typeid_ = {
+BaseDictProxy._method_to_typeid_ = {
     '__iter__': 'Iterator',
     }
+class DictProxy(BaseDictProxy):
+    def snapshot(self):
+        return dict(self._getsnapshot())
 
 
 ArrayProxy = MakeProxyType('ArrayProxy', (
@@ -393,18 +393,26 @@ def _guarded_task_generation(self, result_job, func, iterable):
         except Exception as e:
             yield (result_job, i+1, _helper_reraises_exception, (e,), {})
 
-    def imap(self, func, iterable, chunksize=1):
+    def _submit_imap_tasks(self, result, tasks, max_inflight):
+        if max_inflight is None:
+            self._taskqueue.put((tasks, result._set_length))
+        else:
+            result._feed(tasks, self._taskqueue, max_inflight)
+
+    def imap(self, func, iterable, chunksize=1, *, max_inflight=None):
         '''
         Equivalent of `map()` -- can be MUCH slower than `Pool.map()`.
         '''
         self._check_running()
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError(
+                "max_inflight must be 1+, not {0!r}".format(max_inflight))
         if chunksize == 1:
             result = IMapIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job, func, iterable),
-                    result._set_length
-                ))
+            self._submit_imap_tasks(
+                result,
+                self._guarded_task_generation(result._job, func, iterable),
+                max_inflight)
             return result
         else:
             if chunksize < 1:
@@ -413,27 +421,29 @@ def imap(self, func, iterable, chunksize=1):
                         chunksize))
             task_batches = Pool._get_tasks(func, iterable, chunksize)
             result = IMapIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job,
-                                                  mapstar,
-                                                  task_batches),
-                    result._set_length
-                ))
+            self._submit_imap_tasks(
+                result,
+                self._guarded_task_generation(result._job,
+                                              mapstar,
+                                              task_batches),
+                max_inflight)
             return (item for chunk in result for item in chunk)
 
-    def imap_unordered(self, func, iterable, chunksize=1):
+    def imap_unordered(self, func, iterable, chunksize=1, *,
+                       max_inflight=None):
         '''
         Like `imap()` method but ordering of results is arbitrary.
         '''
         self._check_running()
+        if max_inflight is not None and max_inflight < 1:
+            raise ValueError(
+                "max_inflight must be 1+, not {0!r}".format(max_inflight))
         if chunksize == 1:
             result = IMapUnorderedIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job, func, iterable),
-                    result._set_length
-                ))
+            self._submit_imap_tasks(
+                result,
+                self._guarded_task_generation(result._job, func, iterable),
+                max_inflight)
             return result
         else:
             if chunksize < 1:
@@ -441,13 +451,12 @@ def imap_unordered(self, func, iterable, chunksize=1):
                     "Chunksize must be 1+, not {0!r}".format(chunksize))
             task_batches = Pool._get_tasks(func, iterable, chunksize)
             result = IMapUnorderedIterator(self)
-            self._taskqueue.put(
-                (
-                    self._guarded_task_generation(result._job,
-                                                  mapstar,
-                                                  task_batches),
-                    result._set_length
-                ))
+            self._submit_imap_tasks(
+                result,
+                self._guarded_task_generation(result._job,
+                                              mapstar,
+                                              task_batches),
+                max_inflight)
             return (item for chunk in result for item in chunk)
 
     def apply_async(self, func, args=(), kwds={}, callback=None,
@@ -845,11 +854,34 @@ def __init__(self, pool):
         self._index = 0
         self._length = None
         self._unsorted = {}
+        self._tasks = None
         self._cache[self._job] = self
 
     def __iter__(self):
         return self
 
+    def _feed(self, tasks, taskqueue, max_inflight):
+        # Submit max_inflight tasks, and then another one each time a result
+        # is consumed, rather than letting the task handler consume tasks
+        # (and the iterable) as fast as it can.
+        self._tasks = tasks
+        self._taskqueue = taskqueue
+        self._feed_lock = threading.Lock()
+        self._submitted = 0
+        self._submit_tasks(max_inflight)
+
+    def _submit_tasks(self, n):
+        with self._feed_lock:
+            if self._tasks is None:
+                return
+            tasks = list(itertools.islice(self._tasks, n))
+            self._submitted += len(tasks)
+            if tasks:
+                self._taskqueue.put((tasks, None))
+            if len(tasks) < n:
+                self._tasks = self._taskqueue = None
+                self._set_length(self._submitted)
+
     def next(self, timeout=None):
         with self._cond:
             try:
@@ -867,6 +899,8 @@ def next(self, timeout=None):
                         raise StopIteration from None
                     raise TimeoutError from None
 
+        if self._tasks is not None:
+            self._submit_tasks(1)
         success, value = item
         if success:
             return value
@@ -28,6 +28,10 @@
 
 from .util import debug, info, Finalize, register_after_fork, is_exiting
 
+# Maximum number of objects which the feeder thread serializes and sends
+# under a single acquisition of the write lock.
+_FEEDER_BATCH = 64
+
 #
 # Queue type using a pipe, buffer and thread
 #
@@ -79,8 +83,9 @@ def _reset(self, after_fork=False):
         self._joincancelled = False
         self._closed = False
         self._close = None
-        self._send_bytes = self._writer.send_bytes
-        self._recv_bytes = self._reader.recv_bytes
+        self._send_pickled_many = self._writer._send_pickled_many
+        self._recv_pickled = self._reader._recv_pickled
+        self._recv_pickled_many = self._reader._recv_pickled_many
         self._poll = self._reader.poll
 
     def put(self, obj, block=True, timeout=None):
@@ -95,12 +100,39 @@ def put(self, obj, block=True, timeout=None):
             self._buffer.append(obj)
             self._notempty.notify()
 
+    def put_many(self, objs, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        objs = list(objs)
+        if block and timeout is not None:
+            deadline = time.monotonic() + timeout
+        start = 0
+        while start < len(objs):
+            # Add as many objects as there are free slots, after waiting
+            # for the first one.
+            if block and timeout is not None:
+                timeout = max(deadline - time.monotonic(), 0)
+            if not self._sem.acquire(block, timeout):
+                raise Full
+            end = start + 1
+            while end < len(objs) and self._sem.acquire(False):
+                end += 1
+            self._put_batch(objs[start:end])
+            start = end
+
+    def _put_batch(self, objs):
+        with self._notempty:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.extend(objs)
+            self._notempty.notify()
+
     def get(self, block=True, timeout=None):
         if self._closed:
             raise ValueError(f"Queue {self!r} is closed")
         if block and timeout is None:
             with self._rlock:
-                res = self._recv_bytes()
+                res, buffers = self._recv_pickled()
             self._sem.release()
         else:
             if block:
@@ -114,12 +146,41 @@ def get(self, block=True, timeout=None):
                         raise Empty
                 elif not self._poll():
                     raise Empty
-                res = self._recv_bytes()
+                res, buffers = self._recv_pickled()
                 self._sem.release()
             finally:
                 self._rlock.release()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        return _ForkingPickler.loads(res.getbuffer(), buffers=buffers)
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        if self._closed:
+            raise ValueError(f"Queue {self!r} is closed")
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if block and timeout is None:
+            with self._rlock:
+                messages = self._recv_pickled_many(max_items)
+        else:
+            if block:
+                deadline = time.monotonic() + timeout
+            if not self._rlock.acquire(block, timeout):
+                raise Empty
+            try:
+                if block:
+                    timeout = deadline - time.monotonic()
+                    if not self._poll(timeout):
+                        raise Empty
+                elif not self._poll():
+                    raise Empty
+                messages = self._recv_pickled_many(max_items)
+            finally:
+                self._rlock.release()
+        for _ in messages:
+            self._sem.release()
+        # unserialize the data after having released the lock
+        return [_ForkingPickler.loads(data, buffers=buffers)
+                for data, buffers in messages]
 
     def qsize(self):
         # Raises NotImplementedError on Mac OSX because of broken sem_getvalue()
@@ -165,7 +226,7 @@ def _start_thread(self):
         self._buffer.clear()
         self._thread = threading.Thread(
             target=Queue._feed,
-            args=(self._buffer, self._notempty, self._send_bytes,
+            args=(self._buffer, self._notempty, self._send_pickled_many,
                   self._wlock, self._reader.close, self._writer.close,
                   self._ignore_epipe, self._on_queue_feeder_error,
                   self._sem),
@@ -209,7 +270,7 @@ def _finalize_close(buffer, notempty):
             notempty.notify()
 
     @staticmethod
-    def _feed(buffer, notempty, send_bytes, writelock, reader_close,
+    def _feed(buffer, notempty, send_pickled_many, writelock, reader_close,
               writer_close, ignore_epipe, onerror, queue_sem):
         debug('starting thread to feed data to pipe')
         nacquire = notempty.acquire
@@ -241,15 +302,37 @@ def _feed(buffer, notempty, send_bytes, writelock, reader_close,
                             return
 
                         # serialize the data before acquiring the lock
-                        obj = _ForkingPickler.dumps(obj)
                         if wacquire is None:
-                            send_bytes(obj)
-                        else:
-                            wacquire()
+                            # Without a lock, only single messages are
+                            # atomic: keep the buffers in the pickle data.
+                            obj = _ForkingPickler.dumps(obj)
+                            send_pickled_many([(obj, ())])
+                            continue
+
+                        # If more objects are waiting, serialize them too
+                        # and send them all under a single acquisition of
+                        # the lock, in as few writes as possible.
+                        messages = [connection._dumps(obj)]
+                        obj = error = None
+                        while buffer and len(messages) < _FEEDER_BATCH:
+                            if buffer[0] is sentinel:
+                                break
+                            obj = bpopleft()
                             try:
-                                send_bytes(obj)
-                            finally:
-                                wrelease()
+                                messages.append(connection._dumps(obj))
+                            except Exception as e:
+                                # Send the previous objects first
+                                error = e
+                                break
+                            obj = None
+                        wacquire()
+                        try:
+                            send_pickled_many(messages)
+                        finally:
+                            wrelease()
+                            del messages
+                        if error is not None:
+                            raise error
                 except IndexError:
                     pass
             except Exception as e:
@@ -320,6 +403,15 @@ def put(self, obj, block=True, timeout=None):
             self._unfinished_tasks.release()
             self._notempty.notify()
 
+    def _put_batch(self, objs):
+        with self._notempty, self._cond:
+            if self._thread is None:
+                self._start_thread()
+            self._buffer.extend(objs)
+            for _ in objs:
+                self._unfinished_tasks.release()
+            self._notempty.notify()
+
     def task_done(self):
         with self._cond:
             if not self._unfinished_tasks.acquire(False):
@@ -364,18 +456,19 @@ def __setstate__(self, state):
 
     def get(self):
         with self._rlock:
-            res = self._reader.recv_bytes()
+            res, buffers = self._reader._recv_pickled()
         # unserialize the data after having released the lock
-        return _ForkingPickler.loads(res)
+        return _ForkingPickler.loads(res.getbuffer(), buffers=buffers)
 
     def put(self, obj):
         # serialize the data before acquiring the lock
-        obj = _ForkingPickler.dumps(obj)
         if self._wlock is None:
-            # writes to a message oriented win32 pipe are atomic
-            self._writer.send_bytes(obj)
+            # writes to a message oriented win32 pipe are atomic, but only
+            # for single messages: keep the buffers in the pickle data
+            self._writer.send_bytes(_ForkingPickler.dumps(obj))
         else:
+            data, buffers = connection._dumps(obj)
             with self._wlock:
-                self._writer.send_bytes(obj)
+                self._writer._send_pickled(data, buffers)
 
     __class_getitem__ = classmethod(types.GenericAlias)
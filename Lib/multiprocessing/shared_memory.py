@@ -5,7 +5,7 @@
 """
 
 
-__all__ = [ 'SharedMemory', 'ShareableList' ]
+__all__ = [ 'SharedMemory', 'ShareableList', 'ShareableQueue' ]
 
 
 from functools import partial
@@ -14,7 +14,9 @@
 import errno
 import struct
 import secrets
+import time
 import types
+from queue import Empty, Full
 
 if os.name == "nt":
     import _winapi
@@ -23,7 +25,7 @@
     import _posixshmem
     _USE_POSIX = True
 
-from . import resource_tracker
+from . import context, resource_tracker
 
 _O_CREX = os.O_CREAT | os.O_EXCL
 
@@ -532,3 +534,189 @@ def index(self, value):
             raise ValueError(f"{value!r} not in this container")
 
     __class_getitem__ = classmethod(types.GenericAlias)
+
+
+class ShareableQueue:
+    """A FIFO queue of byte records stored in a ring buffer inside a
+    shared memory block.
+
+    Records of any length up to the capacity of the ring buffer are
+    copied directly into and out of shared memory, without going through
+    a pipe.  Any number of processes may put and get records concurrently.
+    The queue can be passed to processes started by any start method, as
+    an argument of Process for example."""
+
+    # The shared memory area is organized as follows:
+    # - 8 bytes: capacity of the ring buffer (C) in bytes
+    # - 8 bytes: head, position of the first record
+    # - 8 bytes: tail, position following the last record
+    # - 8 bytes: number of records
+    # - C bytes: the ring buffer
+    # Positions only grow, the offset in the ring buffer of a position is
+    # position % C.  A record is a 4-byte length followed by the data,
+    # padded to a multiple of 8 bytes.  A record never wraps around: a
+    # length of _WRAP means that the next record starts at offset 0.
+    _header = struct.Struct("qqqq")
+    _length = struct.Struct("I")
+    _alignment = 8
+    _WRAP = 0xFFFFFFFF
+
+    def __init__(self, size=1 << 20, *, ctx=None):
+        size -= size % self._alignment
+        if size <= 0:
+            raise ValueError("'size' must be a positive integer")
+        ctx = ctx or context._default_context
+        self.shm = SharedMemory(create=True, size=self._header.size + size)
+        self._header.pack_into(self.shm.buf, 0, size, 0, 0, 0)
+        self._lock = ctx.Lock()
+        # Counts the records, get() waits on it without taking the lock
+        self._items = ctx.Semaphore(0)
+        self._not_full = ctx.Condition(self._lock)
+        self._capacity = size
+
+    def __getstate__(self):
+        context.assert_spawning(self)
+        return (self.shm, self._lock, self._items, self._not_full)
+
+    def __setstate__(self, state):
+        self.shm, self._lock, self._items, self._not_full = state
+        self._capacity = self._header.unpack_from(self.shm.buf, 0)[0]
+
+    def __repr__(self):
+        return (f'{self.__class__.__name__}(name={self.shm.name!r}, '
+                f'size={self._capacity})')
+
+    @property
+    def size(self):
+        "Capacity of the ring buffer in bytes."
+        return self._capacity
+
+    def _record_size(self, n):
+        return -(-(self._length.size + n) // self._alignment) * self._alignment
+
+    def put(self, data, block=True, timeout=None):
+        """Copy the bytes-like object data into the queue as one record.
+
+        If the ring buffer has not enough free space, wait for it like
+        queue.Queue.put() does, and raise queue.Full on failure."""
+        with memoryview(data) as m, m.cast('B') as m:
+            n = m.nbytes
+            need = self._record_size(n)
+            size = self._capacity
+            if need > size:
+                raise ValueError(f"record of {n} bytes larger than the "
+                                 f"queue capacity")
+            if block and timeout is not None:
+                deadline = time.monotonic() + timeout
+            # The lock is only held briefly: wait for it even if block is
+            # false
+            if not self._lock.acquire(True, timeout if block else None):
+                raise Full
+            try:
+                buf = self.shm.buf
+                while True:
+                    _, head, tail, count = self._header.unpack_from(buf, 0)
+                    if not count:
+                        # Restart at offset 0 so that the whole ring buffer
+                        # is available
+                        head = tail = tail + (-tail % size)
+                    offset = tail % size
+                    skip = size - offset if need > size - offset else 0
+                    if tail - head + skip + need <= size:
+                        break
+                    if not block:
+                        raise Full
+                    if timeout is None:
+                        self._not_full.wait()
+                    else:
+                        remaining = deadline - time.monotonic()
+                        if remaining <= 0 or not self._not_full.wait(remaining):
+                            raise Full
+                start = self._header.size
+                if skip:
+                    self._length.pack_into(buf, start + offset, self._WRAP)
+                    tail += skip
+                    offset = 0
+                start += offset
+                self._length.pack_into(buf, start, n)
+                start += self._length.size
+                buf[start:start + n] = m
+                self._header.pack_into(buf, 0, size, head, tail + need,
+                                       count + 1)
+            finally:
+                self._lock.release()
+        self._items.release()
+
+    def put_nowait(self, data):
+        "Equivalent to put(data, False)."
+        return self.put(data, False)
+
+    def _get(self, block, timeout, read):
+        if not self._items.acquire(block, timeout):
+            raise Empty
+        try:
+            with self._lock:
+                buf = self.shm.buf
+                size, head, tail, count = self._header.unpack_from(buf, 0)
+                offset = head % size
+                start = self._header.size + offset
+                n, = self._length.unpack_from(buf, start)
+                if n == self._WRAP:
+                    head += size - offset
+                    start = self._header.size
+                    n, = self._length.unpack_from(buf, start)
+                start += self._length.size
+                result = read(buf[start:start + n])
+                self._header.pack_into(buf, 0, size,
+                                       head + self._record_size(n), tail,
+                                       count - 1)
+                self._not_full.notify_all()
+        except BaseException:
+            # The record is left in the queue
+            self._items.release()
+            raise
+        return result
+
+    def get(self, block=True, timeout=None):
+        """Remove and return the first record of the queue as bytes.
+
+        If the queue is empty, wait for a record like queue.Queue.get()
+        does, and raise queue.Empty on failure."""
+        return self._get(block, timeout, bytes)
+
+    def get_nowait(self):
+        "Equivalent to get(False)."
+        return self.get(False)
+
+    def get_into(self, buffer, block=True, timeout=None):
+        """Remove the first record of the queue and copy it into the
+        writable bytes-like object buffer.  Return the length of the record.
+
+        Raise ValueError, leaving the record in the queue, if the buffer is
+        too small."""
+        def read(m):
+            with memoryview(buffer) as dest, dest.cast('B') as dest:
+                if len(m) > len(dest):
+                    raise ValueError(f"buffer too small for a record of "
+                                     f"{len(m)} bytes")
+                dest[:len(m)] = m
+            return len(m)
+        return self._get(block, timeout, read)
+
+    def qsize(self):
+        "Return the number of records in the queue."
+        return self._header.unpack_from(self.shm.buf, 0)[3]
+
+    def empty(self):
+        "Return True if the queue is empty."
+        return not self.qsize()
+
+    def close(self):
+        """Closes access to the shared memory from this instance but does
+        not destroy the shared memory block."""
+        self.shm.close()
+
+    def unlink(self):
+        """Requests that the underlying shared memory block be destroyed,
+        see SharedMemory.unlink()."""
+        self.shm.unlink()
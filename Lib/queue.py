@@ -14,15 +14,15 @@
 
 
 try:
-    from _queue import Empty
+    from _queue import Empty, Full
 except ImportError:
     class Empty(Exception):
         'Exception raised by Queue.get(block=0)/get_nowait().'
         pass
 
-class Full(Exception):
-    'Exception raised by Queue.put(block=0)/put_nowait().'
-    pass
+    class Full(Exception):
+        'Exception raised by Queue.put(block=0)/put_nowait().'
+        pass
 
 
 class Queue:
@@ -256,7 +256,9 @@ def _get(self):
 
 
 class _PySimpleQueue:
-    '''Simple, unbounded FIFO queue.
+    '''Simple FIFO queue.
+
+    If maxsize is <= 0, the queue size is infinite.
 
     This pure Python implementation is not reentrant.
     '''
@@ -265,19 +267,68 @@ class _PySimpleQueue:
     #  on threading.Condition), fairness is not part of the API contract.
     # This allows the C version to use a different implementation.
 
-    def __init__(self):
+    def __init__(self, maxsize=0):
+        self.maxsize = maxsize
         self._queue = deque()
         self._count = threading.Semaphore(0)
+        # Number of free slots, if the queue is bounded
+        self._slots = threading.Semaphore(maxsize) if maxsize > 0 else None
 
     def put(self, item, block=True, timeout=None):
         '''Put the item on the queue.
 
-        The optional 'block' and 'timeout' arguments are ignored, as this method
-        never blocks.  They are provided for compatibility with the Queue class.
+        If the queue is unbounded (the default), this method never blocks, and
+        the optional 'block' and 'timeout' arguments are ignored.  Otherwise, if
+        optional args 'block' is true and 'timeout' is None (the default), block
+        if necessary until a free slot is available. If 'timeout' is
+        a non-negative number, it blocks at most 'timeout' seconds and raises
+        the Full exception if no free slot was available within that time.
+        Otherwise ('block' is false), put the item if a free slot is immediately
+        available, else raise the Full exception ('timeout' is ignored
+        in that case).
         '''
+        if self._slots is not None:
+            if timeout is not None and timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            if not self._slots.acquire(block, timeout if block else None):
+                raise Full
         self._queue.append(item)
         self._count.release()
 
+    def put_many(self, items, block=True, timeout=None):
+        '''Put all the items of an iterable on the queue, in order.
+
+        If the queue is unbounded (the default), this method never blocks, and
+        the optional 'block' and 'timeout' arguments are ignored.  Otherwise,
+        the items are added in batches, as many as there are free slots, and
+        'block' and 'timeout' apply to the whole call as in put().  If the Full
+        exception is raised, the items added so far stay in the queue.
+        '''
+        items = list(items)
+        if self._slots is None:
+            if items:
+                self._queue.extend(items)
+                self._count.release(len(items))
+            return
+        if timeout is not None:
+            if timeout < 0:
+                raise ValueError("'timeout' must be a non-negative number")
+            endtime = time() + timeout
+        start = 0
+        while start < len(items):
+            # Add as many items as there are free slots, after waiting for
+            # the first one.
+            if block and timeout is not None:
+                timeout = max(endtime - time(), 0)
+            if not self._slots.acquire(block, timeout if block else None):
+                raise Full
+            end = start + 1
+            while end < len(items) and self._slots.acquire(False):
+                end += 1
+            self._queue.extend(items[start:end])
+            self._count.release(end - start)
+            start = end
+
     def get(self, block=True, timeout=None):
         '''Remove and return an item from the queue.
 
@@ -293,12 +344,37 @@ def get(self, block=True, timeout=None):
             raise ValueError("'timeout' must be a non-negative number")
         if not self._count.acquire(block, timeout):
             raise Empty
-        return self._queue.popleft()
+        item = self._queue.popleft()
+        if self._slots is not None:
+            self._slots.release()
+        return item
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        '''Remove and return a list of items from the queue.
+
+        Wait for an item to be available as get() does, then remove and return
+        all the items available in the queue, or at most 'max_items' of them
+        if 'max_items' is not None.
+        '''
+        if max_items is not None and max_items < 1:
+            raise ValueError('max_items must be at least 1')
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+        if not self._count.acquire(block, timeout):
+            raise Empty
+        items = [self._queue.popleft()]
+        while ((max_items is None or len(items) < max_items)
+               and self._count.acquire(False)):
+            items.append(self._queue.popleft())
+        if self._slots is not None:
+            self._slots.release(len(items))
+        return items
 
     def put_nowait(self, item):
         '''Put an item into the queue without blocking.
 
-        This is exactly equivalent to `put(item, block=False)` and is only provided
+        This is exactly equivalent to `put(item, block=False)`.  If the queue
+        is unbounded, it is also equivalent to `put(item)` and is only provided
         for compatibility with the Queue class.
         '''
         return self.put(item, block=False)
@@ -315,6 +391,13 @@ def empty(self):
         '''Return True if the queue is empty, False otherwise (not reliable!).'''
         return len(self._queue) == 0
 
+    def full(self):
+        '''Return True if the queue is full, False otherwise (not reliable!).
+
+        An unbounded queue is never full.
+        '''
+        return 0 < self.maxsize <= len(self._queue)
+
     def qsize(self):
         '''Return the approximate size of the queue (not reliable!).'''
         return len(self._queue)
@@ -242,6 +242,32 @@ def __call__(self, q, c):
         q.put(5)
 
 
+class ZeroCopyBytes:
+    # Pickled with its data out of band with pickle protocol 5
+    def __init__(self, data):
+        self.data = data
+
+    def __reduce_ex__(self, protocol):
+        if protocol >= 5:
+            return type(self), (pickle.PickleBuffer(self.data),)
+        return type(self), (bytearray(self.data),)
+
+    def __eq__(self, other):
+        return (type(self) is type(other) and
+                bytes(self.data) == bytes(other.data))
+
+    def __repr__(self):
+        return '<ZeroCopyBytes %d bytes>' % len(self.data)
+
+
+def zero_copy_values():
+    size = multiprocessing.connection.OUT_OF_BAND_THRESHOLD
+    return [ZeroCopyBytes(bytearray(range(256)) * (size // 256 + 1)),
+            ZeroCopyBytes(bytearray(b'small')),
+            [ZeroCopyBytes(bytearray(b'a' * size)), 'x',
+             ZeroCopyBytes(bytearray(b'b' * (size + 1)))]]
+
+
 class _TestProcess(BaseTestCase):
 
     ALLOWED_TYPES = ('processes', 'threads')
@@ -1270,6 +1296,118 @@ def _on_queue_feeder_error(e, obj):
         self.assertTrue(not_serializable_obj.reduce_was_called)
         self.assertTrue(not_serializable_obj.on_queue_feeder_error_was_called)
 
+    @classmethod
+    def _put_values(cls, queue, values):
+        for value in values:
+            queue.put(value)
+
+    def test_put_get_out_of_band(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        values = zero_copy_values()
+        for queue in self.Queue(), multiprocessing.SimpleQueue():
+            p = self.Process(target=self._put_values, args=(queue, values))
+            p.daemon = True
+            p.start()
+            self.assertEqual([queue.get() for _ in values], values)
+            p.join()
+            close_queue(queue)
+
+    @classmethod
+    def _put_many_values(cls, queue, values):
+        queue.put_many(values)
+
+    def test_put_many_get_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        values = list(range(1000)) + zero_copy_values() + list(range(10))
+        queue = self.Queue()
+        p = self.Process(target=self._put_many_values, args=(queue, values))
+        p.daemon = True
+        p.start()
+        result = []
+        while len(result) < len(values):
+            items = queue.get_many(timeout=support.SHORT_TIMEOUT)
+            self.assertGreaterEqual(len(items), 1)
+            result.extend(items)
+        self.assertEqual(result, values)
+        p.join()
+
+        queue.put_many(range(5))
+        self.assertEqual(queue.get_many(max_items=2), [0, 1])
+        self.assertEqual(queue.get_many(max_items=1), [2])
+        self.assertEqual(queue.get_many(timeout=support.SHORT_TIMEOUT), [3, 4])
+        self.assertRaises(pyqueue.Empty, queue.get_many, block=False)
+        self.assertRaises(pyqueue.Empty, queue.get_many, timeout=0.01)
+        self.assertRaises(ValueError, queue.get_many, max_items=0)
+        close_queue(queue)
+        self.assertRaises(ValueError, queue.put_many, [1])
+        self.assertRaises(ValueError, queue.get_many)
+
+    def test_put_many_full(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.Queue(maxsize=3)
+        queue.put_many([])
+        self.assertRaises(pyqueue.Full, queue.put_many, range(5), timeout=0.01)
+        # The objects which fit in the queue were added
+        self.assertEqual(queue.get_many(max_items=5,
+                                        timeout=support.SHORT_TIMEOUT),
+                         [0, 1, 2])
+        self.assertRaises(pyqueue.Full, queue.put_many, range(5), block=False)
+        for i in range(3):
+            self.assertEqual(queue.get(timeout=support.SHORT_TIMEOUT), i)
+
+        # put_many() blocks until the queue has free slots
+        p = self.Process(target=self._put_many_values,
+                         args=(queue, list(range(10))))
+        p.daemon = True
+        p.start()
+        result = []
+        while len(result) < 10:
+            result.extend(queue.get_many(timeout=support.SHORT_TIMEOUT))
+        self.assertEqual(result, list(range(10)))
+        p.join()
+        close_queue(queue)
+
+    def test_joinable_queue_put_many(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        queue = self.JoinableQueue()
+        queue.put_many('abc')
+        self.assertEqual(queue.get_many(max_items=3,
+                                        timeout=support.SHORT_TIMEOUT),
+                         list('abc'))
+        for _ in range(3):
+            queue.task_done()
+        self.assertRaises(ValueError, queue.task_done)
+        close_queue(queue)
+
+    def test_put_many_feeder_error(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        errors = []
+        class SafeQueue(multiprocessing.queues.Queue):
+            @staticmethod
+            def _on_queue_feeder_error(e, obj):
+                errors.append((type(e), obj))
+
+        not_serializable = threading.Lock()
+        queue = SafeQueue(ctx=multiprocessing.get_context())
+        # The objects around the one which can't be serialized are sent
+        queue.put_many([1, 2, not_serializable, 3])
+        result = []
+        while len(result) < 3:
+            result.extend(queue.get_many(timeout=support.SHORT_TIMEOUT))
+        self.assertEqual(result, [1, 2, 3])
+        self.assertEqual(errors, [(TypeError, not_serializable)])
+        close_queue(queue)
+
     def test_closed_queue_put_get_exceptions(self):
         for q in multiprocessing.Queue(), multiprocessing.JoinableQueue():
             q.close()
@@ -2306,6 +2444,58 @@ def test_dict_iter(self):
         d.clear()
         self.assertRaises(RuntimeError, next, it)
 
+    def test_dict_snapshot(self):
+        d = self.dict(a=1)
+        snapshot = d.snapshot()
+        self.assertEqual(snapshot, {'a': 1})
+        snapshot['b'] = 2
+        self.assertEqual(d.snapshot(), {'a': 1})
+        # The value is only sent again if the dict is modified
+        cached = d._snapshot
+        self.assertEqual(d.copy(), {'a': 1})
+        self.assertEqual(d.snapshot(), {'a': 1})
+        self.assertIs(d._snapshot, cached)
+        d['b'] = 2
+        self.assertEqual(d.snapshot(), {'a': 1, 'b': 2})
+        # Modifications through other proxies are seen
+        outer = self.dict(inner=d)
+        outer['inner'].update(c=3)
+        self.assertEqual(d.snapshot(), {'a': 1, 'b': 2, 'c': 3})
+
+    def test_list_snapshot(self):
+        a = self.list(range(3))
+        self.assertEqual(a.snapshot(), [0, 1, 2])
+        cached = a._snapshot
+        self.assertEqual(a.snapshot(), [0, 1, 2])
+        self.assertIs(a._snapshot, cached)
+        a.append(3)
+        self.assertEqual(a.snapshot(), [0, 1, 2, 3])
+        with self.assertRaises(ValueError):
+            a.remove(4)
+        self.assertEqual(a.snapshot(), [0, 1, 2, 3])
+
+    def test_callmethods(self):
+        a = self.list(range(5))
+        self.assertEqual(
+            a._callmethods([('append', (5,)), ('__len__',),
+                            ('pop', (), {}), ('__getitem__', (slice(2),))]),
+            [None, 6, 5, [0, 1]])
+        self.assertEqual(a._callmethods([]), [])
+        # The calls following a failed call are not done
+        with self.assertRaises(IndexError):
+            a._callmethods([('append', (6,)), ('__getitem__', (10,)),
+                            ('append', (7,))])
+        self.assertEqual(a[:], [0, 1, 2, 3, 4, 6])
+        self.assertRaises(AttributeError, a._callmethods, [('__class__',)])
+        self.assertEqual(a._callmethods([('sort', (), {'reverse': True})]),
+                         [None])
+        self.assertEqual(a.snapshot(), [6, 4, 3, 2, 1, 0])
+
+        d = self.dict(a=1)
+        it, n = d._callmethods([('__iter__',), ('__len__',)])
+        self.assertEqual(list(it), ['a'])
+        self.assertEqual(n, 1)
+
     def test_dict_proxy_nested(self):
         pets = self.dict(ferrets=2, hamsters=4)
         supplies = self.dict(water=10, feed=3)
@@ -2605,6 +2795,46 @@ def test_imap_unordered_handle_iterable_exception(self):
                 self.assertIn(value, expected_values)
                 expected_values.remove(value)
 
+    def test_imap_max_inflight(self):
+        if self.TYPE == 'manager':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        consumed = []
+        def generator(n):
+            for i in range(n):
+                consumed.append(i)
+                yield i
+
+        for imap in self.pool.imap, self.pool.imap_unordered:
+            with self.subTest(imap=imap.__name__):
+                consumed.clear()
+                it = imap(sqr, generator(20), max_inflight=3)
+                self.assertEqual(consumed, [0, 1, 2])
+                results = []
+                for value in it:
+                    results.append(value)
+                    self.assertLessEqual(len(consumed), len(results) + 3)
+                self.assertEqual(sorted(results), list(map(sqr, range(20))))
+
+                consumed.clear()
+                it = imap(sqr, generator(100), chunksize=10, max_inflight=2)
+                self.assertEqual(len(consumed), 20)
+                results = []
+                for value in it:
+                    results.append(value)
+                    self.assertLessEqual(len(consumed), len(results) + 30)
+                self.assertEqual(sorted(results), list(map(sqr, range(100))))
+
+                self.assertEqual(list(imap(sqr, [], max_inflight=1)), [])
+                self.assertEqual(list(imap(sqr, [5], max_inflight=1)), [25])
+                self.assertRaises(ValueError, imap, sqr, [], max_inflight=0)
+
+        it = self.pool.imap(sqr, exception_throwing_generator(10, 3),
+                            max_inflight=2)
+        for i in range(3):
+            self.assertEqual(next(it), i*i)
+        self.assertRaises(SayWhenError, it.__next__)
+
     def test_make_pool(self):
         expected_error = (RemoteError if self.TYPE == 'manager'
                           else ValueError)
@@ -3190,6 +3420,33 @@ def test_connection(self):
 
         p.join()
 
+    @classmethod
+    def _echo_objects(cls, conn):
+        for obj in iter(conn.recv, None):
+            conn.send(obj)
+        conn.close()
+
+    def test_send_out_of_band(self):
+        if self.TYPE != 'processes':
+            self.skipTest('test not appropriate for {}'.format(self.TYPE))
+
+        conn, child_conn = self.Pipe()
+        p = self.Process(target=self._echo_objects, args=(child_conn,))
+        p.daemon = True
+        p.start()
+        child_conn.close()
+
+        for value in zero_copy_values():
+            conn.send(value)
+            result = conn.recv()
+            self.assertEqual(result, value)
+        # Large buffers are received in writable memory
+        self.assertIsInstance(result[2].data, bytearray)
+        result[2].data[0] = 0
+        conn.send(None)
+        p.join()
+        conn.close()
+
     def test_duplex_false(self):
         reader, writer = self.Pipe(duplex=False)
         self.assertEqual(writer.send(1), None)
@@ -4299,6 +4556,93 @@ def test_shared_memory_ShareableList_pickling_dead_object(self):
                 with self.assertRaises(FileNotFoundError):
                     pickle.loads(serialized_sl)
 
+    def test_shared_memory_ShareableQueue_basics(self):
+        q = shared_memory.ShareableQueue(100)
+        self.addCleanup(q.unlink)
+        self.addCleanup(q.close)
+        self.assertEqual(q.size, 96)
+        self.assertTrue(q.empty())
+        self.assertRaises(pyqueue.Empty, q.get_nowait)
+        self.assertRaises(pyqueue.Empty, q.get, timeout=0.01)
+
+        q.put(b'spam')
+        q.put(bytearray(b'eggs'))
+        q.put(memoryview(b'ham'))
+        q.put(array.array('i', [1, 2]))
+        q.put_nowait(b'')
+        self.assertEqual(q.qsize(), 5)
+        self.assertEqual(q.get(), b'spam')
+        self.assertEqual(q.get(), b'eggs')
+        self.assertEqual(q.get_nowait(), b'ham')
+        self.assertEqual(q.get(), array.array('i', [1, 2]).tobytes())
+        self.assertEqual(q.get(), b'')
+        self.assertTrue(q.empty())
+
+        # Records don't wrap around the end of the ring buffer
+        for i in range(20):
+            data = bytes([i]) * (i * 7 % 40)
+            q.put(data)
+            q.put(data[::-1])
+            self.assertEqual(q.get(), data)
+            self.assertEqual(q.get(), data[::-1])
+
+        q.put(b'x' * 40)
+        q.put(b'y' * 40)
+        self.assertRaises(pyqueue.Full, q.put_nowait, b'z')
+        self.assertRaises(pyqueue.Full, q.put, b'z', timeout=0.01)
+        self.assertRaises(ValueError, q.put, b'z' * 93)
+        buf = bytearray(10)
+        self.assertRaises(ValueError, q.get_into, buf)
+        buf = bytearray(50)
+        self.assertEqual(q.get_into(buf), 40)
+        self.assertEqual(buf[:41], b'x' * 40 + b'\0')
+        q.put(b'z' * 44)
+        self.assertEqual(q.get(), b'y' * 40)
+        self.assertEqual(q.get(), b'z' * 44)
+        q.put(b'z' * 92)
+        self.assertEqual(q.get(), b'z' * 92)
+
+        # The queue can only be shared with child processes
+        self.assertRaises(RuntimeError, pickle.dumps, q)
+
+    @classmethod
+    def _echo_shareable_queue(cls, q_in, q_out):
+        while data := q_in.get():
+            q_out.put(data)
+        q_out.put(b'')
+
+    def test_shared_memory_ShareableQueue_across_processes(self):
+        q_in = shared_memory.ShareableQueue(1024)
+        self.addCleanup(q_in.unlink)
+        # Large enough for all the results: they are only read at the end
+        q_out = shared_memory.ShareableQueue()
+        self.addCleanup(q_out.unlink)
+        procs = [self.Process(target=self._echo_shareable_queue,
+                              args=(q_in, q_out))
+                 for _ in range(3)]
+        for p in procs:
+            p.daemon = True
+            p.start()
+        expected = [str(i).encode() * (i % 50 + 1) for i in range(1000)]
+        for data in expected:
+            q_in.put(data)
+        for p in procs:
+            q_in.put(b'')
+        results = []
+        done = 0
+        while done < len(procs):
+            data = q_out.get(timeout=support.LONG_TIMEOUT)
+            if data:
+                results.append(data)
+            else:
+                done += 1
+        for p in procs:
+            join_process(p)
+        self.assertEqual(sorted(results), sorted(expected))
+        self.assertTrue(q_in.empty())
+        q_in.close()
+        q_out.close()
+
     def test_shared_memory_cleaned_after_process_termination(self):
         cmd = '''if 1:
             import os, time, sys
@@ -5212,6 +5556,13 @@ def test_ignore_listener(self):
         finally:
             conn.close()
 
+_forkserver_profile_state = None
+
+def _init_forkserver_profile(value, padding=b''):
+    global _forkserver_profile_state
+    _forkserver_profile_state = value
+
+
 class TestStartMethod(unittest.TestCase):
     @classmethod
     def _check_context(cls, conn):
@@ -5271,6 +5622,64 @@ def test_get_all(self):
                             methods == ['fork', 'spawn', 'forkserver'] or
                             methods == ['spawn', 'fork', 'forkserver'])
 
+    @classmethod
+    def _check_forkserver_profile(cls, conn):
+        conn.send((_forkserver_profile_state,
+                   'xml.dom.minidom' in sys.modules))
+
+    def test_forkserver_profile(self):
+        if multiprocessing.get_start_method() != 'forkserver':
+            self.skipTest("test only relevant for 'forkserver' method")
+        from multiprocessing import forkserver
+        ctx = multiprocessing.get_context('forkserver')
+        self.assertRaises(ValueError, ctx.get_profile_context, 'test-profile')
+        self.assertRaises(TypeError, ctx.set_forkserver_profile,
+                          'test-profile', [b'xml.dom.minidom'])
+
+        ctx.set_forkserver_profile('test-profile',
+                                   [__name__, 'xml.dom.minidom'],
+                                   _init_forkserver_profile,
+                                   # The arguments are larger than a
+                                   # command line argument can be.
+                                   ('ready', b'x' * 256 * 1024))
+        try:
+            profile_ctx = ctx.get_profile_context('test-profile')
+            self.assertEqual(profile_ctx.get_start_method(), 'forkserver')
+            for c, expected in ((profile_ctx, ('ready', True)),
+                                (ctx, (None, False))):
+                r, w = c.Pipe(duplex=False)
+                p = c.Process(target=self._check_forkserver_profile,
+                              args=(w,))
+                p.start()
+                w.close()
+                self.assertEqual(r.recv(), expected)
+                r.close()
+                p.join()
+                self.assertEqual(p.exitcode, 0)
+        finally:
+            forkserver._profiles.pop('test-profile')._stop()
+
+    def test_forkserver_profile_init_error(self):
+        if multiprocessing.get_start_method() != 'forkserver':
+            self.skipTest("test only relevant for 'forkserver' method")
+        from multiprocessing import forkserver
+        ctx = multiprocessing.get_context('forkserver')
+        ctx.set_forkserver_profile('test-profile-error', [__name__],
+                                   _init_forkserver_profile, ())
+        try:
+            profile_ctx = ctx.get_profile_context('test-profile-error')
+            # The error is reported each time, the server isn't left
+            # running with a partially initialized state.
+            for _ in range(2):
+                p = profile_ctx.Process(target=os.getpid)
+                with self.assertRaisesRegex(RuntimeError,
+                                            '(?s)initializer.*failed.*TypeError'):
+                    p.start()
+                server = forkserver.get_forkserver('test-profile-error')
+                self.assertIsNone(server._forkserver_pid)
+        finally:
+            forkserver._profiles.pop('test-profile-error')._stop()
+
     def test_preload_resources(self):
         if multiprocessing.get_start_method() != 'forkserver':
             self.skipTest("test only relevant for 'forkserver' method")
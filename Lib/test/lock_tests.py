@@ -595,6 +595,39 @@ def f():
             # In practice, this implementation has no spurious wakeups.
             self.assertFalse(result)
 
+    def test_notify_after_timeouts(self):
+        # The waits which timed out don't absorb later notifications, and
+        # the waiters are woken up in order.
+        cond = self.condtype()
+        with cond:
+            for i in range(20):
+                self.assertFalse(cond.wait(0))
+                self.assertFalse(cond.wait(0.001))
+        results = []
+        def f(i):
+            with cond:
+                results.append(i)
+                result = cond.wait()
+                results.append((i, result))
+        threads = [threading.Thread(target=f, args=(i,)) for i in range(3)]
+        for i, t in enumerate(threads):
+            t.start()
+            while len(results) <= i:
+                _wait()
+        # The waiters are all blocked once the lock is acquired.
+        with cond:
+            self.assertEqual(results, [0, 1, 2])
+            cond.notify()
+        while len(results) < 4:
+            _wait()
+        with cond:
+            self.assertEqual(results[3], (0, True))
+            cond.notify(2)
+        for t in threads:
+            t.join()
+        # Both threads were woken up, in any order of acquiring the lock.
+        self.assertEqual(sorted(results[4:]), [(1, True), (2, True)])
+
     def test_waitfor(self):
         cond = self.condtype()
         state = 0
@@ -373,6 +373,143 @@ def test__run_once(self):
         self.assertEqual([h2], self.loop._scheduled)
         self.assertTrue(self.loop._process_events.called)
 
+    def test_timer_wheel(self):
+        calls = []
+        self.loop._process_events = mock.Mock()
+        self.assertIsNone(self.loop.get_timer_wheel())
+        h1 = self.loop.call_later(10, calls.append, 'h1')
+        h2 = self.loop.call_later(20, calls.append, 'h2')
+        h2.cancel()
+
+        self.loop.set_timer_wheel(0.001)
+        self.assertEqual(self.loop.get_timer_wheel(), 0.001)
+        self.assertEqual(self.loop._scheduled, [])
+        self.assertEqual(len(self.loop._timer_wheel), 1)
+        self.assertTrue(h1._scheduled)
+        self.assertFalse(h2._scheduled)
+
+        self.loop.call_later(-1, calls.append, 'a')
+        self.loop.call_later(0.01, calls.append, 'b')
+        h3 = self.loop.call_later(0.005, calls.append, 'c')
+        h3.cancel()
+        self.assertFalse(h3._scheduled)
+        self.assertEqual(len(self.loop._timer_wheel), 3)
+
+        self.loop._run_once()
+        t = self.loop._selector.select.call_args[0][0]
+        self.assertEqual(t, 0)
+        self.assertEqual(calls, ['a'])
+        self.loop._selector.select.side_effect = (
+            lambda timeout: time.sleep(timeout) or ())
+        # The loop may wake up early to cascade timers to a lower level.
+        for _ in range(3):
+            self.loop._run_once()
+            if len(calls) > 1:
+                break
+        self.assertEqual(calls, ['a', 'b'])
+
+        self.loop.set_timer_wheel(None)
+        self.assertIsNone(self.loop.get_timer_wheel())
+        self.assertEqual(self.loop._scheduled, [h1])
+        self.assertIsNone(self.loop._timer_wheel)
+
+        with self.assertRaises(ValueError):
+            self.loop.set_timer_wheel(0)
+
+    def test_timer_wheel_run(self):
+        self.loop._process_events = mock.Mock()
+        self.loop.set_timer_wheel(0.001)
+        order = []
+
+        async def waiter(delay):
+            await asyncio.sleep(delay)
+            order.append(delay)
+
+        async def main():
+            timeout_tasks = [
+                asyncio.ensure_future(asyncio.sleep(3600)) for _ in range(100)]
+            await asyncio.gather(waiter(0.03), waiter(0.01), waiter(0.02))
+            for task in timeout_tasks:
+                task.cancel()
+            await asyncio.wait(timeout_tasks)
+
+        t0 = self.loop.time()
+        self.loop.run_until_complete(main())
+        self.assertGreaterEqual(self.loop.time() - t0, 0.03)
+        self.assertEqual(order, [0.01, 0.02, 0.03])
+        self.assertEqual(len(self.loop._timer_wheel), 0)
+
+    def test_stats_disabled(self):
+        self.assertIsNone(self.loop.get_stats())
+        self.loop.set_stats_enabled(True)
+        self.assertIsNotNone(self.loop.get_stats())
+        self.loop.set_stats_enabled(False)
+        self.assertIsNone(self.loop.get_stats())
+
+    def test_stats(self):
+        self.loop._process_events = mock.Mock()
+        self.loop.set_stats_enabled(True)
+        self.loop.slow_callback_duration = 0.01
+
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['iterations'], 0)
+        self.assertEqual(stats['handles'], 0)
+        self.assertEqual(stats['mean_ready'], 0.0)
+        self.assertEqual(stats['task_cpu_time'], {})
+
+        self.loop.call_soon(lambda: None)
+        self.loop.call_soon(time.sleep, 0.02)
+        self.loop.call_soon(lambda: None).cancel()
+        self.loop.call_at(self.loop.time() - 1, lambda: None)
+        self.loop._run_once()
+
+        stats = self.loop.get_stats()
+        self.assertEqual(stats['iterations'], 1)
+        self.assertEqual(stats['max_ready'], 4)
+        self.assertEqual(stats['handles'], 3)
+        self.assertEqual(stats['slow_handles'], 1)
+        self.assertGreaterEqual(stats['max_handle_time'], 0.02)
+        self.assertGreaterEqual(stats['handle_time'], 0.02)
+        self.assertGreaterEqual(stats['max_iteration_time'],
+                                stats['max_handle_time'])
+        self.assertEqual(stats['timers'], 1)
+        self.assertGreaterEqual(stats['max_timer_lag'], 1)
+        histogram = stats['handle_time_histogram']
+        self.assertEqual([bound for bound, _ in histogram],
+                         [1e-5, 1e-4, 1e-3, 1e-2, 1e-1, 1.0, math.inf])
+        self.assertEqual(sum(count for _, count in histogram), 3)
+        self.assertEqual(dict(histogram)[1e-1], 1)
+
+        # Enabling the stats again resets them.
+        self.loop.set_stats_enabled(True)
+        self.assertEqual(self.loop.get_stats()['handles'], 0)
+
+    def test_stats_task_cpu_time(self):
+        self.loop._process_events = mock.Mock()
+        self.loop._write_to_self = mock.Mock()
+        self.loop.set_stats_enabled(True)
+
+        def spin(duration):
+            end = time.thread_time() + duration
+            while time.thread_time() < end:
+                pass
+
+        async def busy():
+            spin(0.01)
+            await asyncio.sleep(0)
+            spin(0.01)
+
+        async def idle():
+            await asyncio.sleep(0)
+
+        busy_task = self.loop.create_task(busy())
+        idle_task = self.loop.create_task(idle())
+        self.loop.run_until_complete(asyncio.gather(busy_task, idle_task))
+
+        cpu_time = self.loop.get_stats()['task_cpu_time']
+        self.assertGreaterEqual(cpu_time[busy_task], 0.02)
+        self.assertLess(cpu_time[idle_task], cpu_time[busy_task])
+
     def test_set_debug(self):
         self.loop.set_debug(True)
         self.assertTrue(self.loop.get_debug())
@@ -994,6 +1131,87 @@ def test_asyncgen_finalization_by_gc_in_other_thread(self):
             self.assertTrue(status['finalized'])
 
 
+class TimerWheelTests(unittest.TestCase):
+
+    def make_handle(self, when):
+        loop = mock.Mock()
+        handle = asyncio.TimerHandle(when, lambda: None, (), loop, None)
+        handle._scheduled = True
+        return handle
+
+    def test_invalid_resolution(self):
+        with self.assertRaises(ValueError):
+            base_events._TimerWheel(0, 0.0)
+
+    def test_pop_due_order(self):
+        wheel = base_events._TimerWheel(0.001, 100.0)
+        handles = [self.make_handle(100.0 + delay)
+                   for delay in (0.5, 0.002, 3.0, 0.002, 70.0, 0.0001)]
+        for handle in handles:
+            wheel.add(handle)
+        self.assertEqual(len(wheel), 6)
+
+        self.assertEqual(wheel.pop_due(100.0), [])
+        due = wheel.pop_due(100.6)
+        self.assertEqual([h.when() for h in due],
+                         [100.0001, 100.002, 100.002, 100.5])
+        self.assertFalse(any(h._scheduled for h in due))
+        self.assertEqual(len(wheel), 2)
+
+        self.assertEqual(wheel.pop_due(102.9), [])
+        self.assertEqual(wheel.pop_due(103.0), [handles[2]])
+        self.assertEqual(wheel.pop_due(170.0), [handles[4]])
+        self.assertEqual(len(wheel), 0)
+        self.assertIsNone(wheel.next_deadline())
+
+    def test_never_early(self):
+        resolution = 0.01
+        wheel = base_events._TimerWheel(resolution, 0.0)
+        deadlines = [i * 0.0037 for i in range(1, 3000)]
+        for when in deadlines:
+            wheel.add(self.make_handle(when))
+        now = 0.0
+        fired = []
+        while len(wheel):
+            deadline = wheel.next_deadline()
+            self.assertGreaterEqual(deadline, now)
+            # Like _run_once(), allow for the clock resolution.
+            now = deadline + 1e-9
+            for handle in wheel.pop_due(now):
+                self.assertLessEqual(handle.when(), now)
+                self.assertLess(now - handle.when(), resolution + 1e-6)
+                fired.append(handle.when())
+        self.assertEqual(fired, deadlines)
+
+    def test_discard(self):
+        wheel = base_events._TimerWheel(0.001, 0.0)
+        h1 = self.make_handle(1.0)
+        h2 = self.make_handle(1.0)
+        wheel.add(h1)
+        wheel.add(h2)
+        self.assertEqual(len(wheel), 2)
+        wheel.discard(h1)
+        wheel.discard(h1)
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_due(2.0), [h2])
+        self.assertEqual(len(wheel), 0)
+
+    def test_far_and_infinite_deadlines(self):
+        wheel = base_events._TimerWheel(1.0, 0.0)
+        far = self.make_handle(float(64 ** 4 * 3 + 5))
+        inf = self.make_handle(float('inf'))
+        past = self.make_handle(float('-inf'))
+        for handle in (far, inf, past):
+            wheel.add(handle)
+        self.assertEqual(wheel.next_deadline(), 0.0)
+        self.assertEqual(wheel.pop_due(0.0), [past])
+        self.assertEqual(wheel.pop_due(far.when() - 1), [])
+        self.assertEqual(wheel.pop_due(far.when()), [far])
+        self.assertEqual(len(wheel), 1)
+        self.assertEqual(wheel.pop_all(), [inf])
+        self.assertEqual(len(wheel), 0)
+
+
 class MyProto(asyncio.Protocol):
     done = None
 
@@ -0,0 +1,326 @@
+"""Tests for eager task execution (Task eager_start and eager task factories)."""
+
+import asyncio
+import contextvars
+import unittest
+
+from asyncio import tasks
+from test.test_asyncio import utils as test_utils
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class EagerTaskFactoryLoopTests:
+
+    Task = None
+
+    def run_coro(self, coro):
+        """
+        Helper method to run the `coro` coroutine in the test event loop.
+        It helps with making sure the event loop is running before starting
+        to execute `coro`. This is important for testing the eager step
+        functionality, since an eager step is taken only if the event loop
+        is already running.
+        """
+
+        async def coro_runner():
+            self.assertTrue(asyncio.get_event_loop().is_running())
+            return await coro
+
+        return self.loop.run_until_complete(coro_runner())
+
+    def setUp(self):
+        super().setUp()
+        self.loop = asyncio.new_event_loop()
+        self.eager_task_factory = asyncio.create_eager_task_factory(self.Task)
+        self.loop.set_task_factory(self.eager_task_factory)
+        self.set_event_loop(self.loop)
+
+    def test_eager_task_factory_set(self):
+        self.assertIsNotNone(self.eager_task_factory)
+        self.assertIs(self.loop.get_task_factory(), self.eager_task_factory)
+
+        async def noop(): pass
+
+        async def run():
+            t = self.loop.create_task(noop())
+            self.assertIsInstance(t, self.Task)
+            await t
+
+        self.run_coro(run())
+
+    def test_await_future_during_eager_step(self):
+
+        async def set_result(fut, val):
+            fut.set_result(val)
+
+        async def run():
+            fut = self.loop.create_future()
+            t = self.loop.create_task(set_result(fut, 'my message'))
+            # assert the eager step completed the task
+            self.assertTrue(t.done())
+            return await fut
+
+        self.assertEqual(self.run_coro(run()), 'my message')
+
+    def test_eager_completion(self):
+
+        async def coro():
+            return 'hello'
+
+        async def run():
+            t = self.loop.create_task(coro())
+            # assert the eager step completed the task
+            self.assertTrue(t.done())
+            return await t
+
+        self.assertEqual(self.run_coro(run()), 'hello')
+
+    def test_block_after_eager_step(self):
+
+        async def coro():
+            await asyncio.sleep(0.1)
+            return 'finished after blocking'
+
+        async def run():
+            t = self.loop.create_task(coro())
+            self.assertFalse(t.done())
+            self.assertIn(t, asyncio.all_tasks(self.loop))
+            result = await t
+            self.assertTrue(t.done())
+            return result
+
+        self.assertEqual(self.run_coro(run()), 'finished after blocking')
+
+    def test_cancellation_after_eager_completion(self):
+
+        async def coro():
+            return 'finished without blocking'
+
+        async def run():
+            t = self.loop.create_task(coro())
+            t.cancel()
+            result = await t
+            # finished task can't be cancelled
+            self.assertFalse(t.cancelled())
+            return result
+
+        self.assertEqual(self.run_coro(run()), 'finished without blocking')
+
+    def test_cancellation_after_eager_step_blocks(self):
+
+        async def coro():
+            await asyncio.sleep(0.1)
+            return 'finished after blocking'
+
+        async def run():
+            t = self.loop.create_task(coro())
+            t.cancel('cancellation message')
+            self.assertGreater(t.cancelling(), 0)
+            await t
+
+        with self.assertRaises(asyncio.CancelledError) as cm:
+            self.run_coro(run())
+
+        self.assertEqual('cancellation message', cm.exception.args[0])
+
+    def test_current_task(self):
+        captured_current_task = None
+
+        async def coro():
+            nonlocal captured_current_task
+            captured_current_task = asyncio.current_task()
+            # verify the task before and after blocking is identical
+            await asyncio.sleep(0.1)
+            self.assertIs(asyncio.current_task(), captured_current_task)
+
+        async def run():
+            outer = asyncio.current_task()
+            t = self.loop.create_task(coro())
+            self.assertIs(captured_current_task, t)
+            # the outer task is restored after the eager step
+            self.assertIs(asyncio.current_task(), outer)
+            await t
+
+        self.run_coro(run())
+
+    def test_all_tasks_with_eager_completion(self):
+        captured_all_tasks = None
+
+        async def coro():
+            nonlocal captured_all_tasks
+            captured_all_tasks = asyncio.all_tasks()
+
+        async def run():
+            t = self.loop.create_task(coro())
+            self.assertIn(t, captured_all_tasks)
+            self.assertNotIn(t, asyncio.all_tasks())
+
+        self.run_coro(run())
+
+    def test_all_tasks_with_blocking(self):
+        captured_eager_all_tasks = None
+
+        async def coro(fut1, fut2):
+            nonlocal captured_eager_all_tasks
+            captured_eager_all_tasks = asyncio.all_tasks()
+            await fut1
+            fut2.set_result(None)
+
+        async def run():
+            fut1 = self.loop.create_future()
+            fut2 = self.loop.create_future()
+            t = self.loop.create_task(coro(fut1, fut2))
+            self.assertIn(t, captured_eager_all_tasks)
+            self.assertIn(t, asyncio.all_tasks())
+            fut1.set_result(None)
+            await fut2
+            self.assertNotIn(t, asyncio.all_tasks())
+
+        self.run_coro(run())
+
+    def test_exception_in_eager_step(self):
+
+        async def coro():
+            raise ValueError('eager failure')
+
+        async def run():
+            t = self.loop.create_task(coro())
+            self.assertTrue(t.done())
+            with self.assertRaisesRegex(ValueError, 'eager failure'):
+                await t
+
+        self.run_coro(run())
+
+    def test_context_vars(self):
+        cv = contextvars.ContextVar('cv', default=0)
+
+        coro_first_step_ran = False
+        coro_second_step_ran = False
+
+        async def coro():
+            nonlocal coro_first_step_ran
+            nonlocal coro_second_step_ran
+            self.assertEqual(cv.get(), 1)
+            cv.set(2)
+            self.assertEqual(cv.get(), 2)
+            coro_first_step_ran = True
+            await asyncio.sleep(0.1)
+            self.assertEqual(cv.get(), 2)
+            cv.set(3)
+            self.assertEqual(cv.get(), 3)
+            coro_second_step_ran = True
+
+        async def run():
+            cv.set(1)
+            t = self.loop.create_task(coro())
+            self.assertTrue(coro_first_step_ran)
+            self.assertFalse(coro_second_step_ran)
+            self.assertEqual(cv.get(), 1)
+            await t
+            self.assertTrue(coro_second_step_ran)
+            self.assertEqual(cv.get(), 1)
+
+        self.run_coro(run())
+
+    def test_no_eager_step_when_loop_not_running(self):
+        started = False
+
+        async def coro():
+            nonlocal started
+            started = True
+
+        task = self.Task(coro(), loop=self.loop, eager_start=True)
+        self.assertFalse(started)
+        self.assertFalse(task.done())
+        self.loop.run_until_complete(task)
+        self.assertTrue(started)
+
+    def test_gather_eager_completion(self):
+
+        async def coro(value):
+            return value
+
+        async def run():
+            fut = asyncio.gather(coro(1), coro(2), coro(1))
+            # all children completed eagerly, so does the gather
+            self.assertTrue(fut.done())
+            return await fut
+
+        self.assertEqual(self.run_coro(run()), [1, 2, 1])
+
+    def test_gather_mixed(self):
+
+        async def eager(value):
+            return value
+
+        async def blocking(value):
+            await asyncio.sleep(0)
+            return value
+
+        async def run():
+            fut = asyncio.gather(eager(1), blocking(2), eager(3))
+            self.assertFalse(fut.done())
+            return await fut
+
+        self.assertEqual(self.run_coro(run()), [1, 2, 3])
+
+    def test_taskgroup_eager_completion(self):
+
+        async def coro(value):
+            return value
+
+        async def fail():
+            raise ValueError('boom')
+
+        async def run():
+            async with asyncio.TaskGroup() as tg:
+                t1 = tg.create_task(coro(1))
+                t2 = tg.create_task(coro(2))
+                self.assertTrue(t1.done())
+                self.assertFalse(tg._tasks)
+            self.assertEqual((t1.result(), t2.result()), (1, 2))
+
+            with self.assertRaises(ExceptionGroup) as cm:
+                async with asyncio.TaskGroup() as tg:
+                    tg.create_task(fail())
+                    await asyncio.sleep(0.1)
+            self.assertEqual(len(cm.exception.exceptions), 1)
+            self.assertIsInstance(cm.exception.exceptions[0], ValueError)
+
+        self.run_coro(run())
+
+
+class PyEagerTaskFactoryLoopTests(EagerTaskFactoryLoopTests, test_utils.TestCase):
+    Task = tasks._PyTask
+
+
+@unittest.skipUnless(hasattr(tasks, '_CTask'),
+                     'requires the C _asyncio module')
+class CEagerTaskFactoryLoopTests(EagerTaskFactoryLoopTests, test_utils.TestCase):
+    Task = getattr(tasks, '_CTask', None)
+
+
+class DefaultTaskFactoryEagerStart(test_utils.TestCase):
+    def test_eager_task_factory_is_default_task(self):
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+
+        async def coro():
+            return 42
+
+        async def run():
+            loop.set_task_factory(asyncio.eager_task_factory)
+            task = loop.create_task(coro(), name='eager')
+            self.assertIsInstance(task, asyncio.Task)
+            self.assertEqual(task.get_name(), 'eager')
+            self.assertTrue(task.done())
+            return await task
+
+        self.assertEqual(loop.run_until_complete(run()), 42)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,244 @@
+"""Tests for files.py"""
+
+import asyncio
+import os
+import sys
+import threading
+import unittest
+from asyncio import files
+from unittest import mock
+
+from test import support
+from test.support import os_helper
+from test.support import socket_helper
+from test.support.script_helper import assert_python_ok
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+    # Stop the worker threads started by the tests.
+    pool, files._pool = files._pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+class FilesTests(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+
+    async def test_write_read(self):
+        async with await asyncio.aopen(os_helper.TESTFN, 'w') as f:
+            self.assertIsInstance(f, asyncio.AsyncFile)
+            self.assertEqual(f.name, os_helper.TESTFN)
+            self.assertEqual(f.mode, 'w')
+            self.assertEqual(await f.write('line 1\n'), 7)
+            await f.writelines(['line 2\n', 'line 3\n'])
+        self.assertTrue(f.closed)
+
+        async with await asyncio.aopen(os_helper.TESTFN) as f:
+            self.assertEqual(await f.readline(), 'line 1\n')
+            self.assertEqual(await f.read(), 'line 2\nline 3\n')
+            self.assertEqual(await f.read(), '')
+
+    async def test_readinto_seek_tell(self):
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(b'0123456789')
+        async with await asyncio.aopen(os_helper.TESTFN, 'r+b') as f:
+            self.assertEqual(f.fileno(), f.raw.fileno())
+            buf = bytearray(4)
+            self.assertEqual(await f.readinto(buf), 4)
+            self.assertEqual(buf, b'0123')
+            self.assertEqual(await f.tell(), 4)
+            self.assertEqual(await f.seek(-2, os.SEEK_END), 8)
+            self.assertEqual(await f.read(), b'89')
+            await f.seek(0)
+            self.assertEqual(await f.truncate(5), 5)
+            await f.flush()
+            self.assertEqual(os.path.getsize(os_helper.TESTFN), 5)
+
+    async def test_operations_ordered(self):
+        # Operations issued without waiting run in order.
+        async with await asyncio.aopen(os_helper.TESTFN, 'wb') as f:
+            results = await asyncio.gather(
+                *[f.write(b'%d,' % i) for i in range(100)])
+        self.assertEqual(sum(results),
+                         sum(len(b'%d,' % i) for i in range(100)))
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(),
+                             b''.join(b'%d,' % i for i in range(100)))
+
+    async def test_errors(self):
+        with self.assertRaises(FileNotFoundError):
+            await asyncio.aopen(os_helper.TESTFN)
+        async with await asyncio.aopen(os_helper.TESTFN, 'w') as f:
+            with self.assertRaises(OSError):
+                await f.read()
+        with self.assertRaises(ValueError):
+            await f.write('closed')
+
+    async def test_cancelled_operation(self):
+        async with await asyncio.aopen(os_helper.TESTFN, 'wb') as f:
+            fut = f.write(b'data')
+            fut.cancel()
+            # The operation is run anyway, its result is dropped.
+            await f.flush()
+            self.assertTrue(fut.cancelled())
+        with open(os_helper.TESTFN, 'rb') as f:
+            self.assertEqual(f.read(), b'data')
+
+    async def test_cancelled_aopen(self):
+        opened = []
+
+        def opener(path, flags):
+            fd = os.open(path, flags)
+            opened.append(fd)
+            return fd
+
+        task = asyncio.create_task(
+            asyncio.aopen(os_helper.TESTFN, 'w', opener=opener))
+        await asyncio.sleep(0)
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await task
+        while not opened:
+            await asyncio.sleep(0.01)
+        # The file opened after the cancellation is closed.
+        for _ in range(100):
+            try:
+                os.fstat(opened[0])
+            except OSError:
+                break
+            await asyncio.sleep(0.01)
+        else:
+            self.fail('the file was not closed')
+
+    async def test_batching(self):
+        loop = asyncio.get_running_loop()
+        worker = files._IOWorker('test-worker')
+        self.addCleanup(worker.stop)
+        started = threading.Event()
+        release = threading.Event()
+
+        def block():
+            started.set()
+            release.wait()
+            return 'blocked'
+
+        first = loop.create_future()
+        worker.submit(first, block, ())
+        started.wait()
+        futs = [loop.create_future() for _ in range(10)]
+        for i, fut in enumerate(futs):
+            worker.submit(fut, pow, (i, 2))
+
+        with mock.patch.object(loop, 'call_soon_threadsafe',
+                               wraps=loop.call_soon_threadsafe) as m:
+            release.set()
+            self.assertEqual(await first, 'blocked')
+            self.assertEqual(await asyncio.gather(*futs),
+                             [i * i for i in range(10)])
+        # The queued operations ran as a single batch.
+        self.assertEqual(m.call_count, 2)
+
+    async def test_submit_after_stop(self):
+        loop = asyncio.get_running_loop()
+        worker = files._IOWorker('test-worker')
+        fut = loop.create_future()
+        worker.submit(fut, pow, (3, 2))
+        self.assertEqual(await fut, 9)
+        worker.stop()
+        self.assertIsNone(worker._thread)
+        with self.assertRaises(RuntimeError):
+            worker.submit(loop.create_future(), pow, (3, 2))
+        self.assertIsNone(worker._thread)
+
+    async def test_sendfile(self):
+        data = b'x' * 100_000
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(data)
+        received = bytearray()
+        done = asyncio.Event()
+
+        async def handle(reader, writer):
+            received.extend(await reader.read())
+            writer.close()
+            done.set()
+
+        server = await asyncio.start_server(handle, socket_helper.HOSTv4, 0)
+        self.addAsyncCleanup(server.wait_closed)
+        self.addCleanup(server.close)
+        reader, writer = await asyncio.open_connection(
+            *server.sockets[0].getsockname()[:2])
+        async with await asyncio.aopen(os_helper.TESTFN, 'rb') as f:
+            writer.write(b'header')
+            self.assertEqual(await f.sendfile(writer.transport, 10),
+                             len(data) - 10)
+        writer.close()
+        await writer.wait_closed()
+        await done.wait()
+        self.assertEqual(received, b'header' + data[10:])
+
+
+class FilesProcessTests(unittest.TestCase):
+
+    def setUp(self):
+        self.addCleanup(os_helper.unlink, os_helper.TESTFN)
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'requires os.fork()')
+    def test_fork(self):
+        # A file opened before the fork can be used in the child process.
+        with open(os_helper.TESTFN, 'wb') as f:
+            f.write(b'data')
+
+        async def open_and_read():
+            f = await asyncio.aopen(os_helper.TESTFN, 'rb')
+            self.assertEqual(await f.read(2), b'da')
+            return f
+
+        f = asyncio.run(open_and_read())
+        self.addCleanup(f.raw.close)
+        r, w = os.pipe()
+        self.addCleanup(os.close, r)
+        self.addCleanup(os.close, w)
+        pid = os.fork()
+        if pid == 0:
+            # child
+            try:
+                async def read():
+                    return await asyncio.wait_for(f.read(),
+                                                  support.SHORT_TIMEOUT)
+                os.write(w, asyncio.run(read()))
+            except:
+                os.write(w, b'ERROR:' + ascii(sys.exc_info()).encode())
+            finally:
+                os._exit(0)
+        # parent
+        support.wait_process(pid, exitcode=0)
+        self.assertEqual(os.read(r, 1000), b'ta')
+
+    def test_import_at_shutdown(self):
+        # asyncio can be imported by a thread running after the main thread
+        # has finished, file operations can't be started anymore.
+        code = '''if 1:
+            import threading
+
+            def run():
+                threading.main_thread().join()
+                import asyncio
+                try:
+                    asyncio.run(asyncio.aopen(__file__))
+                except RuntimeError as exc:
+                    print(exc)
+
+            threading.Thread(target=run).start()
+        '''
+        rc, out, err = assert_python_ok('-c', code.replace('__file__',
+                                                           repr(__file__)))
+        self.assertEqual(out.strip(), b'cannot schedule new file operations '
+                                      b'after interpreter shutdown')
+        self.assertEqual(err, b'')
+
+
+if __name__ == '__main__':
+    unittest.main()
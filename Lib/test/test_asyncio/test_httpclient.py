@@ -0,0 +1,438 @@
+"""Tests for httpclient.py"""
+
+import asyncio
+import http.client
+import unittest
+from asyncio import httpclient
+
+from test.support import socket_helper
+
+
+def tearDownModule():
+    asyncio.set_event_loop_policy(None)
+
+
+class Server:
+    """A minimal HTTP/1.1 server answering requests with a callback.
+
+    respond(method, target, headers, body) returns the raw response bytes,
+    or None to close the connection without answering.  The connection is
+    also closed after a response starting with b'HTTP/1.0'.
+    """
+
+    def __init__(self, respond):
+        self.respond = respond
+        self.requests = []
+        self.connections = 0
+        self.server = None
+
+    async def start(self):
+        self.server = await asyncio.start_server(
+            self.handle, socket_helper.HOSTv4, 0)
+        host, port = self.server.sockets[0].getsockname()[:2]
+        self.url = f'http://{host}:{port}'
+
+    async def close(self):
+        self.server.close()
+        await self.server.wait_closed()
+
+    async def handle(self, reader, writer):
+        self.connections += 1
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    break
+                method, target, _ = line.decode('ascii').split(' ', 2)
+                headers = {}
+                while (line := await reader.readline()) != b'\r\n':
+                    name, value = line.decode('latin-1').split(':', 1)
+                    name = name.lower()
+                    value = value.strip()
+                    if name in headers:
+                        # Repeated headers are combined.
+                        value = f'{headers[name]}, {value}'
+                    headers[name] = value
+                if headers.get('transfer-encoding') == 'chunked':
+                    body = b''
+                    while size := int(await reader.readline(), 16):
+                        body += await reader.readexactly(size)
+                        await reader.readexactly(2)
+                    await reader.readexactly(2)
+                else:
+                    length = int(headers.get('content-length', 0))
+                    body = await reader.readexactly(length)
+                self.requests.append((method, target, headers, body))
+                response = self.respond(method, target, headers, body)
+                if response is None:
+                    break
+                writer.write(response)
+                await writer.drain()
+                if response.startswith(b'HTTP/1.0'):
+                    break
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def ok(body=b'hello', headers=''):
+    return (b'HTTP/1.1 200 OK\r\nContent-Length: %d\r\n%s\r\n%s'
+            % (len(body), headers.encode(), body))
+
+
+class HTTPClientTests(unittest.IsolatedAsyncioTestCase):
+
+    async def start_server(self, respond):
+        server = Server(respond)
+        await server.start()
+        self.addAsyncCleanup(server.close)
+        return server
+
+    def make_client(self, **kwargs):
+        client = httpclient.HTTPClient(**kwargs)
+        self.addAsyncCleanup(client.close)
+        return client
+
+    async def test_get(self):
+        server = await self.start_server(lambda *args: ok(
+            headers='X-Test: 1\r\n'))
+        client = self.make_client()
+        response = await client.request('get', server.url + '/a?b=c')
+        self.assertEqual(response.status, 200)
+        self.assertEqual(response.reason, 'OK')
+        self.assertEqual(response.version, 11)
+        self.assertEqual(response.headers['X-Test'], '1')
+        self.assertIsInstance(response.headers, http.client.HTTPMessage)
+        self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(await response.read(), b'')
+
+        method, target, headers, body = server.requests[0]
+        self.assertEqual((method, target, body), ('GET', '/a?b=c', b''))
+        self.assertEqual(headers['host'], server.url.removeprefix('http://'))
+        self.assertNotIn('content-length', headers)
+
+    async def test_keep_alive(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client()
+        for _ in range(3):
+            response = await client.request('GET', server.url)
+            self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(len(server.requests), 3)
+        self.assertEqual(server.connections, 1)
+
+    async def test_connection_close(self):
+        server = await self.start_server(lambda *args: ok(
+            headers='Connection: close\r\n'))
+        client = self.make_client()
+        for _ in range(2):
+            response = await client.request('GET', server.url)
+            self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(server.connections, 2)
+
+    async def test_unread_body_closes_connection(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client()
+        async with await client.request('GET', server.url) as response:
+            self.assertEqual(await response.read(2), b'he')
+        response = await client.request('GET', server.url)
+        self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(server.connections, 2)
+
+    async def test_chunked_response(self):
+        def respond(*args):
+            return (b'HTTP/1.1 200 OK\r\nTransfer-Encoding: chunked\r\n\r\n'
+                    b'5;ext=1\r\nhello\r\n1\r\n \r\n5\r\nworld\r\n'
+                    b'0\r\nX-Trailer: 1\r\n\r\n')
+        server = await self.start_server(respond)
+        client = self.make_client()
+        response = await client.request('GET', server.url)
+        self.assertEqual(await response.read(), b'hello world')
+
+        response = await client.request('GET', server.url)
+        chunks = [chunk async for chunk in response]
+        self.assertEqual(b''.join(chunks), b'hello world')
+        self.assertEqual(server.connections, 1)
+
+    async def test_body_until_close(self):
+        server = await self.start_server(
+            lambda *args: b'HTTP/1.0 200 OK\r\n\r\nall the rest')
+        client = self.make_client()
+        response = await client.request('GET', server.url)
+        self.assertEqual(response.version, 10)
+        self.assertEqual(await response.read(), b'all the rest')
+        response = await client.request('GET', server.url)
+        self.assertEqual(await response.read(), b'all the rest')
+        self.assertEqual(server.connections, 2)
+
+    async def test_head_and_no_content(self):
+        def respond(method, *args):
+            if method == 'HEAD':
+                return b'HTTP/1.1 200 OK\r\nContent-Length: 5\r\n\r\n'
+            return b'HTTP/1.1 204 No Content\r\n\r\n'
+        server = await self.start_server(respond)
+        client = self.make_client()
+        response = await client.request('HEAD', server.url)
+        self.assertEqual(response.headers['Content-Length'], '5')
+        self.assertEqual(await response.read(), b'')
+        response = await client.request('DELETE', server.url)
+        self.assertEqual(response.status, 204)
+        self.assertEqual(await response.read(), b'')
+        self.assertEqual(server.connections, 1)
+
+    async def test_continue(self):
+        server = await self.start_server(lambda *args: (
+            b'HTTP/1.1 100 Continue\r\nX-Skipped: 1\r\n\r\n' + ok()))
+        client = self.make_client()
+        response = await client.request('GET', server.url)
+        self.assertEqual(response.status, 200)
+        self.assertNotIn('X-Skipped', response.headers)
+        self.assertEqual(await response.read(), b'hello')
+
+    async def test_request_body(self):
+        server = await self.start_server(
+            lambda method, target, headers, body: ok(body))
+        client = self.make_client()
+        response = await client.request('POST', server.url, body=b'data')
+        self.assertEqual(await response.read(), b'data')
+        self.assertEqual(server.requests[-1][2]['content-length'], '4')
+
+        response = await client.request('POST', server.url)
+        self.assertEqual(await response.read(), b'')
+        self.assertEqual(server.requests[-1][2]['content-length'], '0')
+
+        response = await client.request('PUT', server.url,
+                                         body=[b'a', b'', b'bc'])
+        self.assertEqual(await response.read(), b'abc')
+        self.assertEqual(server.requests[-1][2]['transfer-encoding'],
+                         'chunked')
+
+        async def agen():
+            yield b'async '
+            yield bytearray(b'body')
+        response = await client.request('PUT', server.url, body=agen())
+        self.assertEqual(await response.read(), b'async body')
+
+        response = await client.request(
+            'PUT', server.url, body=iter([b'ab', b'c']),
+            headers={'Content-Length': '3'})
+        self.assertEqual(await response.read(), b'abc')
+        self.assertNotIn('transfer-encoding', server.requests[-1][2])
+        self.assertEqual(server.connections, 1)
+
+    async def test_headers(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client(headers={'User-Agent': 'test',
+                                           'X-Default': 'a'})
+        response = await client.request('GET', server.url,
+                                        headers={'X-Default': 'b',
+                                                 'X-Number': 42})
+        await response.read()
+        headers = server.requests[-1][2]
+        self.assertEqual(headers['user-agent'], 'test')
+        self.assertEqual(headers['x-default'], 'b')
+        self.assertEqual(headers['x-number'], '42')
+
+        with self.assertRaises(ValueError):
+            await client.request('GET', server.url,
+                                 headers={'X-Bad': 'a\r\nb: c'})
+        with self.assertRaises(ValueError):
+            await client.request('GET', server.url, headers={'X:Bad': 'a'})
+
+    async def test_headers_case_insensitive(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client(headers={'accept-encoding': 'gzip',
+                                           'x-default': 'a'})
+        response = await client.request('GET', server.url,
+                                        headers={'HOST': 'example.com',
+                                                 'X-DEFAULT': 'b'})
+        await response.read()
+        headers = server.requests[-1][2]
+        self.assertEqual(headers['host'], 'example.com')
+        self.assertEqual(headers['accept-encoding'], 'gzip')
+        self.assertEqual(headers['x-default'], 'b')
+
+    async def test_invalid_url(self):
+        client = self.make_client()
+        with self.assertRaises(ValueError):
+            await client.request('GET', 'ftp://example.com/')
+        with self.assertRaises(http.client.InvalidURL):
+            await client.request('GET', 'http:///path')
+        with self.assertRaises(http.client.InvalidURL):
+            await client.request('GET', 'http://example.com/a b')
+        with self.assertRaises(ValueError):
+            await client.request('GET\r\n', 'http://example.com/')
+
+    async def test_bad_responses(self):
+        server = await self.start_server(lambda *args: b'garbage\r\n')
+        client = self.make_client()
+        with self.assertRaises(http.client.BadStatusLine):
+            await client.request('GET', server.url)
+
+        server.respond = lambda *args: None
+        with self.assertRaises(http.client.RemoteDisconnected):
+            await client.request('GET', server.url)
+
+        server.respond = lambda *args: b'HTTP/1.1 200 OK\r\n' * 200
+        with self.assertRaises(http.client.HTTPException):
+            await client.request('GET', server.url)
+
+    async def test_incomplete_read(self):
+        def respond(*args):
+            server.respond = lambda *args: None
+            return b'HTTP/1.1 200 OK\r\nContent-Length: 10\r\n\r\nshort'
+        server = await self.start_server(respond)
+        client = self.make_client()
+        response = await client.request('POST', server.url)
+        # Make the server close the connection.
+        writer = response._conn.writer
+        writer.write(b'GET / HTTP/1.1\r\n\r\n')
+        with self.assertRaises(http.client.IncompleteRead):
+            await response.read()
+
+    async def test_stale_connection_retried(self):
+        responses = []
+
+        def respond(*args):
+            responses.append(None)
+            if len(responses) == 2:
+                # Close the kept-alive connection instead of answering.
+                return None
+            return ok()
+        server = await self.start_server(respond)
+        client = self.make_client()
+        response = await client.request('GET', server.url)
+        await response.read()
+        response = await client.request('GET', server.url)
+        self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(server.connections, 2)
+
+        # Requests which are not idempotent are not replayed.
+        responses.clear()
+        response = await client.request('POST', server.url)
+        await response.read()
+        with self.assertRaises(http.client.RemoteDisconnected):
+            await client.request('POST', server.url)
+
+    async def test_connection_limit(self):
+        gate = asyncio.Event()
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client(max_connections_per_host=2)
+
+        async def fetch():
+            response = await client.request('GET', server.url)
+            await gate.wait()
+            return await response.read()
+
+        tasks = [asyncio.create_task(fetch()) for _ in range(5)]
+        for _ in range(10):
+            await asyncio.sleep(0)
+        while len(server.requests) < 2:
+            await asyncio.sleep(0.01)
+        self.assertEqual(len(server.requests), 2)
+        gate.set()
+        self.assertEqual(await asyncio.gather(*tasks), [b'hello'] * 5)
+        self.assertEqual(server.connections, 2)
+        self.assertEqual(len(server.requests), 5)
+
+    async def test_waiter_cancelled(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client(max_connections_per_host=1)
+        response = await client.request('GET', server.url)
+        waiting = asyncio.create_task(client.request('GET', server.url))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        self.assertEqual(await response.read(), b'hello')
+        response = await client.request('GET', server.url)
+        self.assertEqual(await response.read(), b'hello')
+        self.assertEqual(server.connections, 1)
+
+    async def test_pipelining(self):
+        gate = asyncio.Event()
+        seen = []
+
+        def respond(method, target, headers, body):
+            seen.append(target)
+            return ok(target.encode())
+        server = await self.start_server(respond)
+        client = self.make_client(max_connections_per_host=1,
+                                  max_pipelined=3)
+
+        # Open the connection first.
+        response = await client.request('GET', server.url + '/0')
+        self.assertEqual(await response.read(), b'/0')
+
+        async def fetch(i):
+            response = await client.request('GET', f'{server.url}/{i}')
+            await gate.wait()
+            return await response.read()
+
+        tasks = [asyncio.create_task(fetch(i)) for i in range(1, 6)]
+        while len(seen) < 4:
+            await asyncio.sleep(0.01)
+        # Three requests are in flight on the connection, the others wait.
+        self.assertEqual(seen, ['/0', '/1', '/2', '/3'])
+        gate.set()
+        self.assertEqual(await asyncio.gather(*tasks),
+                         [b'/1', b'/2', b'/3', b'/4', b'/5'])
+        self.assertEqual(server.connections, 1)
+
+    async def test_no_pipelining_with_body(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client(max_connections_per_host=1,
+                                  max_pipelined=3)
+        post = await client.request('POST', server.url, body=b'x')
+        get = asyncio.create_task(client.request('GET', server.url))
+        for _ in range(10):
+            await asyncio.sleep(0)
+        self.assertFalse(get.done())
+        self.assertEqual(len(server.requests), 1)
+        await post.read()
+        response = await get
+        self.assertEqual(await response.read(), b'hello')
+
+    async def test_idle_timeout(self):
+        server = await self.start_server(lambda *args: ok())
+        client = self.make_client(keepalive_timeout=0)
+        response = await client.request('GET', server.url)
+        await response.read()
+        await asyncio.sleep(0.01)
+        response = await client.request('GET', server.url)
+        await response.read()
+        self.assertEqual(server.connections, 2)
+
+    async def test_close(self):
+        server = await self.start_server(lambda *args: ok())
+        client = httpclient.HTTPClient(max_connections_per_host=1)
+        response = await client.request('GET', server.url)
+        waiting = asyncio.create_task(client.request('GET', server.url))
+        await asyncio.sleep(0)
+        self.assertIn('connections=1', repr(client))
+        await client.close()
+        self.assertIn('closed', repr(client))
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+        with self.assertRaises(RuntimeError):
+            await client.request('GET', server.url)
+        response.close()
+        await client.close()
+
+    async def test_context_manager(self):
+        server = await self.start_server(lambda *args: ok())
+        async with httpclient.HTTPClient() as client:
+            async with await client.request('GET', server.url) as response:
+                self.assertIn('status=200', repr(response))
+                self.assertEqual(await response.read(), b'hello')
+        self.assertTrue(client._closed)
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            httpclient.HTTPClient(max_connections_per_host=0)
+        with self.assertRaises(ValueError):
+            httpclient.HTTPClient(max_pipelined=0)
+
+
+if __name__ == '__main__':
+    unittest.main()
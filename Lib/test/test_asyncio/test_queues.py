@@ -432,6 +432,122 @@ async def test_cancelled_put_silence_value_error_exception(self):
             await put_task
 
 
+class QueueBatchTests(unittest.IsolatedAsyncioTestCase):
+
+    def test_nonblocking_get_batch(self):
+        q = asyncio.Queue()
+        for i in range(5):
+            q.put_nowait(i)
+        self.assertEqual([0, 1], q.get_nowait_batch(2))
+        self.assertEqual([2, 3, 4], q.get_nowait_batch())
+        self.assertRaises(asyncio.QueueEmpty, q.get_nowait_batch)
+        self.assertRaises(ValueError, q.get_nowait_batch, 0)
+
+    async def test_get_many(self):
+        q = asyncio.Queue()
+        for i in range(5):
+            q.put_nowait(i)
+        self.assertEqual([0, 1, 2], await q.get_many(3))
+        self.assertEqual([3, 4], await q.get_many())
+        with self.assertRaises(ValueError):
+            await q.get_many(0)
+
+    async def test_blocking_get_many(self):
+        q = asyncio.Queue()
+        getter = asyncio.create_task(q.get_many(3))
+        await asyncio.sleep(0)
+        self.assertFalse(getter.done())
+
+        # A single wakeup returns everything available, up to max_items.
+        q.put_nowait(0)
+        q.put_nowait(1)
+        q.put_nowait(2)
+        q.put_nowait(3)
+        self.assertEqual([0, 1, 2], await getter)
+        self.assertEqual([3], q.get_nowait_batch())
+
+        getter = asyncio.create_task(q.get_many(1))
+        await asyncio.sleep(0)
+        await q.put_many([4, 5])
+        self.assertEqual([4], await getter)
+        self.assertEqual(1, q.qsize())
+
+    async def test_put_many(self):
+        q = asyncio.Queue()
+        await q.put_many(iter(range(3)))
+        await q.put_many([])
+        self.assertEqual(3, q.qsize())
+        self.assertEqual(3, q._unfinished_tasks)
+        self.assertEqual([0, 1, 2], q.get_nowait_batch())
+
+    async def test_put_many_wakes_getters(self):
+        q = asyncio.Queue()
+        getters = [asyncio.create_task(q.get()) for _ in range(3)]
+        await asyncio.sleep(0)
+        await q.put_many([1, 2])
+        await asyncio.sleep(0)
+        self.assertEqual([True, True, False], [t.done() for t in getters])
+        self.assertEqual({1, 2}, {getters[0].result(), getters[1].result()})
+        q.put_nowait(3)
+        self.assertEqual(3, await getters[2])
+
+    async def test_blocking_put_many(self):
+        q = asyncio.Queue(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        self.assertFalse(putter.done())
+        self.assertEqual(2, q.qsize())
+
+        items = []
+        while len(items) < 5:
+            items.extend(await q.get_many())
+        await putter
+        self.assertEqual([0, 1, 2, 3, 4], items)
+        self.assertTrue(q.empty())
+
+    async def test_get_nowait_batch_wakes_putters(self):
+        q = asyncio.Queue(maxsize=1)
+        q.put_nowait(0)
+        putters = [asyncio.create_task(q.put(i)) for i in range(1, 3)]
+        await asyncio.sleep(0)
+        self.assertEqual([0], q.get_nowait_batch())
+        await asyncio.sleep(0)
+        self.assertEqual([True, False], [t.done() for t in putters])
+        self.assertEqual([1], q.get_nowait_batch())
+        await putters[1]
+        self.assertEqual([2], q.get_nowait_batch())
+
+    async def test_put_many_cancelled(self):
+        q = asyncio.Queue(maxsize=2)
+        putter = asyncio.create_task(q.put_many(range(5)))
+        await asyncio.sleep(0)
+        putter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await putter
+        # The items added before the cancellation stay in the queue.
+        self.assertEqual([0, 1], q.get_nowait_batch())
+        self.assertEqual(0, len(q._putters))
+
+    async def test_get_many_cancelled(self):
+        q = asyncio.Queue()
+        getter = asyncio.create_task(q.get_many())
+        await asyncio.sleep(0)
+        getter.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await getter
+        self.assertEqual(0, len(q._getters))
+
+    async def test_order(self):
+        q = asyncio.LifoQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual([2, 3, 1], q.get_nowait_batch())
+
+        q = asyncio.PriorityQueue()
+        await q.put_many([1, 3, 2])
+        self.assertEqual([1, 2], await q.get_many(2))
+        self.assertEqual([3], await q.get_many(2))
+
+
 class LifoQueueTests(unittest.IsolatedAsyncioTestCase):
 
     async def test_order(self):
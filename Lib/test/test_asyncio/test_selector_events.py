@@ -791,6 +791,61 @@ def test_write_sendmsg_half_buffer(self):
         self.assertTrue(self.loop.writers)
         self.assertEqual(list_to_buffer([b'ta1', b'data2']), transport._buffer)
 
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_full(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 10
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines([b'data1', b'', bytearray(b'data2')])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertFalse(self.loop.writers)
+        self.assertEqual(list_to_buffer([]), transport._buffer)
+
+    @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
+    def test_writelines_sendmsg_partial(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.return_value = 7
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines(iter([b'data1', b'data2']))
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertEqual(list_to_buffer([b'ta2']), transport._buffer)
+
+        # Further writes are queued behind the pending data.
+        transport.writelines([b'data3'])
+        self.assertEqual(self.sock.sendmsg.call_count, 1)
+        self.assertEqual(list_to_buffer([b'ta2', b'data3']),
+                         transport._buffer)
+
+    def test_writelines_pauses_protocol(self):
+        self.sock.sendmsg = mock.Mock()
+        self.sock.sendmsg.side_effect = BlockingIOError
+        self.sock.send.side_effect = BlockingIOError
+
+        transport = self.socket_transport(sendmsg=True)
+        transport.set_write_buffer_limits(high=4)
+        transport.writelines([b'data1', b'data2'])
+        self.loop.assert_writer(7, transport._write_ready)
+        self.assertTrue(self.protocol.pause_writing.called)
+
+    def test_writelines_empty(self):
+        self.sock.sendmsg = mock.Mock()
+        transport = self.socket_transport(sendmsg=True)
+        transport.writelines(iter([]))
+        transport.writelines([b''])
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertFalse(self.loop.writers)
+
+    def test_writelines_after_connection_lost(self):
+        self.sock.sendmsg = mock.Mock()
+        transport = self.socket_transport(sendmsg=True)
+        transport._conn_lost = 1
+        transport.writelines([b'data'])
+        self.assertFalse(self.sock.sendmsg.called)
+        self.assertEqual(transport._conn_lost, 2)
+
     @unittest.skipUnless(selector_events._HAS_SENDMSG, 'no sendmsg')
     def test_write_sendmsg_OSError(self):
         data = memoryview(b'data')
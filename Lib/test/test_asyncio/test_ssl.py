@@ -1304,6 +1304,39 @@ async def client(addr):
         with self.tcp_server(run(server)) as srv:
             self.loop.run_until_complete(client(srv.addr))
 
+    def test_write_before_close_paused_reading(self):
+        # The data written just before close() is sent, even if reading is
+        # paused.
+        sslctx = self._create_server_ssl_context(
+            test_utils.ONLYCERT, test_utils.ONLYKEY)
+        client_sslctx = self._create_client_ssl_context()
+        received = None
+
+        async def handle_client(reader, writer):
+            nonlocal received
+            received = await reader.read()
+            writer.close()
+
+        async def main():
+            srv = await asyncio.start_server(
+                handle_client, '127.0.0.1', 0, ssl=sslctx)
+            try:
+                addr = srv.sockets[0].getsockname()
+                reader, writer = await asyncio.open_connection(
+                    *addr, ssl=client_sslctx, server_hostname='')
+                writer.transport.pause_reading()
+                writer.write(b'hello')
+                writer.close()
+                await self.wait_closed(writer)
+            finally:
+                srv.close()
+                await srv.wait_closed()
+
+        with self._silence_eof_received_warning():
+            self.loop.run_until_complete(
+                asyncio.wait_for(main(), support.SHORT_TIMEOUT))
+        self.assertEqual(received, b'hello')
+
     def test_remote_shutdown_receives_trailing_data(self):
         CHUNK = 1024 * 128
         SIZE = 32
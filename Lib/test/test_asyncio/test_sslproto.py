@@ -159,6 +159,131 @@ def test_write_after_closing(self):
         # should not raise
         self.assertIsNone(transp.write(b'data'))
 
+    def wrapped_protocol(self, proto=None):
+        ssl_proto = self.ssl_protocol(proto=proto)
+        self.connection_made(ssl_proto, do_handshake=mock.Mock())
+        self.assertEqual(ssl_proto._state, sslproto.SSLProtocolState.WRAPPED)
+        records = []
+
+        def write(data):
+            records.append(bytes(data))
+            return len(data)
+        ssl_proto._sslobj.write.side_effect = write
+        return ssl_proto, records
+
+    def test_small_writes_coalesced(self):
+        ssl_proto, records = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        transp.write(b'a' * 10)
+        transp.writelines([b'b' * 10, bytearray(b'c' * 10)])
+        transp.write(memoryview(b'd' * 10))
+        self.assertEqual(records, [])
+        self.assertEqual(transp.get_write_buffer_size(), 40)
+
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(records, [b'a' * 10 + b'b' * 10 + b'c' * 10
+                                   + b'd' * 10])
+        self.assertEqual(transp.get_write_buffer_size(), 0)
+
+    def test_large_writes_not_delayed(self):
+        ssl_proto, records = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        size = ssl_proto.record_size
+        transp.write(b'a' * 100)
+        transp.write(b'b' * size)
+        # The coalesced records are at most record_size bytes.
+        self.assertEqual(records, [b'a' * 100 + b'b' * (size - 100),
+                                   b'b' * 100])
+        self.assertEqual(ssl_proto._write_buffer_size, 0)
+
+        records.clear()
+        transp.write(b'c' * (3 * size))
+        self.assertEqual(records, [b'c' * (3 * size)])
+
+    def test_coalesced_write_retried(self):
+        ssl_proto, records = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        ssl_proto._sslobj.write.side_effect = ssl.SSLWantReadError
+        transp.write(b'abc')
+        transp.write(b'def')
+        test_utils.run_briefly(self.loop)
+        self.assertEqual(list(ssl_proto._write_backlog), [b'abc', b'def'])
+
+        # The same data is passed again, and a partial write only removes
+        # the data written from the backlog.
+        ssl_proto._sslobj.write.reset_mock(side_effect=True)
+        ssl_proto._sslobj.write.side_effect = [4, 2]
+        ssl_proto._do_write()
+        self.assertEqual(
+            [bytes(args[0]) for args, kwargs
+             in ssl_proto._sslobj.write.call_args_list],
+            [b'abcdef', b'ef'])
+        self.assertEqual(list(ssl_proto._write_backlog), [])
+        self.assertEqual(ssl_proto._write_buffer_size, 0)
+
+    def test_small_writes_sent_on_close(self):
+        # The pending small writes are sent when the transport is closed,
+        # even if reading is paused.
+        ssl_proto, records = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        transp.pause_reading()
+        transp.write(b'hello')
+        transp.close()
+        self.assertEqual(records, [b'hello'])
+        self.assertIsNone(ssl_proto._write_flush_handle)
+
+    def test_small_writes_sent_on_eof_paused(self):
+        # The same when the peer shuts down the connection while reading
+        # is paused.
+        ssl_proto, records = self.wrapped_protocol()
+        transp = ssl_proto._app_transport
+        transp.pause_reading()
+        transp.write(b'hello')
+        self.assertTrue(ssl_proto.eof_received())
+        self.assertEqual(ssl_proto._state,
+                         sslproto.SSLProtocolState.FLUSHING)
+        self.assertEqual(records, [b'hello'])
+
+    def test_write_flow_control(self):
+        proto = mock.Mock()
+        ssl_proto, records = self.wrapped_protocol(proto)
+        transp = ssl_proto._app_transport
+        transp.set_write_buffer_limits(high=15, low=0)
+        transp.write(b'a' * 10)
+        self.assertFalse(proto.pause_writing.called)
+        transp.write(b'b' * 10)
+        proto.pause_writing.assert_called_once_with()
+        test_utils.run_briefly(self.loop)
+        proto.resume_writing.assert_called_once_with()
+        self.assertEqual(records, [b'a' * 10 + b'b' * 10])
+
+    def test_read_copied(self):
+        proto = mock.Mock(spec=asyncio.Protocol)
+        ssl_proto, records = self.wrapped_protocol(proto)
+        plaintext = [b'x' * 5, b'y' * 7, b'z' * 3]
+
+        def read(n, buf):
+            if not plaintext:
+                raise ssl.SSLWantReadError
+            data = plaintext.pop(0)
+            if len(data) > n:
+                plaintext.insert(0, data[n:])
+                data = data[:n]
+            buf[:len(data)] = data
+            return len(data)
+        ssl_proto._sslobj.read.side_effect = read
+        ssl_proto._do_read()
+        proto.data_received.assert_called_once_with(b'x' * 5 + b'y' * 7
+                                                    + b'z' * 3)
+
+        # The data exceeding the buffer size is passed at once as well.
+        ssl_proto._ssl_buffer_view = memoryview(bytearray(8))
+        proto.data_received.reset_mock()
+        plaintext = [b'x' * 5, b'y' * 7, b'z' * 3]
+        ssl_proto._do_read()
+        proto.data_received.assert_called_once_with(b'x' * 5 + b'y' * 7
+                                                    + b'z' * 3)
+
 
 ##############################################################################
 # Start TLS Tests
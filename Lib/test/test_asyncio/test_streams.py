@@ -467,6 +467,103 @@ def test_readuntil_limit_found_sep(self):
 
         self.assertEqual(b'some dataAAA', stream._buffer)
 
+    def test_readuntil_many(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        read_task = self.loop.create_task(stream.readuntil_many())
+
+        def cb():
+            stream.feed_data(b'line1\nline2\nli')
+            stream.feed_data(b'ne3\nline')
+        self.loop.call_soon(cb)
+
+        lines = self.loop.run_until_complete(read_task)
+        self.assertEqual([b'line1\n', b'line2\n', b'line3\n'], lines)
+        self.assertEqual(b'line', stream._buffer)
+
+    def test_readuntil_many_max_items(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'aXXbXXcXXd')
+
+        lines = self.loop.run_until_complete(
+            stream.readuntil_many(b'XX', max_items=2))
+        self.assertEqual([b'aXX', b'bXX'], lines)
+        self.assertEqual(b'cXXd', stream._buffer)
+
+        lines = self.loop.run_until_complete(
+            stream.readuntil_many(b'XX', max_items=2))
+        self.assertEqual([b'cXX'], lines)
+        self.assertEqual(b'd', stream._buffer)
+
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.readuntil_many(max_items=0))
+
+    def test_readuntil_many_limit(self):
+        stream = asyncio.StreamReader(loop=self.loop, limit=3)
+        stream.feed_data(b'ab\ncd\nefghij\nk\n')
+
+        lines = self.loop.run_until_complete(stream.readuntil_many())
+        self.assertEqual([b'ab\n', b'cd\n'], lines)
+        self.assertEqual(b'efghij\nk\n', stream._buffer)
+
+        with self.assertRaisesRegex(asyncio.LimitOverrunError, 'is found'):
+            self.loop.run_until_complete(stream.readuntil_many())
+        self.assertEqual(b'efghij\nk\n', stream._buffer)
+
+    def test_readuntil_many_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(b'line1\npartial')
+        stream.feed_eof()
+
+        lines = self.loop.run_until_complete(stream.readuntil_many())
+        self.assertEqual([b'line1\n'], lines)
+
+        with self.assertRaises(asyncio.IncompleteReadError) as cm:
+            self.loop.run_until_complete(stream.readuntil_many())
+        self.assertEqual(cm.exception.partial, b'partial')
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readinto(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(4)
+        read_task = self.loop.create_task(stream.readinto(buf))
+
+        def cb():
+            stream.feed_data(b'chunk1')
+        self.loop.call_soon(cb)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(4, n)
+        self.assertEqual(b'chun', buf)
+        self.assertEqual(b'k1', stream._buffer)
+
+        n = self.loop.run_until_complete(stream.readinto(memoryview(buf)))
+        self.assertEqual(2, n)
+        self.assertEqual(b'k1un', buf)
+        self.assertEqual(b'', stream._buffer)
+
+    def test_readinto_zero_length(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.feed_data(self.DATA)
+        n = self.loop.run_until_complete(stream.readinto(bytearray()))
+        self.assertEqual(0, n)
+        self.assertEqual(self.DATA, stream._buffer)
+
+    def test_readinto_eof(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        buf = bytearray(4)
+        read_task = self.loop.create_task(stream.readinto(buf))
+        self.loop.call_soon(stream.feed_eof)
+
+        n = self.loop.run_until_complete(read_task)
+        self.assertEqual(0, n)
+        self.assertEqual(bytearray(4), buf)
+
+    def test_readinto_exception(self):
+        stream = asyncio.StreamReader(loop=self.loop)
+        stream.set_exception(ValueError())
+        with self.assertRaises(ValueError):
+            self.loop.run_until_complete(stream.readinto(bytearray(4)))
+
     def test_readexactly_zero_or_less(self):
         # Read exact number of bytes (zero or less).
         stream = asyncio.StreamReader(loop=self.loop)
@@ -2677,6 +2677,9 @@ class BaseTaskIntrospectionTests:
     _unregister_task = None
     _enter_task = None
     _leave_task = None
+    _register_eager_task = None
+    _unregister_eager_task = None
+    _swap_current_task = None
 
     def test__register_task_1(self):
         class TaskLike:
@@ -2783,12 +2786,39 @@ def test__unregister_task_not_registered(self):
         self._unregister_task(task)
         self.assertEqual(asyncio.all_tasks(loop), set())
 
+    def test__register_eager_task(self):
+        task = mock.Mock()
+        loop = mock.Mock()
+        task.get_loop = lambda: loop
+        task.done.return_value = False
+        self._register_eager_task(task)
+        self.assertEqual(asyncio.all_tasks(loop), {task})
+        self._unregister_eager_task(task)
+        self.assertEqual(asyncio.all_tasks(loop), set())
+        self._unregister_eager_task(task)
+
+    def test__swap_current_task(self):
+        task1 = mock.Mock()
+        task2 = mock.Mock()
+        loop = mock.Mock()
+        self.assertIsNone(self._swap_current_task(loop, task1))
+        self.assertIs(asyncio.current_task(loop), task1)
+        self.assertIs(self._swap_current_task(loop, task2), task1)
+        self.assertIs(asyncio.current_task(loop), task2)
+        self.assertIs(self._swap_current_task(loop, None), task2)
+        self.assertIsNone(asyncio.current_task(loop))
+        self.assertIsNone(self._swap_current_task(loop, None))
+        self.assertIsNone(asyncio.current_task(loop))
+
 
 class PyIntrospectionTests(test_utils.TestCase, BaseTaskIntrospectionTests):
     _register_task = staticmethod(tasks._py_register_task)
     _unregister_task = staticmethod(tasks._py_unregister_task)
     _enter_task = staticmethod(tasks._py_enter_task)
     _leave_task = staticmethod(tasks._py_leave_task)
+    _register_eager_task = staticmethod(tasks._py_register_eager_task)
+    _unregister_eager_task = staticmethod(tasks._py_unregister_eager_task)
+    _swap_current_task = staticmethod(tasks._py_swap_current_task)
 
 
 @unittest.skipUnless(hasattr(tasks, '_c_register_task'),
@@ -2799,8 +2829,13 @@ class CIntrospectionTests(test_utils.TestCase, BaseTaskIntrospectionTests):
         _unregister_task = staticmethod(tasks._c_unregister_task)
         _enter_task = staticmethod(tasks._c_enter_task)
         _leave_task = staticmethod(tasks._c_leave_task)
+        _register_eager_task = staticmethod(tasks._c_register_eager_task)
+        _unregister_eager_task = staticmethod(tasks._c_unregister_eager_task)
+        _swap_current_task = staticmethod(tasks._c_swap_current_task)
     else:
         _register_task = _unregister_task = _enter_task = _leave_task = None
+        _register_eager_task = _unregister_eager_task = None
+        _swap_current_task = None
 
 
 class BaseCurrentLoopTests:
@@ -65,6 +65,10 @@ def sleep_and_raise(t):
     time.sleep(t)
     raise Exception('this is an exception')
 
+def sleep_and_return(t):
+    time.sleep(t)
+    return t
+
 def sleep_and_print(t, msg):
     time.sleep(t)
     print(msg)
@@ -150,6 +154,10 @@ class ThreadPoolMixin(ExecutorMixin):
     executor_type = futures.ThreadPoolExecutor
 
 
+class WorkStealingThreadPoolMixin(ExecutorMixin):
+    executor_type = futures.WorkStealingThreadPoolExecutor
+
+
 class ProcessPoolForkMixin(ExecutorMixin):
     executor_type = futures.ProcessPoolExecutor
     ctx = "fork"
@@ -192,6 +200,7 @@ def get_context(self):
 
 def create_executor_tests(mixin, bases=(BaseTestCase,),
                           executor_mixins=(ThreadPoolMixin,
+                                           WorkStealingThreadPoolMixin,
                                            ProcessPoolForkMixin,
                                            ProcessPoolForkserverMixin,
                                            ProcessPoolSpawnMixin)):
@@ -492,6 +501,58 @@ def test_cancel_futures_wait_false(self):
         self.assertEqual(out.strip(), b"apple")
 
 
+class WorkStealingThreadPoolShutdownTest(WorkStealingThreadPoolMixin,
+                                         ExecutorShutdownTest, BaseTestCase):
+    def test_threads_terminate(self):
+        def acquire_lock(lock):
+            lock.acquire()
+
+        sem = threading.Semaphore(0)
+        for i in range(3):
+            self.executor.submit(acquire_lock, sem)
+        self.assertEqual(len(self.executor._threads), 3)
+        for i in range(3):
+            sem.release()
+        self.executor.shutdown()
+        for t in self.executor._threads:
+            t.join()
+
+    def test_del_shutdown(self):
+        executor = futures.WorkStealingThreadPoolExecutor(max_workers=5)
+        res = executor.map(abs, range(-5, 5))
+        threads = executor._threads
+        del executor
+
+        for t in threads:
+            t.join()
+
+        # Make sure the results were all computed before the
+        # executor got shutdown.
+        assert all([r == abs(v) for r, v in zip(res, range(-5, 5))])
+
+    def test_idle_timeout(self):
+        executor = futures.WorkStealingThreadPoolExecutor(
+            max_workers=3, idle_timeout=0.01)
+        barrier = threading.Barrier(3)
+        fs = [executor.submit(barrier.wait) for _ in range(3)]
+        futures.wait(fs)
+        threads = list(executor._threads)
+        self.assertEqual(len(threads), 3)
+        # The idle threads exit.
+        for t in threads:
+            t.join(support.SHORT_TIMEOUT)
+            self.assertFalse(t.is_alive())
+        self.assertEqual(executor._threads, set())
+        self.assertEqual(executor._workers, [])
+        # New threads are started when needed.
+        self.assertEqual(executor.submit(mul, 6, 7).result(), 42)
+        self.assertEqual(len(executor._threads), 1)
+        executor.shutdown()
+
+        with self.assertRaises(ValueError):
+            futures.WorkStealingThreadPoolExecutor(idle_timeout=0)
+
+
 class ProcessPoolShutdownTest(ExecutorShutdownTest):
     def test_processes_terminate(self):
         def acquire_lock(lock):
@@ -704,6 +765,11 @@ def future_func():
             sys.setswitchinterval(oldswitchinterval)
 
 
+class WorkStealingThreadPoolWaitTests(WorkStealingThreadPoolMixin, WaitTests,
+                                      BaseTestCase):
+    pass
+
+
 create_executor_tests(WaitTests,
                       executor_mixins=(ProcessPoolForkMixin,
                                        ProcessPoolForkserverMixin,
@@ -845,6 +911,67 @@ def test_map_timeout(self):
 
         self.assertEqual([None, None], results)
 
+    def test_submit_many(self):
+        fs = self.executor.submit_many(pow, range(10), range(10))
+        self.assertIsInstance(fs, list)
+        self.assertEqual([f.result() for f in fs],
+                         list(map(pow, range(10), range(10))))
+        self.assertEqual(self.executor.submit_many(pow, [], []), [])
+        fs = self.executor.submit_many(divmod, [1, 1], [2, 0])
+        self.assertEqual(fs[0].result(), (0, 1))
+        self.assertRaises(ZeroDivisionError, fs[1].result)
+
+    def test_map_buffersize(self):
+        consumed = []
+        def args():
+            for i in itertools.count():
+                consumed.append(i)
+                yield i
+
+        results = self.executor.map(abs, args(), buffersize=4)
+        # The iterable is consumed lazily.
+        self.assertEqual(consumed, [0, 1, 2, 3])
+        self.assertEqual(list(itertools.islice(results, 10)), list(range(10)))
+        self.assertLessEqual(len(consumed), 10 + 4)
+        results.close()
+
+        self.assertEqual(
+                list(self.executor.map(pow, range(10), range(10),
+                                       buffersize=3, chunksize=2)),
+                list(map(pow, range(10), range(10))))
+        for buffersize in (0, -1):
+            with self.assertRaises(ValueError):
+                self.executor.map(abs, range(10), buffersize=buffersize)
+
+    def test_map_unordered(self):
+        self.assertCountEqual(
+                list(self.executor.map(pow, range(10), range(10),
+                                       ordered=False)),
+                list(map(pow, range(10), range(10))))
+        self.assertCountEqual(
+                list(self.executor.map(pow, range(10), range(10),
+                                       ordered=False, buffersize=3,
+                                       chunksize=3)),
+                list(map(pow, range(10), range(10))))
+
+        # The result of a fast call is returned before a slow one.
+        self.assertEqual(
+                list(self.executor.map(sleep_and_return, [1.0, 0],
+                                       ordered=False)),
+                [0, 1.0])
+
+    def test_map_unordered_exception(self):
+        i = self.executor.map(divmod, [1, 1], [0, 0], ordered=False)
+        self.assertRaises(ZeroDivisionError, i.__next__)
+
+    def test_map_unordered_timeout(self):
+        results = []
+        with self.assertRaises(futures.TimeoutError):
+            for i in self.executor.map(time.sleep, [0, 0, 6], timeout=5,
+                                       ordered=False):
+                results.append(i)
+        self.assertEqual([None, None], results)
+
     def test_shutdown_race_issue12456(self):
         # Issue #12456: race condition at shutdown where trying to post a
         # sentinel in the call queue blocks (the queue is full while processes
@@ -964,6 +1091,63 @@ def log_n_wait(ident):
         self.assertListEqual(log, ["ident='first' started", "ident='first' stopped"])
 
 
+class WorkStealingThreadPoolExecutorTest(WorkStealingThreadPoolMixin,
+                                         ExecutorTest, BaseTestCase):
+    def test_default_workers(self):
+        executor = self.executor_type()
+        expected = min(32, (os.cpu_count() or 1) + 4)
+        self.assertEqual(executor._max_workers, expected)
+
+    def test_local_submissions(self):
+        # Calls submitted from a worker thread are queued to its own queue.
+        executor = self.executor_type(max_workers=1)
+        def submit_children():
+            worker = futures.thread._current_worker.worker
+            fs = executor.submit_many(mul, range(10), range(10))
+            fs.append(executor.submit(mul, 10, 10))
+            return len(worker.items), fs
+
+        nitems, fs = executor.submit(submit_children).result()
+        self.assertEqual(nitems, 11)
+        self.assertEqual([f.result() for f in fs],
+                         [i * i for i in range(11)])
+        executor.shutdown()
+
+    def test_work_stealing(self):
+        # The calls queued to a busy worker are run by the other workers.
+        executor = self.executor_type(max_workers=2)
+        executor.submit(mul, 1, 2).result()
+
+        def block():
+            fs = executor.submit_many(lambda _: threading.get_ident(),
+                                      range(5))
+            # Block until all the calls are run by the other worker.
+            futures.wait(fs, timeout=support.SHORT_TIMEOUT)
+            return threading.get_ident(), fs
+
+        ident, fs = executor.submit(block).result(support.SHORT_TIMEOUT)
+        executor.shutdown()
+        self.assertTrue(all(f.done() for f in fs))
+        self.assertNotIn(ident, {f.result() for f in fs})
+
+    def test_fanout(self):
+        lock = threading.Lock()
+        done = threading.Event()
+        remaining = sum(3 ** i for i in range(6))
+
+        def task(depth):
+            nonlocal remaining
+            if depth:
+                self.executor.submit_many(task, [depth - 1] * 3)
+            with lock:
+                remaining -= 1
+                if not remaining:
+                    done.set()
+
+        self.executor.submit(task, 5)
+        self.assertTrue(done.wait(support.SHORT_TIMEOUT))
+
+
 class ProcessPoolExecutorTest(ExecutorTest):
 
     @unittest.skipUnless(sys.platform=='win32', 'Windows-only process limit')
@@ -1000,6 +1184,48 @@ def bad_map():
             ref)
         self.assertRaises(ValueError, bad_map)
 
+    def test_map_adaptive_chunksize(self):
+        ref = list(map(pow, range(1000), range(1000)))
+        self.assertEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize=None)),
+            ref)
+        self.assertCountEqual(
+            list(self.executor.map(pow, range(1000), range(1000),
+                                   chunksize=None, ordered=False)),
+            ref)
+        # The iterable is consumed lazily.
+        results = self.executor.map(abs, itertools.count(), chunksize=None)
+        self.assertEqual(list(itertools.islice(results, 1000)),
+                         list(range(1000)))
+        results.close()
+
+    def test_chunk_sizer(self):
+        sizer = futures.process._ChunkSizer(duration=0.01,
+                                            max_chunksize=1000)
+        self.assertEqual(sizer.chunksize, 1)
+        # The chunksize grows at most by a factor 2 per chunk.
+        sizer.update(1, 0.0001)
+        self.assertEqual(sizer.chunksize, 2)
+        for _ in range(3):
+            sizer.update(sizer.chunksize, 0.0001 * sizer.chunksize)
+        self.assertEqual(sizer.chunksize, 16)
+        for _ in range(10):
+            sizer.update(sizer.chunksize, 0.0001 * sizer.chunksize)
+        self.assertEqual(sizer.chunksize, 100)
+        # Slower calls shrink the chunks.
+        for _ in range(30):
+            sizer.update(sizer.chunksize, 0.005 * sizer.chunksize)
+        self.assertEqual(sizer.chunksize, 2)
+        sizer.update(10, 1.0)
+        self.assertEqual(sizer.chunksize, 1)
+        # Calls too fast to be measured.
+        sizer = futures.process._ChunkSizer(duration=0.01,
+                                            max_chunksize=1000)
+        for _ in range(20):
+            sizer.update(sizer.chunksize, 0.0)
+        self.assertEqual(sizer.chunksize, 1000)
+
     @classmethod
     def _test_traceback(cls):
         raise RuntimeError(123) # some comment
@@ -1129,6 +1355,56 @@ def test_max_tasks_early_shutdown(self):
         for i, future in enumerate(futures):
             self.assertEqual(future.result(), mul(i, i))
 
+    @unittest.skipIf(sys.platform == 'win32', 'Unix only')
+    def test_shared_memory_threshold(self):
+        import_helper.import_module('multiprocessing.shared_memory')
+        # not using self.executor as we need to control construction.
+        executor = self.executor_type(
+                2, mp_context=self.get_context(), shared_memory_threshold=1024)
+        data = b'abc' * 1000
+        for args, kwargs in [((data, 2), {}),
+                             ((), {'x': data, 'y': 2}),
+                             ((bytearray(data), 2), {}),
+                             ((2, 3), {}),
+                             ((b'abc', 2), {})]:
+            with self.subTest(args=args, kwargs=kwargs):
+                expected = mul(*args, **kwargs)
+                result = executor.submit(mul, *args, **kwargs).result()
+                self.assertEqual(result, expected)
+                self.assertIs(type(result), type(expected))
+        self.assertEqual(list(executor.map(mul, [data] * 10, range(10),
+                                           chunksize=3)),
+                         [data * i for i in range(10)])
+        executor.shutdown()
+
+    @unittest.skipIf(sys.platform == 'win32', 'Unix only')
+    def test_shared_memory_payload(self):
+        shared_memory = import_helper.import_module(
+                'multiprocessing.shared_memory')
+        payload = futures.process._SharedMemoryPayload(
+                [b'x' * 100, bytearray(b'y' * 100), (b'z' * 10, 1)], 100)
+        rebuild, args = payload.__reduce__()
+        data, segments = args
+        self.assertEqual(len(segments), 2)
+        self.assertEqual([size for name, size in segments], [100, 100])
+        self.assertNotIn(b'x' * 100, data)
+        self.assertNotIn(b'y' * 100, data)
+        result = rebuild(*args)
+        self.assertEqual(result,
+                         [b'x' * 100, bytearray(b'y' * 100), (b'z' * 10, 1)])
+        self.assertIs(type(result[0]), bytes)
+        self.assertIs(type(result[1]), bytearray)
+        # The segments are unlinked once the payload is unpickled.
+        for name, size in segments:
+            with self.assertRaises(FileNotFoundError):
+                shared_memory.SharedMemory(name)
+
+    def test_shared_memory_threshold_invalid(self):
+        with self.assertRaises(TypeError):
+            self.executor_type(1, shared_memory_threshold=1.5)
+        with self.assertRaises(ValueError):
+            self.executor_type(1, shared_memory_threshold=0)
+
 
 create_executor_tests(ProcessPoolExecutorTest,
                       executor_mixins=(ProcessPoolForkMixin,
@@ -857,6 +857,25 @@ def test_can_represent_stream_with_int_name(self):
         h = logging.StreamHandler(StreamWithIntName())
         self.assertEqual(repr(h), '<StreamHandler 2 (NOTSET)>')
 
+    def test_handle_batch(self):
+        # The records are filtered, and the stream is flushed once.
+        class FlushCountingStream(io.StringIO):
+            flushes = 0
+            def flush(self):
+                self.flushes += 1
+                super().flush()
+
+        stream = FlushCountingStream()
+        h = logging.StreamHandler(stream)
+        h.addFilter(lambda record: record.msg != 'skipped')
+        h.handle_batch([logging.makeLogRecord({'msg': msg})
+                        for msg in ('a', 'skipped', 'b')])
+        self.assertEqual(stream.getvalue(), 'a\nb\n')
+        self.assertEqual(stream.flushes, 1)
+        h.handle(logging.makeLogRecord({'msg': 'c'}))
+        self.assertEqual(stream.getvalue(), 'a\nb\nc\n')
+        self.assertEqual(stream.flushes, 2)
+
 # -- The following section could be moved into a server_helper.py module
 # -- if it proves to be of wider utility than just test_logging
 
@@ -3496,6 +3515,37 @@ def test_custom_formatter_class_with_validate(self):
         handler = logging.getLogger("my_test_logger_custom_formatter").handlers[0]
         self.assertIsInstance(handler.formatter, ExceptionFormatter)
 
+    def test_structured_formatter(self):
+        config = {
+            'version': 1,
+            'formatters': {
+                'json': {
+                    'class': 'logging.JSONFormatter',
+                    'format': '{levelname} {message}',
+                    'style': '{',
+                },
+                'logfmt': {
+                    '()': 'logging.LogfmtFormatter',
+                    'fmt': '%(message)s %(user)s',
+                    'defaults': {'user': 'nobody'},
+                },
+            },
+            'handlers': {
+                'json': {'class': 'logging.StreamHandler',
+                         'formatter': 'json'},
+                'logfmt': {'class': 'logging.StreamHandler',
+                           'formatter': 'logfmt'},
+            },
+        }
+        self.apply_config(config)
+        r = logging.makeLogRecord({'msg': 'hi', 'levelname': 'INFO'})
+        f = logging.getHandlerByName('json').formatter
+        self.assertIsInstance(f, logging.JSONFormatter)
+        self.assertEqual(f.format(r), '{"levelname": "INFO", "message": "hi"}')
+        f = logging.getHandlerByName('logfmt').formatter
+        self.assertIsInstance(f, logging.LogfmtFormatter)
+        self.assertEqual(f.format(r), 'message=hi user=nobody')
+
     def test_custom_formatter_class_with_validate2(self):
         self.apply_config(self.custom_formatter_class_validate2)
         handler = logging.getLogger("my_test_logger_custom_formatter").handlers[0]
@@ -3646,6 +3696,24 @@ def do_queuehandler_configuration(self, qspec, lspec):
             else:
                 self.addCleanup(os.remove, fn)
 
+    @threading_helper.requires_working_threading()
+    def test_config_queue_handler_batches(self):
+        cd = copy.deepcopy(self.config_queue_handler)
+        fn = make_temp_file('.log', 'test_logging-cqh-')
+        cd['handlers']['h1']['filename'] = fn
+        cd['handlers']['ah']['defer_format'] = True
+        cd['handlers']['ah']['max_batch'] = 100
+        self.apply_config(cd)
+        qh = logging.getHandlerByName('ah')
+        self.addCleanup(closeFileHandler, logging.getHandlerByName('h1'), fn)
+        self.assertTrue(qh.defer_format)
+        self.assertEqual(qh.listener.max_batch, 100)
+        logging.warning('foo %s', 'bar')
+        qh.listener.start()
+        qh.listener.stop()
+        with open(fn, encoding='utf-8') as f:
+            self.assertEqual(f.read().splitlines(), ['foo bar'])
+
     @threading_helper.requires_working_threading()
     def test_config_queue_handler(self):
         q = CustomQueue()
@@ -3905,6 +3973,65 @@ def test_queue_listener_with_multiple_handlers(self):
         listener.stop()
         self.assertEqual(self.stream.getvalue().strip(), "que -> ERROR: error")
 
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_queue_listener_batches(self):
+        batches = []
+        class BatchHandler(logging.Handler):
+            def emit_batch(self, records):
+                batches.append([record.getMessage() for record in records])
+
+        handler = BatchHandler()
+        handler.setLevel(logging.ERROR)
+        # With and without a get_many() method
+        for q in (queue.Queue(), queue.SimpleQueue()):
+            with self.subTest(queue=type(q).__name__):
+                batches.clear()
+                self.que_hdlr.queue = q
+                for i in range(5):
+                    self.que_logger.error('%d', i)
+                listener = logging.handlers.QueueListener(q, handler,
+                                                          max_batch=3)
+                listener.start()
+                listener.stop()
+                self.assertEqual(batches, [['0', '1', '2'], ['3', '4']])
+
+                # The level of the handlers is checked for each record.
+                batches.clear()
+                self.que_logger.error('5')
+                self.que_logger.warning('6')
+                self.que_logger.error('7')
+                listener = logging.handlers.QueueListener(
+                    q, handler, respect_handler_level=True, max_batch=10)
+                listener.start()
+                listener.stop()
+                self.assertEqual(batches, [['5', '7']])
+                self.assertTrue(q.empty())
+
+        with self.assertRaises(ValueError):
+            logging.handlers.QueueListener(q, handler, max_batch=0)
+
+    @unittest.skipUnless(hasattr(logging.handlers, 'QueueListener'),
+                         'logging.handlers.QueueListener required for this test')
+    def test_defer_format(self):
+        q = queue.SimpleQueue()
+        self.que_hdlr.queue = q
+        self.que_hdlr.defer_format = True
+        self.que_logger.error('message %s', 'arg')
+        record = q.get_nowait()
+        self.assertEqual((record.msg, record.args), ('message %s', ('arg',)))
+        self.assertFalse(hasattr(record, 'message'))
+
+        # The records are formatted by the handlers of the listener.
+        listener = logging.handlers.QueueListener(q, self.root_hdlr,
+                                                  max_batch=10)
+        self.que_logger.error('message %d', 1)
+        self.que_logger.error('message %d', 2)
+        listener.start()
+        listener.stop()
+        self.assertEqual(self.stream.getvalue().splitlines(),
+                         ['que -> ERROR: message 1', 'que -> ERROR: message 2'])
+
 if hasattr(logging.handlers, 'QueueListener'):
     import multiprocessing
     from unittest.mock import patch
@@ -4310,6 +4437,24 @@ def test_issue_89047(self):
             s = f.format(r)
             self.assertNotIn('.1000', s)
 
+    def test_time_cache(self):
+        r = self.get_record()
+        r.created = 1000.5
+        r.msecs = 500
+        f = logging.Formatter()
+        f.converter = time.gmtime
+        self.assertEqual(f.formatTime(r), '1970-01-01 00:16:40,500')
+        r.created = 1000.75
+        r.msecs = 750
+        self.assertEqual(f.formatTime(r), '1970-01-01 00:16:40,750')
+        self.assertEqual(f.formatTime(r, '%H:%M'), '00:16')
+        r.created = 1001.25
+        self.assertEqual(f.formatTime(r, '%S'), '41')
+        f.converter = lambda t: time.gmtime(t + 3600)
+        self.assertEqual(f.formatTime(r, '%H:%M:%S'), '01:16:41')
+        f.default_time_format = '%M:%S'
+        self.assertEqual(f.formatTime(r), '16:41,750')
+
 
 class TestBufferingFormatter(logging.BufferingFormatter):
     def formatHeader(self, records):
@@ -4337,6 +4482,86 @@ def test_custom(self):
         f = TestBufferingFormatter(lf)
         self.assertEqual('[(2)<one><two>(2)]', f.format(self.records))
 
+class StructuredFormatterTest(unittest.TestCase):
+    def get_record(self, **kwargs):
+        r = logging.LogRecord('formatter.test', logging.INFO,
+                              os.path.join('path', 'to', 'dummy.py'), 42,
+                              'Message with %d %s', (2, 'placeholders'), None)
+        r.created = 1000.5
+        r.msecs = 500.0
+        r.__dict__.update(kwargs)
+        return r
+
+    def test_fields(self):
+        for fmt, style in (('%(levelname)s %(name)-10s: %(message)s %(name)s',
+                            '%'),
+                           ('{levelname} {name.upper}: {message} {name!r}',
+                            '{'),
+                           ('$levelname ${name}: $message $$x', '$')):
+            with self.subTest(style=style):
+                f = logging.JSONFormatter(fmt, style=style)
+                self.assertEqual(f.fields, ('levelname', 'name', 'message'))
+                self.assertFalse(f.usesTime())
+        f = logging.JSONFormatter()
+        self.assertEqual(f.fields, f.default_fields)
+        self.assertTrue(f.usesTime())
+        self.assertRaises(ValueError, logging.JSONFormatter, 'spam')
+        self.assertRaises(NotImplementedError,
+                          logging.StructuredFormatter().format,
+                          self.get_record())
+
+    def test_json(self):
+        f = logging.JSONFormatter('%(asctime)s %(levelname)s %(lineno)d '
+                                  '%(msecs)d %(message)s %(custom)s %(args)s')
+        f.converter = time.gmtime
+        s = f.format(self.get_record(custom=None))
+        self.assertNotIn('\n', s)
+        self.assertEqual(json.loads(s), {
+            'asctime': '1970-01-01 00:16:40,500',
+            'levelname': 'INFO',
+            'lineno': 42,
+            'msecs': 500.0,
+            'message': 'Message with 2 placeholders',
+            'custom': None,
+            'args': [2, 'placeholders'],
+        })
+        # Missing fields are left out, and values are converted with str()
+        # if JSON can't represent them.
+        f = logging.JSONFormatter('{message} {custom}', style='{')
+        self.assertEqual(json.loads(f.format(self.get_record())),
+                         {'message': 'Message with 2 placeholders'})
+        self.assertEqual(json.loads(f.format(self.get_record(custom={1}))),
+                         {'message': 'Message with 2 placeholders',
+                          'custom': '{1}'})
+        f = logging.JSONFormatter('%(message)s %(custom)s',
+                                  defaults={'custom': 'é\n"'})
+        self.assertEqual(f.format(self.get_record()),
+                         '{"message": "Message with 2 placeholders", '
+                         '"custom": "\\u00e9\\n\\""}')
+
+    def test_json_exception(self):
+        f = logging.JSONFormatter('%(message)s')
+        try:
+            1 / 0
+        except ZeroDivisionError:
+            r = self.get_record(exc_info=sys.exc_info(), stack_info='Stack')
+        d = json.loads(f.format(r))
+        self.assertEqual(list(d), ['message', 'exc_info', 'stack_info'])
+        self.assertTrue(d['exc_info'].startswith('Traceback'))
+        self.assertTrue(d['exc_info'].endswith('ZeroDivisionError: '
+                                               'division by zero'))
+        self.assertEqual(d['exc_info'], r.exc_text)
+        self.assertEqual(d['stack_info'], 'Stack')
+
+    def test_logfmt(self):
+        f = logging.LogfmtFormatter('%(levelname)s %(lineno)s %(message)s '
+                                    '%(a)s %(b)s %(c)s %(d)s %(e)s')
+        r = self.get_record(a=None, b=True, c='', d='x=1', e='"\\\t')
+        self.assertEqual(f.format(r),
+                         'levelname=INFO lineno=42 '
+                         'message="Message with 2 placeholders" '
+                         'a= b=true c="" d="x=1" e="\\"\\\\\\t"')
+
 class ExceptionTest(BaseTest):
     def test_formatting(self):
         r = self.root_logger
@@ -5567,6 +5792,84 @@ def test_emit_after_closing_in_write_mode(self):
         with open(self.fn) as fp:
             self.assertEqual(fp.read().strip(), '1')
 
+    def read_log(self):
+        with open(self.fn, encoding='utf-8') as fp:
+            return fp.read().split()
+
+    def test_buffered(self):
+        fh = logging.FileHandler(self.fn, encoding='utf-8',
+                                 flush_interval=3600)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handle(self.next_rec())
+        thread, stop = fh._flusher
+        self.addCleanup(threading_helper.join_thread, thread)
+        self.addCleanup(fh.close)
+        fh.handle(self.next_rec())
+        self.assertEqual(self.read_log(), [])
+        # A record of flush_level or higher is written immediately
+        r = self.next_rec()
+        r.levelno = logging.ERROR
+        fh.handle(r)
+        self.assertEqual(self.read_log(), ['1', '2', '3'])
+        fh.handle_batch([self.next_rec(), self.next_rec()])
+        self.assertEqual(len(self.read_log()), 3)
+        fh.flush()
+        self.assertEqual(self.read_log(), ['1', '2', '3', '4', '5'])
+        fh.handle(self.next_rec())
+        fh.close()
+        self.assertEqual(self.read_log(), ['1', '2', '3', '4', '5', '6'])
+        self.assertTrue(stop.is_set())
+        self.assertIsNone(fh._flusher)
+
+    @threading_helper.requires_working_threading()
+    def test_buffered_flush_interval(self):
+        fh = logging.FileHandler(self.fn, encoding='utf-8',
+                                 flush_interval=0.01)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handle(self.next_rec())
+        thread, stop = fh._flusher
+        try:
+            for _ in support.sleeping_retry(support.SHORT_TIMEOUT):
+                if self.read_log():
+                    break
+            self.assertEqual(self.read_log(), ['1'])
+        finally:
+            fh.close()
+            threading_helper.join_thread(thread)
+
+    def test_buffered_shutdown(self):
+        fh = logging.FileHandler(self.fn, encoding='utf-8',
+                                 flush_interval=3600)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.handle(self.next_rec())
+        thread, stop = fh._flusher
+        logging.shutdown([weakref.ref(fh)])
+        self.assertEqual(self.read_log(), ['1'])
+        threading_helper.join_thread(thread)
+
+    def test_buffered_no_thread(self):
+        # At interpreter shutdown, threads can't be started: the records
+        # are flushed synchronously.
+        from unittest.mock import patch
+        def fail(self):
+            raise RuntimeError("can't create new thread at interpreter "
+                               "shutdown")
+        fh = logging.FileHandler(self.fn, encoding='utf-8',
+                                 flush_interval=3600)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        try:
+            with patch.object(threading.Thread, 'start', fail):
+                fh.handle(self.next_rec())
+            self.assertIsNone(fh._flusher)
+            self.assertEqual(self.read_log(), ['1'])
+        finally:
+            fh.close()
+
+    def test_buffered_invalid_flush_interval(self):
+        with self.assertRaises(ValueError):
+            logging.FileHandler(self.fn, encoding='utf-8', flush_interval=0)
+
+
 class RotatingFileHandlerTest(BaseFileTest):
     @unittest.skipIf(support.is_wasi, "WASI does not have /dev/null.")
     def test_should_not_rollover(self):
@@ -5675,6 +5978,81 @@ def rotator(source, dest):
         self.assertFalse(os.path.exists(namer(self.fn + ".3")))
         rh.close()
 
+    def test_size_tracking(self):
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=1, maxBytes=1000)
+        self.addCleanup(rh.close)
+        for msg in ('ascii', 'caf\xe9', '\u20ac\n2 lines', 'x' * 100):
+            rh.handle(logging.makeLogRecord({'msg': msg}))
+            self.assertEqual(rh._size, os.path.getsize(self.fn))
+        # The size is counted, not measured for each record
+        with support.swap_attr(rh.stream, 'seek', None), \
+             support.swap_attr(os.path, 'isfile', None):
+            rh.handle(logging.makeLogRecord({'msg': 'more'}))
+        self.assertEqual(rh._size, os.path.getsize(self.fn))
+        rh.maxBytes = rh._size + 5
+        self.assertFalse(rh.shouldRollover(logging.makeLogRecord({'msg': '123'})))
+        self.assertTrue(rh.shouldRollover(logging.makeLogRecord({'msg': '1234'})))
+        rh.handle(logging.makeLogRecord({'msg': '1234'}))
+        self.assertLogFile(self.fn + ".1")
+        with open(self.fn, encoding="utf-8") as f:
+            self.assertEqual(f.read(), '1234\n')
+        # The size of the new file is measured again
+        rh.handle(logging.makeLogRecord({'msg': '5'}))
+        self.assertEqual(rh._size, os.path.getsize(self.fn))
+
+    @support.requires_zlib()
+    def test_compress(self):
+        import gzip
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=2, maxBytes=1,
+            compress=True)
+        self.assertEqual(rh.rotation_filename(self.fn + ".1"),
+                         self.fn + ".1.gz")
+        records = [self.next_rec() for _ in range(4)]
+        for r in records:
+            rh.emit(r)
+        rh.close()
+        self.assertIsNone(rh._compressor)
+        newline = os.linesep.encode()
+        for i, r in ((1, records[2]), (2, records[1])):
+            fn = self.fn + ".%d.gz" % i
+            self.assertLogFile(fn)
+            with gzip.open(fn) as f:
+                self.assertEqual(f.read(), r.msg.encode() + newline)
+            self.assertFalse(os.path.exists(self.fn + ".%d" % i))
+        self.assertFalse(os.path.exists(self.fn + ".3.gz"))
+        dirname, basename = os.path.split(self.fn)
+        self.assertEqual([fn for fn in os.listdir(dirname)
+                          if fn.startswith('.' + basename)], [])
+
+    def test_compress_error(self):
+        import gzip
+        from unittest.mock import patch
+        rh = logging.handlers.RotatingFileHandler(
+            self.fn, encoding="utf-8", backupCount=2, maxBytes=1,
+            compress=True)
+        errors = []
+        def handleError(record):
+            errors.append((sys.exc_info()[0], record.getMessage()))
+        rh.handleError = handleError
+        def fail(*args):
+            raise OSError('disk full')
+        rh.emit(self.next_rec())
+        with patch.object(gzip.GzipFile, 'write', fail):
+            rh.emit(self.next_rec())
+            rh._wait_for_compression()
+        rh.close()
+        self.assertEqual(errors, [
+            (OSError, 'Unable to compress %r to %r'
+                      % (self.fn + ".1", self.fn + ".1.gz"))])
+        # The uncompressed file is kept, and the temporary file removed.
+        self.assertLogFile(self.fn + ".1")
+        self.assertFalse(os.path.exists(self.fn + ".1.gz"))
+        dirname, basename = os.path.split(self.fn)
+        self.assertEqual([fn for fn in os.listdir(dirname)
+                          if fn.startswith('.' + basename)], [])
+
 class TimedRotatingFileHandlerTest(BaseFileTest):
     @unittest.skipIf(support.is_wasi, "WASI does not have /dev/null.")
     def test_should_not_rollover(self):
@@ -5729,6 +6107,28 @@ def test_rollover(self):
                     print(tf.read())
         self.assertTrue(found, msg=msg)
 
+    @support.requires_zlib()
+    def test_compress(self):
+        import gzip
+        fh = logging.handlers.TimedRotatingFileHandler(
+            self.fn, 'S', encoding="utf-8", backupCount=1, utc=True,
+            compress=True)
+        fh.setFormatter(logging.Formatter('%(message)s'))
+        fh.emit(logging.makeLogRecord({'msg': 'first'}))
+        fh.rolloverAt = 1000 + fh.interval
+        fh.doRollover()
+        fn1 = self.fn + '.1970-01-01_00-16-40.gz'
+        fh.emit(logging.makeLogRecord({'msg': 'second'}))
+        fh.rolloverAt = 2000 + fh.interval
+        fh.doRollover()
+        fn2 = self.fn + '.1970-01-01_00-33-20.gz'
+        fh.close()
+        self.assertFalse(os.path.exists(fn1))
+        self.assertFalse(os.path.exists(fn2.removesuffix('.gz')))
+        self.assertLogFile(fn2)
+        with gzip.open(fn2) as f:
+            self.assertEqual(f.read(), b'second' + os.linesep.encode())
+
     def test_invalid(self):
         assertRaises = self.assertRaises
         assertRaises(ValueError, logging.handlers.TimedRotatingFileHandler,
@@ -541,6 +541,93 @@ def test_negative_timeout_raises_exception(self):
         q.put(1)
         with self.assertRaises(ValueError):
             q.get(timeout=-1)
+        with self.assertRaises(ValueError):
+            q.get_many(timeout=-1)
+
+    def test_get_many(self):
+        q = self.q
+        self.assertEqual(q.maxsize, 0)
+        self.assertFalse(q.full())
+        q.put_many(range(5))
+        q.put_many(iter([5, 6]))
+        self.assertEqual(q.qsize(), 7)
+        self.assertEqual(q.get_many(2), [0, 1])
+        self.assertEqual(q.get(), 2)
+        self.assertEqual(q.get_many(max_items=1), [3])
+        self.assertEqual(q.get_many(), [4, 5, 6])
+        self.assertTrue(q.empty())
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(block=False)
+        with self.assertRaises(self.queue.Empty):
+            q.get_many(timeout=1e-3)
+        with self.assertRaises(ValueError):
+            q.get_many(0)
+        q.put_many([])
+        self.assertTrue(q.empty())
+
+    def test_get_many_blocking(self):
+        q = self.q
+        results = []
+        def consume():
+            results.extend(q.get_many())
+        thread = threading.Thread(target=consume)
+        thread.start()
+        q.put_many(range(3))
+        threading_helper.join_thread(thread)
+        # All the items are put at once
+        self.assertEqual(results, [0, 1, 2])
+
+    def test_maxsize(self):
+        q = self.type2test(maxsize=2)
+        self.assertEqual(q.maxsize, 2)
+        q.put(1)
+        self.assertFalse(q.full())
+        q.put_nowait(2)
+        self.assertTrue(q.full())
+        with self.assertRaises(self.queue.Full):
+            q.put(3, block=False)
+        # The timeout is ignored when block is false.
+        with self.assertRaises(self.queue.Full):
+            q.put(3, False, 1)
+        with self.assertRaises(self.queue.Full):
+            q.put(3, timeout=1e-3)
+        with self.assertRaises(self.queue.Full):
+            q.put_nowait(3)
+        with self.assertRaises(ValueError):
+            q.put(3, timeout=-1)
+        self.assertEqual(q.get(), 1)
+        q.put(3)
+        self.assertEqual(q.get_many(), [2, 3])
+        # The items added before the queue is full stay in the queue.
+        with self.assertRaises(self.queue.Full):
+            q.put_many(range(5), timeout=1e-3)
+        self.assertEqual(q.get_many(), [0, 1])
+        with self.assertRaises(self.queue.Full):
+            q.put_many(range(5), block=False)
+        self.assertEqual(q.get_many(), [0, 1])
+        with self.assertRaises(self.queue.Full):
+            q.put_many(range(5), False, 1)
+        self.assertEqual(q.get_many(), [0, 1])
+        # Unbounded queues
+        for maxsize in (0, -1):
+            q = self.type2test(maxsize)
+            q.put_many(range(10), block=False)
+            self.assertFalse(q.full())
+            self.assertEqual(q.qsize(), 10)
+
+    def test_maxsize_blocking(self):
+        q = self.type2test(maxsize=2)
+        results = []
+        def consume():
+            while len(results) < 10:
+                results.extend(q.get_many())
+        thread = threading.Thread(target=consume)
+        thread.start()
+        q.put_many(range(6))
+        for i in range(6, 10):
+            q.put(i)
+        threading_helper.join_thread(thread)
+        self.assertEqual(results, list(range(10)))
 
     def test_order(self):
         # Test a pair of concurrent put() and get()
@@ -582,6 +669,15 @@ def test_many_threads_timeout(self):
 
         self.assertEqual(sorted(results), inputs)
 
+    def test_many_threads_bounded(self):
+        # Test multiple concurrent put() and get() on a bounded queue
+        N = 50
+        q = self.type2test(maxsize=5)
+        inputs = list(range(10000))
+        results = self.run_threads(N, q, inputs, self.feed, self.consume)
+
+        self.assertEqual(sorted(results), inputs)
+
     def test_references(self):
         # The queue should lose references to each item as soon as
         # it leaves the queue.
@@ -1760,6 +1760,15 @@ class ConditionAsRLockTests(lock_tests.RLockTests):
 class ConditionTests(lock_tests.ConditionTests):
     condtype = staticmethod(threading.Condition)
 
+def _py_condition(lock=None):
+    # A condition using the pure Python queue of waiters.
+    cond = threading.Condition(lock)
+    cond._waiters = threading._PyWaiterQueue()
+    return cond
+
+class PyConditionTests(lock_tests.ConditionTests):
+    condtype = staticmethod(_py_condition)
+
 class SemaphoreTests(lock_tests.SemaphoreTests):
     semtype = staticmethod(threading.Semaphore)
 
@@ -48,6 +48,10 @@
     _CRLock = _thread.RLock
 except AttributeError:
     _CRLock = None
+try:
+    _CWaiterQueue = _thread._WaiterQueue
+except AttributeError:
+    _CWaiterQueue = None
 TIMEOUT_MAX = _thread.TIMEOUT_MAX
 del _thread
 
@@ -241,6 +245,72 @@ def _is_owned(self):
 _PyRLock = _RLock
 
 
+class _PyWaiterQueue:
+    """Queue of the threads waiting on a condition variable.
+
+    This is the pure Python implementation of _thread._WaiterQueue: each
+    waiting thread blocks on a new lock, which is released to notify it.
+
+    """
+
+    def __init__(self):
+        self._waiters = _deque()
+
+    def __len__(self):
+        return len(self._waiters)
+
+    def clear(self):
+        self._waiters.clear()
+
+    def wait(self, release_save, acquire_restore, timeout=None):
+        waiter = _allocate_lock()
+        waiter.acquire()
+        self._waiters.append(waiter)
+        saved_state = release_save()
+        gotit = False
+        try:    # restore state no matter what (e.g., KeyboardInterrupt)
+            if timeout is None:
+                waiter.acquire()
+                gotit = True
+            else:
+                if timeout > 0:
+                    gotit = waiter.acquire(True, timeout)
+                else:
+                    gotit = waiter.acquire(False)
+            return gotit
+        finally:
+            acquire_restore(saved_state)
+            if not gotit:
+                try:
+                    self._waiters.remove(waiter)
+                except ValueError:
+                    pass
+
+    def notify(self, n):
+        waiters = self._waiters
+        while waiters and n > 0:
+            waiter = waiters[0]
+            try:
+                waiter.release()
+            except RuntimeError:
+                # gh-92530: The previous call of notify() released the lock,
+                # but was interrupted before removing it from the queue.
+                # It can happen if a signal handler raises an exception,
+                # like CTRL+C which raises KeyboardInterrupt.
+                pass
+            else:
+                n -= 1
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                pass
+
+if _CWaiterQueue is None:
+    _WaiterQueue = _PyWaiterQueue
+else:
+    _WaiterQueue = _CWaiterQueue
+
+
 class Condition:
     """Class that implements a condition variable.
 
@@ -269,7 +339,7 @@ def __init__(self, lock=None):
             self._acquire_restore = lock._acquire_restore
         if hasattr(lock, '_is_owned'):
             self._is_owned = lock._is_owned
-        self._waiters = _deque()
+        self._waiters = _WaiterQueue()
 
     def _at_fork_reinit(self):
         self._lock._at_fork_reinit()
@@ -324,28 +394,8 @@ def wait(self, timeout=None):
         """
         if not self._is_owned():
             raise RuntimeError("cannot wait on un-acquired lock")
-        waiter = _allocate_lock()
-        waiter.acquire()
-        self._waiters.append(waiter)
-        saved_state = self._release_save()
-        gotit = False
-        try:    # restore state no matter what (e.g., KeyboardInterrupt)
-            if timeout is None:
-                waiter.acquire()
-                gotit = True
-            else:
-                if timeout > 0:
-                    gotit = waiter.acquire(True, timeout)
-                else:
-                    gotit = waiter.acquire(False)
-            return gotit
-        finally:
-            self._acquire_restore(saved_state)
-            if not gotit:
-                try:
-                    self._waiters.remove(waiter)
-                except ValueError:
-                    pass
+        return self._waiters.wait(self._release_save, self._acquire_restore,
+                                  timeout)
 
     def wait_for(self, predicate, timeout=None):
         """Wait until a condition evaluates to True.
@@ -382,23 +432,7 @@ def notify(self, n=1):
         """
         if not self._is_owned():
             raise RuntimeError("cannot notify on un-acquired lock")
-        waiters = self._waiters
-        while waiters and n > 0:
-            waiter = waiters[0]
-            try:
-                waiter.release()
-            except RuntimeError:
-                # gh-92530: The previous call of notify() released the lock,
-                # but was interrupted before removing it from the queue.
-                # It can happen if a signal handler raises an exception,
-                # like CTRL+C which raises KeyboardInterrupt.
-                pass
-            else:
-                n -= 1
-            try:
-                waiters.remove(waiter)
-            except ValueError:
-                pass
+        self._waiters.notify(n)
 
     def notify_all(self):
         """Wake up all threads waiting on this condition.
@@ -34,6 +34,9 @@ typedef struct {
     /* WeakSet containing all alive tasks. */
     PyObject *all_tasks;
 
+    /* Set containing all eagerly executing tasks. */
+    PyObject *eager_tasks;
+
     /* An isinstance type cache for the 'is_coroutine()' function. */
     PyObject *iscoroutine_typecache;
 
@@ -1838,6 +1841,7 @@ class _asyncio.Task "TaskObj *" "&Task_Type"
 static int task_call_step_soon(asyncio_state *state, TaskObj *, PyObject *);
 static PyObject * task_wakeup(TaskObj *, PyObject *);
 static PyObject * task_step(asyncio_state *, TaskObj *, PyObject *);
+static int task_eager_start(asyncio_state *state, TaskObj *task);
 
 /* ----- Task._step wrapper */
 
@@ -1958,6 +1962,13 @@ register_task(asyncio_state *state, PyObject *task)
 }
 
 
+static int
+register_eager_task(asyncio_state *state, PyObject *task)
+{
+    return PySet_Add(state->eager_tasks, task);
+}
+
+
 static int
 unregister_task(asyncio_state *state, PyObject *task)
 {
@@ -1971,6 +1982,16 @@ unregister_task(asyncio_state *state, PyObject *task)
 }
 
 
+static int
+unregister_eager_task(asyncio_state *state, PyObject *task)
+{
+    if (PySet_Discard(state->eager_tasks, task) < 0) {
+        return -1;
+    }
+    return 0;
+}
+
+
 static int
 enter_task(asyncio_state *state, PyObject *loop, PyObject *task)
 {
@@ -2023,6 +2044,45 @@ leave_task(asyncio_state *state, PyObject *loop, PyObject *task)
     return _PyDict_DelItem_KnownHash(state->current_tasks, loop, hash);
 }
 
+
+static PyObject *
+swap_current_task(asyncio_state *state, PyObject *loop, PyObject *task)
+{
+    PyObject *prev_task;
+    Py_hash_t hash;
+    hash = PyObject_Hash(loop);
+    if (hash == -1) {
+        return NULL;
+    }
+
+    prev_task = _PyDict_GetItem_KnownHash(state->current_tasks, loop, hash);
+    if (prev_task == NULL) {
+        if (PyErr_Occurred()) {
+            return NULL;
+        }
+        prev_task = Py_None;
+    }
+    Py_INCREF(prev_task);
+
+    if (task == Py_None) {
+        if (prev_task != Py_None &&
+            _PyDict_DelItem_KnownHash(state->current_tasks, loop, hash) == -1)
+        {
+            goto error;
+        }
+    } else {
+        if (_PyDict_SetItem_KnownHash(state->current_tasks, loop, task, hash) == -1) {
+            goto error;
+        }
+    }
+
+    return prev_task;
+
+error:
+    Py_DECREF(prev_task);
+    return NULL;
+}
+
 /* ----- Task */
 
 /*[clinic input]
@@ -2033,14 +2093,16 @@ _asyncio.Task.__init__
     loop: object = None
     name: object = None
     context: object = None
+    eager_start: bool = False
 
 A coroutine wrapped in a Future.
 [clinic start generated code]*/
 
 static int
 _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
-                            PyObject *name, PyObject *context)
-/*[clinic end generated code: output=49ac96fe33d0e5c7 input=924522490c8ce825]*/
+                            PyObject *name, PyObject *context,
+                            int eager_start)
+/*[clinic end generated code: output=7aced2d27836f1a1 input=18e3f113a51b829d]*/
 
 {
     if (future_init((FutureObj*)self, loop)) {
@@ -2089,6 +2151,19 @@ _asyncio_Task___init___impl(TaskObj *self, PyObject *coro, PyObject *loop,
         return -1;
     }
 
+    if (eager_start) {
+        PyObject *res = PyObject_CallMethodNoArgs(self->task_loop,
+                                                  &_Py_ID(is_running));
+        if (res == NULL) {
+            return -1;
+        }
+        int is_loop_running = Py_IsTrue(res);
+        Py_DECREF(res);
+        if (is_loop_running) {
+            return task_eager_start(state, self);
+        }
+    }
+
     if (task_call_step_soon(state, self, NULL)) {
         return -1;
     }
@@ -3076,6 +3151,89 @@ task_step(asyncio_state *state, TaskObj *task, PyObject *exc)
     }
 }
 
+/* Fetch the current exception into (*et, *ev, *tb), with the exception
+   previously saved there as its context. */
+static void
+task_eager_save_error(PyObject **et, PyObject **ev, PyObject **tb)
+{
+    if (*et != NULL) {
+        _PyErr_ChainExceptions(*et, *ev, *tb);
+    }
+    PyErr_Fetch(et, ev, tb);
+}
+
+static int
+task_eager_start(asyncio_state *state, TaskObj *task)
+{
+    assert(task != NULL);
+    PyObject *prevtask = swap_current_task(state, task->task_loop,
+                                           (PyObject *)task);
+    if (prevtask == NULL) {
+        return -1;
+    }
+
+    if (register_eager_task(state, (PyObject *)task) == -1) {
+        Py_DECREF(prevtask);
+        return -1;
+    }
+
+    if (PyContext_Enter(task->task_context) == -1) {
+        Py_DECREF(prevtask);
+        return -1;
+    }
+
+    int retval = 0;
+    PyObject *et = NULL, *ev = NULL, *tb = NULL;
+
+    PyObject *stepres = task_step_impl(state, task, NULL);
+    if (stepres == NULL) {
+        PyErr_Fetch(&et, &ev, &tb);
+        retval = -1;
+    }
+    else {
+        Py_DECREF(stepres);
+    }
+
+    PyObject *curtask = swap_current_task(state, task->task_loop, prevtask);
+    Py_DECREF(prevtask);
+    if (curtask == NULL) {
+        task_eager_save_error(&et, &ev, &tb);
+        retval = -1;
+    }
+    else {
+        assert(curtask == (PyObject *)task);
+        Py_DECREF(curtask);
+    }
+
+    /* The cleanup must run even if a previous step failed: the errors are
+       kept in (et, ev, tb) and raised at the end. */
+    if (unregister_eager_task(state, (PyObject *)task) == -1) {
+        task_eager_save_error(&et, &ev, &tb);
+        retval = -1;
+    }
+
+    if (PyContext_Exit(task->task_context) == -1) {
+        task_eager_save_error(&et, &ev, &tb);
+        retval = -1;
+    }
+
+    if (task->task_state == STATE_PENDING) {
+        if (register_task(state, (PyObject *)task) == -1) {
+            task_eager_save_error(&et, &ev, &tb);
+            retval = -1;
+        }
+    }
+    else {
+        /* The coroutine is exhausted, release it early. */
+        Py_CLEAR(task->task_coro);
+    }
+
+    if (et != NULL) {
+        _PyErr_ChainExceptions(et, ev, tb); /* Normalizes (et, ev, tb) */
+    }
+    return retval;
+}
+
 static PyObject *
 task_wakeup(TaskObj *task, PyObject *o)
 {
@@ -3269,6 +3427,50 @@ _asyncio__unregister_task_impl(PyObject *module, PyObject *task)
 }
 
 
+/*[clinic input]
+_asyncio._register_eager_task
+
+    task: object
+
+Register a new task in asyncio as executed by loop.
+
+Returns None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__register_eager_task_impl(PyObject *module, PyObject *task)
+/*[clinic end generated code: output=dfe1d45367c73f1a input=237f684683398c51]*/
+{
+    asyncio_state *state = get_asyncio_state(module);
+    if (register_eager_task(state, task) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
+/*[clinic input]
+_asyncio._unregister_eager_task
+
+    task: object
+
+Unregister a task.
+
+Returns None.
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__unregister_eager_task_impl(PyObject *module, PyObject *task)
+/*[clinic end generated code: output=a426922bd07f23d1 input=9d07401ef14ee048]*/
+{
+    asyncio_state *state = get_asyncio_state(module);
+    if (unregister_eager_task(state, task) < 0) {
+        return NULL;
+    }
+    Py_RETURN_NONE;
+}
+
+
 /*[clinic input]
 _asyncio._enter_task
 
@@ -3319,6 +3521,27 @@ _asyncio__leave_task_impl(PyObject *module, PyObject *loop, PyObject *task)
 }
 
 
+/*[clinic input]
+_asyncio._swap_current_task
+
+    loop: object
+    task: object
+
+Temporarily swap in the supplied task and return the original one (or None).
+
+This is intended for use during eager coroutine execution.
+
+[clinic start generated code]*/
+
+static PyObject *
+_asyncio__swap_current_task_impl(PyObject *module, PyObject *loop,
+                                 PyObject *task)
+/*[clinic end generated code: output=9f88de958df74c7e input=c9c72208d3d38b6c]*/
+{
+    return swap_current_task(get_asyncio_state(module), loop, task);
+}
+
+
 /*[clinic input]
 _asyncio.current_task
 
@@ -3401,6 +3624,7 @@ module_traverse(PyObject *mod, visitproc visit, void *arg)
     Py_VISIT(state->asyncio_CancelledError);
 
     Py_VISIT(state->all_tasks);
+    Py_VISIT(state->eager_tasks);
     Py_VISIT(state->current_tasks);
     Py_VISIT(state->iscoroutine_typecache);
 
@@ -3438,6 +3662,7 @@ module_clear(PyObject *mod)
     Py_CLEAR(state->asyncio_CancelledError);
 
     Py_CLEAR(state->all_tasks);
+    Py_CLEAR(state->eager_tasks);
     Py_CLEAR(state->current_tasks);
     Py_CLEAR(state->iscoroutine_typecache);
 
@@ -3523,6 +3748,11 @@ module_init(asyncio_state *state)
         goto fail;
     }
 
+    state->eager_tasks = PySet_New(NULL);
+    if (state->eager_tasks == NULL) {
+        goto fail;
+    }
+
     Py_DECREF(module);
     return 0;
 
@@ -3544,8 +3774,11 @@ static PyMethodDef asyncio_methods[] = {
     _ASYNCIO__SET_RUNNING_LOOP_METHODDEF
     _ASYNCIO__REGISTER_TASK_METHODDEF
     _ASYNCIO__UNREGISTER_TASK_METHODDEF
+    _ASYNCIO__REGISTER_EAGER_TASK_METHODDEF
+    _ASYNCIO__UNREGISTER_EAGER_TASK_METHODDEF
     _ASYNCIO__ENTER_TASK_METHODDEF
     _ASYNCIO__LEAVE_TASK_METHODDEF
+    _ASYNCIO__SWAP_CURRENT_TASK_METHODDEF
     {NULL, NULL}
 };
 
@@ -3590,6 +3823,10 @@ module_exec(PyObject *mod)
         return -1;
     }
 
+    if (PyModule_AddObjectRef(mod, "_eager_tasks", state->eager_tasks) < 0) {
+        return -1;
+    }
+
 
     return 0;
 }
@@ -10,6 +10,7 @@
 typedef struct {
     PyTypeObject *SimpleQueueType;
     PyObject *EmptyError;
+    PyObject *FullError;
 } simplequeue_state;
 
 static simplequeue_state *
@@ -27,6 +28,11 @@ typedef struct {
     PyObject_HEAD
     PyThread_type_lock lock;
     int locked;
+    /* Like lock and locked, used by put() to wait for a free slot, only
+       allocated if maxsize > 0 */
+    PyThread_type_lock put_lock;
+    int put_locked;
+    Py_ssize_t maxsize;
     PyObject *lst;
     Py_ssize_t lst_pos;
     PyObject *weakreflist;
@@ -57,6 +63,11 @@ simplequeue_dealloc(simplequeueobject *self)
             PyThread_release_lock(self->lock);
         PyThread_free_lock(self->lock);
     }
+    if (self->put_lock != NULL) {
+        if (self->put_locked > 0)
+            PyThread_release_lock(self->put_lock);
+        PyThread_free_lock(self->put_lock);
+    }
     (void)simplequeue_clear(self);
     if (self->weakreflist != NULL)
         PyObject_ClearWeakRefs((PyObject *) self);
@@ -76,12 +87,18 @@ simplequeue_traverse(simplequeueobject *self, visitproc visit, void *arg)
 @classmethod
 _queue.SimpleQueue.__new__ as simplequeue_new
 
-Simple, unbounded, reentrant FIFO queue.
+    maxsize: Py_ssize_t = 0
+
+Simple, reentrant FIFO queue.
+
+If maxsize is less than or equal to zero, the queue size is infinite.
+Otherwise, put() blocks while the queue holds maxsize items, and is no
+longer reentrant.
 [clinic start generated code]*/
 
 static PyObject *
-simplequeue_new_impl(PyTypeObject *type)
-/*[clinic end generated code: output=ba97740608ba31cd input=a0674a1643e3e2fb]*/
+simplequeue_new_impl(PyTypeObject *type, Py_ssize_t maxsize)
+/*[clinic end generated code: output=6553a2713d31917b input=3186c8070191f5bc]*/
 {
     simplequeueobject *self;
 
@@ -91,11 +108,20 @@ simplequeue_new_impl(PyTypeObject *type)
         self->lst = PyList_New(0);
         self->lock = PyThread_allocate_lock();
         self->lst_pos = 0;
+        self->maxsize = maxsize;
         if (self->lock == NULL) {
             Py_DECREF(self);
             PyErr_SetString(PyExc_MemoryError, "can't allocate lock");
             return NULL;
         }
+        if (maxsize > 0) {
+            self->put_lock = PyThread_allocate_lock();
+            if (self->put_lock == NULL) {
+                Py_DECREF(self);
+                PyErr_SetString(PyExc_MemoryError, "can't allocate lock");
+                return NULL;
+            }
+        }
         if (self->lst == NULL) {
             Py_DECREF(self);
             return NULL;
@@ -105,52 +131,276 @@ simplequeue_new_impl(PyTypeObject *type)
     return (PyObject *) self;
 }
 
+static int
+simplequeue_is_empty(simplequeueobject *self)
+{
+    return self->lst_pos == PyList_GET_SIZE(self->lst);
+}
+
+static int
+simplequeue_is_full(simplequeueobject *self)
+{
+    return (self->maxsize > 0 &&
+            PyList_GET_SIZE(self->lst) - self->lst_pos >= self->maxsize);
+}
+
+/* Convert the 'block' and 'timeout' arguments of the methods which can
+   block to a timeout in microseconds (-1 for no timeout) and a deadline. */
+static int
+simplequeue_get_timeout(int block, PyObject *timeout_obj,
+                        PY_TIMEOUT_T *microseconds, _PyTime_t *endtime)
+{
+    _PyTime_t timeout;
+
+    if (block == 0) {
+        /* Non-blocking */
+        *microseconds = 0;
+    }
+    else if (timeout_obj != Py_None) {
+        /* With timeout */
+        if (_PyTime_FromSecondsObject(&timeout,
+                                      timeout_obj, _PyTime_ROUND_CEILING) < 0) {
+            return -1;
+        }
+        if (timeout < 0) {
+            PyErr_SetString(PyExc_ValueError,
+                            "'timeout' must be a non-negative number");
+            return -1;
+        }
+        *microseconds = _PyTime_AsMicroseconds(timeout,
+                                               _PyTime_ROUND_CEILING);
+        if (*microseconds > PY_TIMEOUT_MAX) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "timeout value is too large");
+            return -1;
+        }
+        *endtime = _PyDeadline_Init(timeout);
+    }
+    else {
+        /* Infinitely blocking */
+        *microseconds = -1;
+    }
+    return 0;
+}
+
+/* Wait until the queue is not empty, or not full if 'put' is true.
+   Return 1 on success, 0 if the timeout expired and -1 on error.
+   *microseconds is updated, so that several waits share the deadline. */
+static int
+simplequeue_wait(simplequeueobject *self, int put,
+                 PY_TIMEOUT_T *microseconds, _PyTime_t endtime)
+{
+    PyThread_type_lock lock = put ? self->put_lock : self->lock;
+    int *locked = put ? &self->put_locked : &self->locked;
+    _PyTime_t timeout;
+    PyLockStatus r;
+
+    /* put() signals the queue to be non-empty by releasing the lock, and
+     * get() signals it to be non-full by releasing put_lock.
+     * So we simply try to acquire the lock in a loop, until the condition
+     * (queue non-empty or non-full) becomes true.
+     */
+    while (put ? simplequeue_is_full(self) : simplequeue_is_empty(self)) {
+        /* First a simple non-blocking try without releasing the GIL */
+        r = PyThread_acquire_lock_timed(lock, 0, 0);
+        if (r == PY_LOCK_FAILURE && *microseconds != 0) {
+            Py_BEGIN_ALLOW_THREADS
+            r = PyThread_acquire_lock_timed(lock, *microseconds, 1);
+            Py_END_ALLOW_THREADS
+        }
+
+        if (r == PY_LOCK_INTR && Py_MakePendingCalls() < 0) {
+            return -1;
+        }
+        if (r == PY_LOCK_FAILURE) {
+            /* Timed out */
+            return 0;
+        }
+        if (r == PY_LOCK_ACQUIRED) {
+            *locked = 1;
+        }
+
+        /* Adjust timeout for next iteration (if any) */
+        if (*microseconds > 0) {
+            timeout = _PyDeadline_Get(endtime);
+            *microseconds = _PyTime_AsMicroseconds(timeout,
+                                                   _PyTime_ROUND_CEILING);
+            if (*microseconds < 0) {
+                *microseconds = 0;
+            }
+        }
+    }
+    return 1;
+}
+
+/* Wake up a thread waiting for an item and one waiting for a free slot,
+   if any.  Must be called after each change of the queue. */
+static void
+simplequeue_wake(simplequeueobject *self)
+{
+    if (self->locked) {
+        self->locked = 0;
+        PyThread_release_lock(self->lock);
+    }
+    if (self->put_locked) {
+        self->put_locked = 0;
+        PyThread_release_lock(self->put_lock);
+    }
+}
+
 /*[clinic input]
 _queue.SimpleQueue.put
+
+    cls: defining_class
+    /
     item: object
     block: bool = True
     timeout: object = None
 
 Put the item on the queue.
 
-The optional 'block' and 'timeout' arguments are ignored, as this method
-never blocks.  They are provided for compatibility with the Queue class.
+If the queue is unbounded (the default), this method never blocks, and
+the optional 'block' and 'timeout' arguments are ignored.  Otherwise, if
+optional args 'block' is true and 'timeout' is None (the default), block
+if necessary until a free slot is available. If 'timeout' is
+a non-negative number, it blocks at most 'timeout' seconds and raises
+the Full exception if no free slot was available within that time.
+Otherwise ('block' is false), put the item if a free slot is immediately
+available, else raise the Full exception ('timeout' is ignored
+in that case).
 
 [clinic start generated code]*/
 
 static PyObject *
-_queue_SimpleQueue_put_impl(simplequeueobject *self, PyObject *item,
-                            int block, PyObject *timeout)
-/*[clinic end generated code: output=4333136e88f90d8b input=6e601fa707a782d5]*/
+_queue_SimpleQueue_put_impl(simplequeueobject *self, PyTypeObject *cls,
+                            PyObject *item, int block, PyObject *timeout)
+/*[clinic end generated code: output=edede49b95ac62f4 input=6fd68c64e2c51833]*/
 {
+    if (self->maxsize > 0) {
+        PY_TIMEOUT_T microseconds;
+        _PyTime_t endtime = 0;
+        int r;
+
+        if (simplequeue_get_timeout(block, timeout,
+                                    &microseconds, &endtime) < 0) {
+            return NULL;
+        }
+        r = simplequeue_wait(self, 1, &microseconds, endtime);
+        if (r < 0) {
+            return NULL;
+        }
+        if (r == 0) {
+            PyObject *module = PyType_GetModule(cls);
+            simplequeue_state *state = simplequeue_get_state(module);
+            PyErr_SetNone(state->FullError);
+            return NULL;
+        }
+    }
+
     /* BEGIN GIL-protected critical section */
     if (PyList_Append(self->lst, item) < 0)
         return NULL;
-    if (self->locked) {
-        /* A get() may be waiting, wake it up */
-        self->locked = 0;
-        PyThread_release_lock(self->lock);
-    }
+    /* A get() may be waiting, wake it up */
+    simplequeue_wake(self);
     /* END GIL-protected critical section */
     Py_RETURN_NONE;
 }
 
+/*[clinic input]
+_queue.SimpleQueue.put_many
+
+    cls: defining_class
+    /
+    items: object
+    block: bool = True
+    timeout: object = None
+
+Put all the items of an iterable on the queue, in order.
+
+If the queue is unbounded (the default), this method never blocks, and
+the optional 'block' and 'timeout' arguments are ignored.  Otherwise,
+the items are added in batches, as many as there are free slots, and
+'block' and 'timeout' apply to the whole call as in put().  If the Full
+exception is raised, the items added so far stay in the queue.
+
+[clinic start generated code]*/
+
+static PyObject *
+_queue_SimpleQueue_put_many_impl(simplequeueobject *self, PyTypeObject *cls,
+                                 PyObject *items, int block,
+                                 PyObject *timeout)
+/*[clinic end generated code: output=aa4516a5bf018429 input=a03d054e56576f06]*/
+{
+    PY_TIMEOUT_T microseconds;
+    _PyTime_t endtime = 0;
+    PyObject *seq;
+    Py_ssize_t i, n, end;
+    int r;
+
+    if (self->maxsize > 0 &&
+        simplequeue_get_timeout(block, timeout,
+                                &microseconds, &endtime) < 0) {
+        return NULL;
+    }
+    seq = PySequence_List(items);
+    if (seq == NULL) {
+        return NULL;
+    }
+    n = PyList_GET_SIZE(seq);
+    i = 0;
+    while (i < n) {
+        end = n;
+        if (self->maxsize > 0) {
+            r = simplequeue_wait(self, 1, &microseconds, endtime);
+            if (r <= 0) {
+                if (r == 0) {
+                    PyObject *module = PyType_GetModule(cls);
+                    simplequeue_state *state = simplequeue_get_state(module);
+                    PyErr_SetNone(state->FullError);
+                }
+                Py_DECREF(seq);
+                return NULL;
+            }
+            end = Py_MIN(n, i + self->maxsize
+                            - (PyList_GET_SIZE(self->lst) - self->lst_pos));
+        }
+
+        /* BEGIN GIL-protected critical section */
+        for (; i < end; i++) {
+            if (PyList_Append(self->lst, PyList_GET_ITEM(seq, i)) < 0) {
+                simplequeue_wake(self);
+                Py_DECREF(seq);
+                return NULL;
+            }
+        }
+        simplequeue_wake(self);
+        /* END GIL-protected critical section */
+    }
+    Py_DECREF(seq);
+    Py_RETURN_NONE;
+}
+
 /*[clinic input]
 _queue.SimpleQueue.put_nowait
+
+    cls: defining_class
+    /
     item: object
 
 Put an item into the queue without blocking.
 
-This is exactly equivalent to `put(item)` and is only provided
+This is exactly equivalent to `put(item, block=False)`.  If the queue
+is unbounded, it is also equivalent to `put(item)` and is only provided
 for compatibility with the Queue class.
 
 [clinic start generated code]*/
 
 static PyObject *
-_queue_SimpleQueue_put_nowait_impl(simplequeueobject *self, PyObject *item)
-/*[clinic end generated code: output=0990536715efb1f1 input=36b1ea96756b2ece]*/
+_queue_SimpleQueue_put_nowait_impl(simplequeueobject *self,
+                                   PyTypeObject *cls, PyObject *item)
+/*[clinic end generated code: output=443a515331f78056 input=c840e607e34013a8]*/
 {
-    return _queue_SimpleQueue_put_impl(self, item, 0, Py_None);
+    return _queue_SimpleQueue_put_impl(self, cls, item, 0, Py_None);
 }
 
 static PyObject *
@@ -206,83 +456,101 @@ _queue_SimpleQueue_get_impl(simplequeueobject *self, PyTypeObject *cls,
 /*[clinic end generated code: output=5c2cca914cd1e55b input=5b4047bfbc645ec1]*/
 {
     _PyTime_t endtime = 0;
-    _PyTime_t timeout;
     PyObject *item;
-    PyLockStatus r;
     PY_TIMEOUT_T microseconds;
+    int r;
 
-    if (block == 0) {
-        /* Non-blocking */
-        microseconds = 0;
+    if (simplequeue_get_timeout(block, timeout_obj,
+                                &microseconds, &endtime) < 0) {
+        return NULL;
     }
-    else if (timeout_obj != Py_None) {
-        /* With timeout */
-        if (_PyTime_FromSecondsObject(&timeout,
-                                      timeout_obj, _PyTime_ROUND_CEILING) < 0) {
-            return NULL;
-        }
-        if (timeout < 0) {
-            PyErr_SetString(PyExc_ValueError,
-                            "'timeout' must be a non-negative number");
-            return NULL;
-        }
-        microseconds = _PyTime_AsMicroseconds(timeout,
-                                              _PyTime_ROUND_CEILING);
-        if (microseconds > PY_TIMEOUT_MAX) {
-            PyErr_SetString(PyExc_OverflowError,
-                            "timeout value is too large");
-            return NULL;
-        }
-        endtime = _PyDeadline_Init(timeout);
+    r = simplequeue_wait(self, 0, &microseconds, endtime);
+    if (r < 0) {
+        return NULL;
     }
-    else {
-        /* Infinitely blocking */
-        microseconds = -1;
+    if (r == 0) {
+        PyObject *module = PyType_GetModule(cls);
+        simplequeue_state *state = simplequeue_get_state(module);
+        PyErr_SetNone(state->EmptyError);
+        return NULL;
     }
 
-    /* put() signals the queue to be non-empty by releasing the lock.
-     * So we simply try to acquire the lock in a loop, until the condition
-     * (queue non-empty) becomes true.
-     */
-    while (self->lst_pos == PyList_GET_SIZE(self->lst)) {
-        /* First a simple non-blocking try without releasing the GIL */
-        r = PyThread_acquire_lock_timed(self->lock, 0, 0);
-        if (r == PY_LOCK_FAILURE && microseconds != 0) {
-            Py_BEGIN_ALLOW_THREADS
-            r = PyThread_acquire_lock_timed(self->lock, microseconds, 1);
-            Py_END_ALLOW_THREADS
-        }
+    /* BEGIN GIL-protected critical section */
+    assert(self->lst_pos < PyList_GET_SIZE(self->lst));
+    item = simplequeue_pop_item(self);
+    simplequeue_wake(self);
+    /* END GIL-protected critical section */
 
-        if (r == PY_LOCK_INTR && Py_MakePendingCalls() < 0) {
-            return NULL;
-        }
-        if (r == PY_LOCK_FAILURE) {
-            PyObject *module = PyType_GetModule(cls);
-            simplequeue_state *state = simplequeue_get_state(module);
-            /* Timed out */
-            PyErr_SetNone(state->EmptyError);
-            return NULL;
-        }
-        self->locked = 1;
+    return item;
+}
 
-        /* Adjust timeout for next iteration (if any) */
-        if (microseconds > 0) {
-            timeout = _PyDeadline_Get(endtime);
-            microseconds = _PyTime_AsMicroseconds(timeout,
-                                                  _PyTime_ROUND_CEILING);
-        }
+/*[clinic input]
+_queue.SimpleQueue.get_many
+
+    cls: defining_class
+    /
+    max_items: Py_ssize_t(c_default="PY_SSIZE_T_MAX", accept={int, NoneType}) = None
+    block: bool = True
+    timeout as timeout_obj: object = None
+
+Remove and return a list of items from the queue.
+
+Wait for an item to be available as get() does, then remove and return
+all the items available in the queue, or at most 'max_items' of them
+if 'max_items' is not None.
+
+[clinic start generated code]*/
+
+static PyObject *
+_queue_SimpleQueue_get_many_impl(simplequeueobject *self, PyTypeObject *cls,
+                                 Py_ssize_t max_items, int block,
+                                 PyObject *timeout_obj)
+/*[clinic end generated code: output=5db4d0fe54081e21 input=a7c985607a54a402]*/
+{
+    _PyTime_t endtime = 0;
+    PyObject *items;
+    PY_TIMEOUT_T microseconds;
+    Py_ssize_t end;
+    int r;
+
+    if (max_items < 1) {
+        PyErr_SetString(PyExc_ValueError, "max_items must be at least 1");
+        return NULL;
+    }
+    if (simplequeue_get_timeout(block, timeout_obj,
+                                &microseconds, &endtime) < 0) {
+        return NULL;
+    }
+    r = simplequeue_wait(self, 0, &microseconds, endtime);
+    if (r < 0) {
+        return NULL;
+    }
+    if (r == 0) {
+        PyObject *module = PyType_GetModule(cls);
+        simplequeue_state *state = simplequeue_get_state(module);
+        PyErr_SetNone(state->EmptyError);
+        return NULL;
     }
 
     /* BEGIN GIL-protected critical section */
-    assert(self->lst_pos < PyList_GET_SIZE(self->lst));
-    item = simplequeue_pop_item(self);
-    if (self->locked) {
-        PyThread_release_lock(self->lock);
-        self->locked = 0;
+    end = PyList_GET_SIZE(self->lst);
+    assert(self->lst_pos < end);
+    if (end - self->lst_pos > max_items) {
+        end = self->lst_pos + max_items;
     }
+    items = PyList_GetSlice(self->lst, self->lst_pos, end);
+    if (items != NULL) {
+        if (PyList_SetSlice(self->lst, 0, end, NULL) < 0) {
+            Py_CLEAR(items);
+        }
+        else {
+            self->lst_pos = 0;
+        }
+    }
+    simplequeue_wake(self);
     /* END GIL-protected critical section */
 
-    return item;
+    return items;
 }
 
 /*[clinic input]
@@ -315,7 +583,22 @@ static int
 _queue_SimpleQueue_empty_impl(simplequeueobject *self)
 /*[clinic end generated code: output=1a02a1b87c0ef838 input=1a98431c45fd66f9]*/
 {
-    return self->lst_pos == PyList_GET_SIZE(self->lst);
+    return simplequeue_is_empty(self);
+}
+
+/*[clinic input]
+_queue.SimpleQueue.full -> bool
+
+Return True if the queue is full, False otherwise (not reliable!).
+
+An unbounded queue is never full.
+[clinic start generated code]*/
+
+static int
+_queue_SimpleQueue_full_impl(simplequeueobject *self)
+/*[clinic end generated code: output=c8f29167c0bf1a39 input=2262c8d5a91a9893]*/
+{
+    return simplequeue_is_full(self);
 }
 
 /*[clinic input]
@@ -337,6 +620,7 @@ queue_traverse(PyObject *m, visitproc visit, void *arg)
     simplequeue_state *state = simplequeue_get_state(m);
     Py_VISIT(state->SimpleQueueType);
     Py_VISIT(state->EmptyError);
+    Py_VISIT(state->FullError);
     return 0;
 }
 
@@ -346,6 +630,7 @@ queue_clear(PyObject *m)
     simplequeue_state *state = simplequeue_get_state(m);
     Py_CLEAR(state->SimpleQueueType);
     Py_CLEAR(state->EmptyError);
+    Py_CLEAR(state->FullError);
     return 0;
 }
 
@@ -360,9 +645,12 @@ queue_free(void *m)
 
 static PyMethodDef simplequeue_methods[] = {
     _QUEUE_SIMPLEQUEUE_EMPTY_METHODDEF
+    _QUEUE_SIMPLEQUEUE_FULL_METHODDEF
     _QUEUE_SIMPLEQUEUE_GET_METHODDEF
+    _QUEUE_SIMPLEQUEUE_GET_MANY_METHODDEF
     _QUEUE_SIMPLEQUEUE_GET_NOWAIT_METHODDEF
     _QUEUE_SIMPLEQUEUE_PUT_METHODDEF
+    _QUEUE_SIMPLEQUEUE_PUT_MANY_METHODDEF
     _QUEUE_SIMPLEQUEUE_PUT_NOWAIT_METHODDEF
     _QUEUE_SIMPLEQUEUE_QSIZE_METHODDEF
     {"__class_getitem__",    Py_GenericAlias,
@@ -372,6 +660,7 @@ static PyMethodDef simplequeue_methods[] = {
 
 static struct PyMemberDef simplequeue_members[] = {
     {"__weaklistoffset__", T_PYSSIZET, offsetof(simplequeueobject, weakreflist), READONLY},
+    {"maxsize", T_PYSSIZET, offsetof(simplequeueobject, maxsize), READONLY},
     {NULL},
 };
 
@@ -417,6 +706,17 @@ queuemodule_exec(PyObject *module)
         return -1;
     }
 
+    state->FullError = PyErr_NewExceptionWithDoc(
+        "_queue.Full",
+        "Exception raised by Queue.put(block=0)/put_nowait().",
+        NULL, NULL);
+    if (state->FullError == NULL) {
+        return -1;
+    }
+    if (PyModule_AddObjectRef(module, "Full", state->FullError) < 0) {
+        return -1;
+    }
+
     state->SimpleQueueType = (PyTypeObject *)PyType_FromModuleAndSpec(
         module, &simplequeue_spec, NULL);
     if (state->SimpleQueueType == NULL) {
@@ -596,6 +596,274 @@ static PyType_Spec rlock_type_spec = {
     .slots = rlock_type_slots,
 };
 
+/* Waiter queue objects */
+
+/* A thread blocked in _WaiterQueue.wait().  The structure lives on the
+   stack of the waiting thread and is linked in the queue until the thread
+   is notified, or stops waiting. */
+typedef struct waiter {
+    struct waiter *prev;
+    struct waiter *next;
+    PyThread_type_lock lock;
+    unsigned long generation;
+    int notified;
+} waiter;
+
+/* Maximum number of locks of the previous waiters kept for reuse */
+#define WAITERQUEUE_MAX_SPARE_LOCKS 16
+
+typedef struct {
+    PyObject_HEAD
+    waiter *head;
+    waiter *tail;
+    Py_ssize_t count;
+    /* Incremented by clear(): the waiters of a previous generation are
+       no longer linked in the queue. */
+    unsigned long generation;
+    /* Locks ready to be reused, they are all in the locked state */
+    int nspare;
+    PyThread_type_lock spare[WAITERQUEUE_MAX_SPARE_LOCKS];
+} waiterqueueobject;
+
+static void
+waiterqueue_dealloc(waiterqueueobject *self)
+{
+    assert(self->head == NULL);
+    for (int i = 0; i < self->nspare; i++) {
+        /* Unlock the lock so it's safe to free it */
+        PyThread_release_lock(self->spare[i]);
+        PyThread_free_lock(self->spare[i]);
+    }
+    PyTypeObject *tp = Py_TYPE(self);
+    tp->tp_free((PyObject*)self);
+    Py_DECREF(tp);
+}
+
+static void
+waiterqueue_unlink(waiterqueueobject *self, waiter *w)
+{
+    if (w->prev != NULL) {
+        w->prev->next = w->next;
+    }
+    else {
+        self->head = w->next;
+    }
+    if (w->next != NULL) {
+        w->next->prev = w->prev;
+    }
+    else {
+        self->tail = w->prev;
+    }
+    w->prev = w->next = NULL;
+    self->count--;
+}
+
+static PyObject *
+waiterqueue_wait(waiterqueueobject *self, PyObject *args)
+{
+    PyObject *release_save, *acquire_restore, *timeout_obj = Py_None;
+    _PyTime_t timeout = _PyTime_FromSeconds(-1);
+
+    if (!PyArg_ParseTuple(args, "OO|O:wait",
+                          &release_save, &acquire_restore, &timeout_obj)) {
+        return NULL;
+    }
+    if (timeout_obj != Py_None) {
+        if (_PyTime_FromSecondsObject(&timeout, timeout_obj,
+                                      _PyTime_ROUND_TIMEOUT) < 0) {
+            return NULL;
+        }
+        if (timeout <= 0) {
+            /* Don't block */
+            timeout = 0;
+        }
+        else if (_PyTime_AsMicroseconds(timeout, _PyTime_ROUND_TIMEOUT)
+                 > PY_TIMEOUT_MAX) {
+            PyErr_SetString(PyExc_OverflowError,
+                            "timeout value is too large");
+            return NULL;
+        }
+    }
+
+    waiter w;
+    if (self->nspare > 0) {
+        w.lock = self->spare[--self->nspare];
+    }
+    else {
+        w.lock = PyThread_allocate_lock();
+        if (w.lock == NULL) {
+            PyErr_SetString(ThreadError, "can't allocate lock");
+            return NULL;
+        }
+        PyThread_acquire_lock(w.lock, 0);
+    }
+    w.prev = self->tail;
+    w.next = NULL;
+    w.generation = self->generation;
+    w.notified = 0;
+    if (self->tail != NULL) {
+        self->tail->next = &w;
+    }
+    else {
+        self->head = &w;
+    }
+    self->tail = &w;
+    self->count++;
+    Py_INCREF(self);
+
+    int gotit = 0;
+    PyObject *exc = NULL;
+    PyObject *res = NULL;
+    PyObject *saved_state = PyObject_CallNoArgs(release_save);
+    if (saved_state != NULL) {
+        /* notify() releases the lock of the waiter */
+        PyLockStatus r = acquire_timed(w.lock, timeout);
+        gotit = (r == PY_LOCK_ACQUIRED);
+        /* Run the pending signal handlers now, as the eval loop would do
+           when returning to Python code, so that they don't raise in
+           acquire_restore() before it restores the lock. */
+        if (!PyErr_Occurred()) {
+            (void)PyErr_CheckSignals();
+        }
+        /* Restore the state no matter what (e.g., KeyboardInterrupt) */
+        exc = PyErr_GetRaisedException();
+        res = PyObject_CallOneArg(acquire_restore, saved_state);
+        Py_DECREF(saved_state);
+    }
+
+    if (!w.notified) {
+        if (w.generation == self->generation) {
+            waiterqueue_unlink(self, &w);
+        }
+    }
+    else if (!gotit) {
+        /* Notified after the timeout: the lock was released */
+        PyThread_acquire_lock(w.lock, 0);
+    }
+    if (self->nspare < WAITERQUEUE_MAX_SPARE_LOCKS) {
+        self->spare[self->nspare++] = w.lock;
+    }
+    else {
+        PyThread_release_lock(w.lock);
+        PyThread_free_lock(w.lock);
+    }
+    Py_DECREF(self);
+
+    if (res == NULL) {
+        _PyErr_ChainExceptions1(exc);
+        return NULL;
+    }
+    Py_DECREF(res);
+    if (exc != NULL) {
+        PyErr_SetRaisedException(exc);
+        return NULL;
+    }
+    return PyBool_FromLong(gotit);
+}
+
+PyDoc_STRVAR(waiterqueue_wait_doc,
+"wait(release_save, acquire_restore, timeout=None) -> bool\n\
+\n\
+Add the current thread to the queue, call release_save(), and wait until\n\
+notified or until the optional timeout occurs.  Then call\n\
+acquire_restore() with the result of release_save(), and return whether\n\
+the thread was notified before the timeout.");
+
+static PyObject *
+waiterqueue_notify(waiterqueueobject *self, PyObject *arg)
+{
+    Py_ssize_t n = PyNumber_AsSsize_t(arg, NULL);
+    if (n == -1 && PyErr_Occurred()) {
+        return NULL;
+    }
+    while (self->head != NULL && n > 0) {
+        waiter *w = self->head;
+        waiterqueue_unlink(self, w);
+        w->notified = 1;
+        PyThread_release_lock(w->lock);
+        n--;
+    }
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(waiterqueue_notify_doc,
+"notify(n)\n\
+\n\
+Wake up at most n of the threads waiting in the queue, in the order in\n\
+which they started waiting.");
+
+static PyObject *
+waiterqueue_clear(waiterqueueobject *self, PyObject *Py_UNUSED(ignored))
+{
+    /* The waiting threads no longer unlink themselves */
+    self->head = self->tail = NULL;
+    self->count = 0;
+    self->generation++;
+    Py_RETURN_NONE;
+}
+
+PyDoc_STRVAR(waiterqueue_clear_doc,
+"clear()\n\
+\n\
+Remove all the threads from the queue, without waking them up.");
+
+static Py_ssize_t
+waiterqueue_len(waiterqueueobject *self)
+{
+    return self->count;
+}
+
+static PyObject *
+waiterqueue_new(PyTypeObject *type, PyObject *args, PyObject *kwds)
+{
+    if (!_PyArg_NoPositional("_WaiterQueue", args) ||
+        !_PyArg_NoKeywords("_WaiterQueue", kwds)) {
+        return NULL;
+    }
+    waiterqueueobject *self = (waiterqueueobject *) type->tp_alloc(type, 0);
+    if (self == NULL) {
+        return NULL;
+    }
+    self->head = self->tail = NULL;
+    self->count = 0;
+    self->generation = 0;
+    self->nspare = 0;
+    return (PyObject *) self;
+}
+
+static PyMethodDef waiterqueue_methods[] = {
+    {"wait",    (PyCFunction)waiterqueue_wait,
+     METH_VARARGS, waiterqueue_wait_doc},
+    {"notify",  (PyCFunction)waiterqueue_notify,
+     METH_O, waiterqueue_notify_doc},
+    {"clear",   (PyCFunction)waiterqueue_clear,
+     METH_NOARGS, waiterqueue_clear_doc},
+    {NULL,      NULL}              /* sentinel */
+};
+
+PyDoc_STRVAR(waiterqueue_doc,
+"_WaiterQueue()\n\
+\n\
+Queue of the threads waiting on a threading.Condition.  The locks used to\n\
+block the waiting threads are reused.");
+
+static PyType_Slot waiterqueue_type_slots[] = {
+    {Py_tp_dealloc, (destructor)waiterqueue_dealloc},
+    {Py_tp_doc, (void *)waiterqueue_doc},
+    {Py_tp_methods, waiterqueue_methods},
+    {Py_tp_new, waiterqueue_new},
+    {Py_sq_length, (lenfunc)waiterqueue_len},
+    {0, 0},
+};
+
+static PyType_Spec waiterqueue_type_spec = {
+    .name = "_thread._WaiterQueue",
+    .basicsize = sizeof(waiterqueueobject),
+    .flags = Py_TPFLAGS_DEFAULT | Py_TPFLAGS_IMMUTABLETYPE,
+    .slots = waiterqueue_type_slots,
+};
+
+
 static lockobject *
 newlockobject(PyObject *module)
 {
@@ -1629,6 +1897,18 @@ thread_module_exec(PyObject *module)
     }
     Py_DECREF(rlock_type);
 
+    // _WaiterQueue
+    PyTypeObject *waiterqueue_type = (PyTypeObject *)PyType_FromSpec(
+        &waiterqueue_type_spec);
+    if (waiterqueue_type == NULL) {
+        return -1;
+    }
+    if (PyModule_AddType(module, waiterqueue_type) < 0) {
+        Py_DECREF(waiterqueue_type);
+        return -1;
+    }
+    Py_DECREF(waiterqueue_type);
+
     // Local dummy
     state->local_dummy_type = (PyTypeObject *)PyType_FromSpec(&local_dummy_type_spec);
     if (state->local_dummy_type == NULL) {
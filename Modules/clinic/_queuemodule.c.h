@@ -9,29 +9,74 @@ preserve
 
 
 PyDoc_STRVAR(simplequeue_new__doc__,
-"SimpleQueue()\n"
+"SimpleQueue(maxsize=0)\n"
 "--\n"
 "\n"
-"Simple, unbounded, reentrant FIFO queue.");
+"Simple, reentrant FIFO queue.\n"
+"\n"
+"If maxsize is less than or equal to zero, the queue size is infinite.\n"
+"Otherwise, put() blocks while the queue holds maxsize items, and is no\n"
+"longer reentrant.");
 
 static PyObject *
-simplequeue_new_impl(PyTypeObject *type);
+simplequeue_new_impl(PyTypeObject *type, Py_ssize_t maxsize);
 
 static PyObject *
 simplequeue_new(PyTypeObject *type, PyObject *args, PyObject *kwargs)
 {
     PyObject *return_value = NULL;
-    PyTypeObject *base_tp = simplequeue_get_state_by_type(type)->SimpleQueueType;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
 
-    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
-        !_PyArg_NoPositional("SimpleQueue", args)) {
+    #define NUM_KEYWORDS 1
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(maxsize), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"maxsize", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "SimpleQueue",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[1];
+    PyObject * const *fastargs;
+    Py_ssize_t nargs = PyTuple_GET_SIZE(args);
+    Py_ssize_t noptargs = nargs + (kwargs ? PyDict_GET_SIZE(kwargs) : 0) - 0;
+    Py_ssize_t maxsize = 0;
+
+    fastargs = _PyArg_UnpackKeywords(_PyTuple_CAST(args)->ob_item, nargs, kwargs, NULL, &_parser, 0, 1, 0, argsbuf);
+    if (!fastargs) {
         goto exit;
     }
-    if ((type == base_tp || type->tp_init == base_tp->tp_init) &&
-        !_PyArg_NoKeywords("SimpleQueue", kwargs)) {
-        goto exit;
+    if (!noptargs) {
+        goto skip_optional_pos;
     }
-    return_value = simplequeue_new_impl(type);
+    {
+        Py_ssize_t ival = -1;
+        PyObject *iobj = _PyNumber_Index(fastargs[0]);
+        if (iobj != NULL) {
+            ival = PyLong_AsSsize_t(iobj);
+            Py_DECREF(iobj);
+        }
+        if (ival == -1 && PyErr_Occurred()) {
+            goto exit;
+        }
+        maxsize = ival;
+    }
+skip_optional_pos:
+    return_value = simplequeue_new_impl(type, maxsize);
 
 exit:
     return return_value;
@@ -43,18 +88,25 @@ PyDoc_STRVAR(_queue_SimpleQueue_put__doc__,
 "\n"
 "Put the item on the queue.\n"
 "\n"
-"The optional \'block\' and \'timeout\' arguments are ignored, as this method\n"
-"never blocks.  They are provided for compatibility with the Queue class.");
+"If the queue is unbounded (the default), this method never blocks, and\n"
+"the optional \'block\' and \'timeout\' arguments are ignored.  Otherwise, if\n"
+"optional args \'block\' is true and \'timeout\' is None (the default), block\n"
+"if necessary until a free slot is available. If \'timeout\' is\n"
+"a non-negative number, it blocks at most \'timeout\' seconds and raises\n"
+"the Full exception if no free slot was available within that time.\n"
+"Otherwise (\'block\' is false), put the item if a free slot is immediately\n"
+"available, else raise the Full exception (\'timeout\' is ignored\n"
+"in that case).");
 
 #define _QUEUE_SIMPLEQUEUE_PUT_METHODDEF    \
-    {"put", _PyCFunction_CAST(_queue_SimpleQueue_put), METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_put__doc__},
+    {"put", _PyCFunction_CAST(_queue_SimpleQueue_put), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_put__doc__},
 
 static PyObject *
-_queue_SimpleQueue_put_impl(simplequeueobject *self, PyObject *item,
-                            int block, PyObject *timeout);
+_queue_SimpleQueue_put_impl(simplequeueobject *self, PyTypeObject *cls,
+                            PyObject *item, int block, PyObject *timeout);
 
 static PyObject *
-_queue_SimpleQueue_put(simplequeueobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+_queue_SimpleQueue_put(simplequeueobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
@@ -107,7 +159,87 @@ _queue_SimpleQueue_put(simplequeueobject *self, PyObject *const *args, Py_ssize_
     }
     timeout = args[2];
 skip_optional_pos:
-    return_value = _queue_SimpleQueue_put_impl(self, item, block, timeout);
+    return_value = _queue_SimpleQueue_put_impl(self, cls, item, block, timeout);
+
+exit:
+    return return_value;
+}
+
+PyDoc_STRVAR(_queue_SimpleQueue_put_many__doc__,
+"put_many($self, /, items, block=True, timeout=None)\n"
+"--\n"
+"\n"
+"Put all the items of an iterable on the queue, in order.\n"
+"\n"
+"If the queue is unbounded (the default), this method never blocks, and\n"
+"the optional \'block\' and \'timeout\' arguments are ignored.  Otherwise,\n"
+"the items are added in batches, as many as there are free slots, and\n"
+"\'block\' and \'timeout\' apply to the whole call as in put().  If the Full\n"
+"exception is raised, the items added so far stay in the queue.");
+
+#define _QUEUE_SIMPLEQUEUE_PUT_MANY_METHODDEF    \
+    {"put_many", _PyCFunction_CAST(_queue_SimpleQueue_put_many), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_put_many__doc__},
+
+static PyObject *
+_queue_SimpleQueue_put_many_impl(simplequeueobject *self, PyTypeObject *cls,
+                                 PyObject *items, int block,
+                                 PyObject *timeout);
+
+static PyObject *
+_queue_SimpleQueue_put_many(simplequeueobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(items), &_Py_ID(block), &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"items", "block", "timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "put_many",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 1;
+    PyObject *items;
+    int block = 1;
+    PyObject *timeout = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 1, 3, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    items = args[0];
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[1]) {
+        block = PyObject_IsTrue(args[1]);
+        if (block < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    timeout = args[2];
+skip_optional_pos:
+    return_value = _queue_SimpleQueue_put_many_impl(self, cls, items, block, timeout);
 
 exit:
     return return_value;
@@ -119,17 +251,19 @@ PyDoc_STRVAR(_queue_SimpleQueue_put_nowait__doc__,
 "\n"
 "Put an item into the queue without blocking.\n"
 "\n"
-"This is exactly equivalent to `put(item)` and is only provided\n"
+"This is exactly equivalent to `put(item, block=False)`.  If the queue\n"
+"is unbounded, it is also equivalent to `put(item)` and is only provided\n"
 "for compatibility with the Queue class.");
 
 #define _QUEUE_SIMPLEQUEUE_PUT_NOWAIT_METHODDEF    \
-    {"put_nowait", _PyCFunction_CAST(_queue_SimpleQueue_put_nowait), METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_put_nowait__doc__},
+    {"put_nowait", _PyCFunction_CAST(_queue_SimpleQueue_put_nowait), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_put_nowait__doc__},
 
 static PyObject *
-_queue_SimpleQueue_put_nowait_impl(simplequeueobject *self, PyObject *item);
+_queue_SimpleQueue_put_nowait_impl(simplequeueobject *self,
+                                   PyTypeObject *cls, PyObject *item);
 
 static PyObject *
-_queue_SimpleQueue_put_nowait(simplequeueobject *self, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+_queue_SimpleQueue_put_nowait(simplequeueobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
 {
     PyObject *return_value = NULL;
     #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
@@ -165,7 +299,7 @@ _queue_SimpleQueue_put_nowait(simplequeueobject *self, PyObject *const *args, Py
         goto exit;
     }
     item = args[0];
-    return_value = _queue_SimpleQueue_put_nowait_impl(self, item);
+    return_value = _queue_SimpleQueue_put_nowait_impl(self, cls, item);
 
 exit:
     return return_value;
@@ -250,6 +384,91 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_queue_SimpleQueue_get_many__doc__,
+"get_many($self, /, max_items=None, block=True, timeout=None)\n"
+"--\n"
+"\n"
+"Remove and return a list of items from the queue.\n"
+"\n"
+"Wait for an item to be available as get() does, then remove and return\n"
+"all the items available in the queue, or at most \'max_items\' of them\n"
+"if \'max_items\' is not None.");
+
+#define _QUEUE_SIMPLEQUEUE_GET_MANY_METHODDEF    \
+    {"get_many", _PyCFunction_CAST(_queue_SimpleQueue_get_many), METH_METHOD|METH_FASTCALL|METH_KEYWORDS, _queue_SimpleQueue_get_many__doc__},
+
+static PyObject *
+_queue_SimpleQueue_get_many_impl(simplequeueobject *self, PyTypeObject *cls,
+                                 Py_ssize_t max_items, int block,
+                                 PyObject *timeout_obj);
+
+static PyObject *
+_queue_SimpleQueue_get_many(simplequeueobject *self, PyTypeObject *cls, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames)
+{
+    PyObject *return_value = NULL;
+    #if defined(Py_BUILD_CORE) && !defined(Py_BUILD_CORE_MODULE)
+
+    #define NUM_KEYWORDS 3
+    static struct {
+        PyGC_Head _this_is_not_used;
+        PyObject_VAR_HEAD
+        PyObject *ob_item[NUM_KEYWORDS];
+    } _kwtuple = {
+        .ob_base = PyVarObject_HEAD_INIT(&PyTuple_Type, NUM_KEYWORDS)
+        .ob_item = { &_Py_ID(max_items), &_Py_ID(block), &_Py_ID(timeout), },
+    };
+    #undef NUM_KEYWORDS
+    #define KWTUPLE (&_kwtuple.ob_base.ob_base)
+
+    #else  // !Py_BUILD_CORE
+    #  define KWTUPLE NULL
+    #endif  // !Py_BUILD_CORE
+
+    static const char * const _keywords[] = {"max_items", "block", "timeout", NULL};
+    static _PyArg_Parser _parser = {
+        .keywords = _keywords,
+        .fname = "get_many",
+        .kwtuple = KWTUPLE,
+    };
+    #undef KWTUPLE
+    PyObject *argsbuf[3];
+    Py_ssize_t noptargs = nargs + (kwnames ? PyTuple_GET_SIZE(kwnames) : 0) - 0;
+    Py_ssize_t max_items = PY_SSIZE_T_MAX;
+    int block = 1;
+    PyObject *timeout_obj = Py_None;
+
+    args = _PyArg_UnpackKeywords(args, nargs, NULL, kwnames, &_parser, 0, 3, 0, argsbuf);
+    if (!args) {
+        goto exit;
+    }
+    if (!noptargs) {
+        goto skip_optional_pos;
+    }
+    if (args[0]) {
+        if (!_Py_convert_optional_to_ssize_t(args[0], &max_items)) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    if (args[1]) {
+        block = PyObject_IsTrue(args[1]);
+        if (block < 0) {
+            goto exit;
+        }
+        if (!--noptargs) {
+            goto skip_optional_pos;
+        }
+    }
+    timeout_obj = args[2];
+skip_optional_pos:
+    return_value = _queue_SimpleQueue_get_many_impl(self, cls, max_items, block, timeout_obj);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_queue_SimpleQueue_get_nowait__doc__,
 "get_nowait($self, /)\n"
 "--\n"
@@ -304,6 +523,36 @@ exit:
     return return_value;
 }
 
+PyDoc_STRVAR(_queue_SimpleQueue_full__doc__,
+"full($self, /)\n"
+"--\n"
+"\n"
+"Return True if the queue is full, False otherwise (not reliable!).\n"
+"\n"
+"An unbounded queue is never full.");
+
+#define _QUEUE_SIMPLEQUEUE_FULL_METHODDEF    \
+    {"full", (PyCFunction)_queue_SimpleQueue_full, METH_NOARGS, _queue_SimpleQueue_full__doc__},
+
+static int
+_queue_SimpleQueue_full_impl(simplequeueobject *self);
+
+static PyObject *
+_queue_SimpleQueue_full(simplequeueobject *self, PyObject *Py_UNUSED(ignored))
+{
+    PyObject *return_value = NULL;
+    int _return_value;
+
+    _return_value = _queue_SimpleQueue_full_impl(self);
+    if ((_return_value == -1) && PyErr_Occurred()) {
+        goto exit;
+    }
+    return_value = PyBool_FromLong((long)_return_value);
+
+exit:
+    return return_value;
+}
+
 PyDoc_STRVAR(_queue_SimpleQueue_qsize__doc__,
 "qsize($self, /)\n"
 "--\n"
@@ -331,4 +580,4 @@ _queue_SimpleQueue_qsize(simplequeueobject *self, PyObject *Py_UNUSED(ignored))
 exit:
     return return_value;
 }
-/*[clinic end generated code: output=9a72a8d1b5767f6a input=a9049054013a1b77]*/
+/*[clinic end generated code: output=8f714d1717ba7a6a input=a9049054013a1b77]*/
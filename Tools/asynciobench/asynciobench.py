@@ -0,0 +1,276 @@
+"""Micro-benchmarks for the asyncio event loop.
+
+Run all benchmarks:
+
+    ./python Tools/asynciobench/asynciobench.py
+
+Run a subset of them:
+
+    ./python Tools/asynciobench/asynciobench.py timers
+"""
+
+import argparse
+import asyncio
+import os
+import tempfile
+import time
+
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__.removeprefix('bench_')] = func
+    return func
+
+
+def run(coro_func, *args, setup=None):
+    """Run coro_func(*args) in a fresh event loop, return elapsed time."""
+    loop = asyncio.new_event_loop()
+    try:
+        if setup is not None:
+            setup(loop)
+        t0 = time.perf_counter()
+        loop.run_until_complete(coro_func(*args))
+        return time.perf_counter() - t0
+    finally:
+        loop.close()
+
+
+def report(name, variants, repeat):
+    print(f'{name}:')
+    baseline = None
+    for label, func in variants:
+        best = min(func() for _ in range(repeat))
+        if baseline is None:
+            baseline = best
+            print(f'  {label:<24} {best * 1e3:9.1f} ms')
+        else:
+            print(f'  {label:<24} {best * 1e3:9.1f} ms'
+                  f'  ({baseline / best:.2f}x)')
+
+
+async def _timeout_churn(nconns, nrequests):
+    # Each simulated request arms a timeout which is cancelled because the
+    # request completes long before it, like asyncio.timeout() and
+    # asyncio.wait_for() do on a busy server.
+    loop = asyncio.get_running_loop()
+
+    async def connection():
+        for _ in range(nrequests):
+            handle = loop.call_later(30.0, None)
+            await asyncio.sleep(0)
+            handle.cancel()
+
+    await asyncio.gather(*[connection() for _ in range(nconns)])
+
+
+async def _timeout_context_churn(nconns, nrequests):
+    async def connection():
+        for _ in range(nrequests):
+            async with asyncio.timeout(30.0):
+                await asyncio.sleep(0)
+
+    await asyncio.gather(*[connection() for _ in range(nconns)])
+
+
+@benchmark
+def bench_timers(args):
+    """Schedule and cancel many timers (heap vs. timing wheel)."""
+    def wheel(loop):
+        loop.set_timer_wheel(0.001)
+
+    for name, coro_func in [('call_later/cancel', _timeout_churn),
+                            ('asyncio.timeout()', _timeout_context_churn)]:
+        report(f'timers: {name} ({args.connections} connections, '
+               f'{args.requests} requests each)',
+               [('heap', lambda: run(coro_func, args.connections,
+                                     args.requests)),
+                ('timing wheel', lambda: run(coro_func, args.connections,
+                                             args.requests, setup=wheel))],
+               args.repeat)
+
+
+async def _cache_hit_handlers(nconns, nrequests, hit_ratio=0.9):
+    # Handlers which usually find the answer in a cache and only sometimes
+    # have to wait for "I/O".  Each request runs in its own task.
+    cache = {}
+    period = round(1 / (1 - hit_ratio))
+
+    async def handler(key):
+        try:
+            return cache[key]
+        except KeyError:
+            await asyncio.sleep(0)
+            cache[key] = value = key * 2
+            return value
+
+    async def connection(conn):
+        for i in range(nrequests):
+            key = (conn, i) if i % period == 0 else conn
+            await asyncio.create_task(handler(key))
+
+    async with asyncio.TaskGroup() as tg:
+        for conn in range(nconns):
+            tg.create_task(connection(conn))
+    await asyncio.gather(*[handler(conn) for conn in range(nconns)])
+
+
+@benchmark
+def bench_eager(args):
+    """Run mostly synchronous handlers in tasks (default vs. eager)."""
+    def eager(loop):
+        loop.set_task_factory(asyncio.eager_task_factory)
+
+    report(f'eager tasks: cache-hit handlers ({args.connections} '
+           f'connections, {args.requests} requests each)',
+           [('call_soon() first step',
+             lambda: run(_cache_hit_handlers, args.connections,
+                         args.requests)),
+            ('eager_task_factory',
+             lambda: run(_cache_hit_handlers, args.connections,
+                         args.requests, setup=eager))],
+           args.repeat)
+
+
+async def _queue_fan_in(nproducers, nitems, batch):
+    # Producers push small messages to a single bounded queue drained by
+    # one consumer, either one item or one batch per await.
+    queue = asyncio.Queue(maxsize=1000)
+
+    async def producer():
+        if batch:
+            for start in range(0, nitems, 100):
+                await queue.put_many(range(start, min(start + 100, nitems)))
+        else:
+            for i in range(nitems):
+                await queue.put(i)
+
+    async def consumer():
+        remaining = nproducers * nitems
+        while remaining:
+            if batch:
+                remaining -= len(await queue.get_many())
+            else:
+                await queue.get()
+                remaining -= 1
+
+    async with asyncio.TaskGroup() as tg:
+        tg.create_task(consumer())
+        for _ in range(nproducers):
+            tg.create_task(producer())
+
+
+@benchmark
+def bench_queue(args):
+    """Fan small messages into one queue (get/put vs. get_many/put_many)."""
+    report(f'queue: fan-in ({args.connections} producers, '
+           f'{args.requests} items each)',
+           [('put()/get()',
+             lambda: run(_queue_fan_in, args.connections, args.requests,
+                         False)),
+            ('put_many()/get_many()',
+             lambda: run(_queue_fan_in, args.connections, args.requests,
+                         True))],
+           args.repeat)
+
+
+async def _small_file_writes(nfiles, nwrites, use_aopen):
+    # Many coroutines each appending small records to their own file.
+    async def writer(path):
+        if use_aopen:
+            async with await asyncio.aopen(path, 'wb') as f:
+                for i in range(nwrites):
+                    await f.write(b'record %d\n' % i)
+        else:
+            f = await asyncio.to_thread(open, path, 'wb')
+            try:
+                for i in range(nwrites):
+                    await asyncio.to_thread(f.write, b'record %d\n' % i)
+            finally:
+                await asyncio.to_thread(f.close)
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        await asyncio.gather(*[writer(os.path.join(tmpdir, str(i)))
+                               for i in range(nfiles)])
+
+
+@benchmark
+def bench_files(args):
+    """Write small records to files (to_thread() vs. aopen())."""
+    nfiles = min(args.connections, 100)
+    report(f'files: small writes ({nfiles} files, '
+           f'{args.requests} writes each)',
+           [('asyncio.to_thread()',
+             lambda: run(_small_file_writes, nfiles, args.requests, False)),
+            ('asyncio.aopen()',
+             lambda: run(_small_file_writes, nfiles, args.requests, True))],
+           args.repeat)
+
+
+async def _stream_throughput(nbytes, write_size, use_tls):
+    # Send nbytes over a loopback connection in writes of write_size bytes,
+    # optionally over TLS.
+    server_ssl = client_ssl = None
+    if use_tls:
+        from test.test_asyncio import utils as test_utils
+        server_ssl = test_utils.simple_server_sslcontext()
+        client_ssl = test_utils.simple_client_sslcontext()
+    received = asyncio.get_running_loop().create_future()
+
+    async def handle(reader, writer):
+        total = 0
+        while data := await reader.read(256 * 1024):
+            total += len(data)
+        received.set_result(total)
+        writer.close()
+
+    server = await asyncio.start_server(handle, '127.0.0.1', 0,
+                                        ssl=server_ssl)
+    async with server:
+        reader, writer = await asyncio.open_connection(
+            *server.sockets[0].getsockname(), ssl=client_ssl)
+        chunk = b'x' * write_size
+        for _ in range(nbytes // write_size):
+            writer.write(chunk)
+            await writer.drain()
+        writer.close()
+        await writer.wait_closed()
+        assert await received == nbytes // write_size * write_size
+
+
+@benchmark
+def bench_tls(args):
+    """Stream data over loopback (plain TCP vs. TLS)."""
+    nbytes = 16 * 1024 * 1024
+    for write_size in (256, 64 * 1024):
+        report(f'tls: throughput ({nbytes // 2**20} MiB, '
+               f'{write_size} bytes per write)',
+               [('plain TCP',
+                 lambda: run(_stream_throughput, nbytes, write_size, False)),
+                ('TLS',
+                 lambda: run(_stream_throughput, nbytes, write_size, True))],
+               args.repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('benchmarks', nargs='*', metavar='BENCHMARK',
+                        help='benchmarks to run (default: all): '
+                             + ', '.join(BENCHMARKS))
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs; the best one is reported')
+    parser.add_argument('-c', '--connections', type=int, default=1000,
+                        help='number of simulated connections')
+    parser.add_argument('-n', '--requests', type=int, default=100,
+                        help='number of requests per connection')
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark: {name!r}')
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](args)
+
+
+if __name__ == '__main__':
+    main()
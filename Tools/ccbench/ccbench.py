@@ -37,6 +37,8 @@
 BANDWIDTH_PACKET_SIZE = 1024
 BANDWIDTH_DURATION = 2.0
 
+CONTENTION_HANDOFFS = 20000
+
 
 def task_pidigits():
     """Pi calculation (Python)"""
@@ -520,6 +522,84 @@ def run_bandwidth_tests(max_threads):
         print()
 
 
+# Contention tests: the threads pass a token around a ring, and each handoff
+# wakes up the next thread using a threading synchronization primitive.
+
+def contention_condition(nthreads):
+    "Condition: threads taking turns, notify_all() wakes all waiters"
+    cond = threading.Condition()
+    turn = [0]
+    def handoff(i, niters):
+        for _ in xrange(niters):
+            with cond:
+                while turn[0] != i:
+                    cond.wait()
+                turn[0] = (i + 1) % nthreads
+                cond.notify_all()
+    return handoff
+
+def contention_event(nthreads):
+    "Event: one event per thread, set() by the previous thread"
+    events = [threading.Event() for i in range(nthreads)]
+    events[0].set()
+    def handoff(i, niters):
+        event = events[i]
+        next_event = events[(i + 1) % nthreads]
+        for _ in xrange(niters):
+            event.wait()
+            event.clear()
+            next_event.set()
+    return handoff
+
+def contention_semaphore(nthreads):
+    "Semaphore: one semaphore per thread, released by the previous thread"
+    sems = [threading.Semaphore(0) for i in range(nthreads)]
+    sems[0].release()
+    def handoff(i, niters):
+        sem = sems[i]
+        next_sem = sems[(i + 1) % nthreads]
+        for _ in xrange(niters):
+            sem.acquire()
+            next_sem.release()
+    return handoff
+
+contention_tasks = [
+    contention_condition,
+    contention_event,
+    contention_semaphore,
+]
+
+def run_contention_test(task, nthreads):
+    niters = CONTENTION_HANDOFFS // nthreads
+    handoff = task(nthreads)
+    threads = []
+    for i in range(nthreads):
+        threads.append(threading.Thread(target=handoff, args=(i, niters)))
+    start_time = time.time()
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return niters * nthreads / (time.time() - start_time)
+
+def run_contention_tests(max_threads):
+    for task in contention_tasks:
+        print(task.__doc__)
+        print()
+        nthreads = 2
+        baseline_speed = None
+        while nthreads <= max(max_threads, 2):
+            speed = run_contention_test(task, nthreads)
+            print("threads=%d: %d" % (nthreads, speed), end="")
+            if baseline_speed is None:
+                print(" handoffs/s.")
+                baseline_speed = speed
+            else:
+                print(" ( %d %%)" % (speed / baseline_speed * 100))
+            nthreads += 1
+        print()
+
+
 def main():
     usage = "usage: %prog [-h|--help] [options]"
     parser = OptionParser(usage=usage)
@@ -532,6 +612,10 @@ def main():
     parser.add_option("-b", "--bandwidth",
                       action="store_true", dest="bandwidth", default=False,
                       help="run I/O bandwidth tests")
+    parser.add_option("-c", "--contention",
+                      action="store_true", dest="contention", default=False,
+                      help="run contention tests of the threading "
+                           "synchronization primitives")
     parser.add_option("-i", "--interval",
                       action="store", type="int", dest="check_interval", default=None,
                       help="sys.setcheckinterval() value "
@@ -566,8 +650,10 @@ def main():
         bandwidth_client(**kwargs)
         return
 
-    if not options.throughput and not options.latency and not options.bandwidth:
+    if (not options.throughput and not options.latency
+        and not options.bandwidth and not options.contention):
         options.throughput = options.latency = options.bandwidth = True
+        options.contention = True
     if options.check_interval:
         sys.setcheckinterval(options.check_interval)
     if options.switch_interval:
@@ -602,5 +688,10 @@ def main():
         print()
         run_bandwidth_tests(options.nthreads)
 
+    if options.contention:
+        print("--- Contention ---")
+        print()
+        run_contention_tests(options.nthreads)
+
 if __name__ == "__main__":
     main()
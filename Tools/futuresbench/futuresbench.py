@@ -0,0 +1,137 @@
+"""Micro-benchmarks for the concurrent.futures executors.
+
+Run all benchmarks:
+
+    ./python Tools/futuresbench/futuresbench.py
+
+Run a subset of them:
+
+    ./python Tools/futuresbench/futuresbench.py fanout
+"""
+
+import argparse
+import threading
+import time
+from concurrent import futures
+
+
+BENCHMARKS = {}
+
+
+def benchmark(func):
+    BENCHMARKS[func.__name__.removeprefix('bench_')] = func
+    return func
+
+
+def report(name, variants, repeat):
+    print(f'{name}:')
+    baseline = None
+    for label, func in variants:
+        best = min(func() for _ in range(repeat))
+        if baseline is None:
+            baseline = best
+            print(f'  {label:<44} {best * 1e3:9.1f} ms')
+        else:
+            print(f'  {label:<44} {best * 1e3:9.1f} ms'
+                  f'  ({baseline / best:.2f}x)')
+
+
+def _fanout(executor_type, nworkers, ntasks):
+    # Each task submits 4 subtasks until ntasks tasks were submitted, like a
+    # recursive divide and conquer algorithm or a crawler do.
+    with executor_type(nworkers) as executor:
+        lock = threading.Lock()
+        done = threading.Event()
+        remaining = ntasks
+        submitted = 1
+
+        def task():
+            nonlocal remaining, submitted
+            with lock:
+                nchildren = min(4, ntasks - submitted)
+                submitted += nchildren
+            for _ in range(nchildren):
+                executor.submit(task)
+            with lock:
+                remaining -= 1
+                if not remaining:
+                    done.set()
+
+        t0 = time.perf_counter()
+        executor.submit(task)
+        done.wait()
+        return time.perf_counter() - t0
+
+
+@benchmark
+def bench_fanout(args):
+    """Tasks submitting tasks (ThreadPoolExecutor vs. work stealing)."""
+    report(f'fanout: {args.tasks} tasks, {args.workers} workers',
+           [(executor_type.__name__,
+             lambda: _fanout(executor_type, args.workers, args.tasks))
+            for executor_type in (futures.ThreadPoolExecutor,
+                                  futures.WorkStealingThreadPoolExecutor)],
+           args.repeat)
+
+
+def _fan_in(executor_type, nworkers, nproducers, ntasks, batch):
+    # Several threads each submit many tiny calls and wait for them.
+    with executor_type(nworkers) as executor:
+        def producer():
+            if batch:
+                fs = executor.submit_many(abs, range(ntasks))
+            else:
+                fs = [executor.submit(abs, i) for i in range(ntasks)]
+            futures.wait(fs)
+
+        threads = [threading.Thread(target=producer)
+                   for _ in range(nproducers)]
+        t0 = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return time.perf_counter() - t0
+
+
+@benchmark
+def bench_submit(args):
+    """Submit tiny calls from several threads (submit vs. submit_many)."""
+    nproducers = 4
+    ntasks = args.tasks // nproducers
+    variants = []
+    for executor_type in (futures.ThreadPoolExecutor,
+                          futures.WorkStealingThreadPoolExecutor):
+        for batch in (False, True):
+            label = (f'{executor_type.__name__}.'
+                     f'{"submit_many" if batch else "submit"}')
+            variants.append((label, lambda executor_type=executor_type,
+                                           batch=batch:
+                             _fan_in(executor_type, args.workers, nproducers,
+                                     ntasks, batch)))
+    report(f'submit: {nproducers} threads submitting {ntasks} calls each, '
+           f'{args.workers} workers',
+           variants, args.repeat)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('benchmarks', nargs='*', metavar='BENCHMARK',
+                        help='benchmarks to run (default: all): '
+                             + ', '.join(BENCHMARKS))
+    parser.add_argument('-r', '--repeat', type=int, default=3,
+                        help='number of runs; the best one is reported')
+    parser.add_argument('-w', '--workers', type=int, default=8,
+                        help='number of worker threads')
+    parser.add_argument('-n', '--tasks', type=int, default=20000,
+                        help='number of tasks')
+    args = parser.parse_args()
+    for name in args.benchmarks:
+        if name not in BENCHMARKS:
+            parser.error(f'unknown benchmark: {name!r}')
+    for name in args.benchmarks or BENCHMARKS:
+        BENCHMARKS[name](args)
+
+
+if __name__ == '__main__':
+    main()